@@ -0,0 +1,22 @@
+import os
+
+# Share of a set's volume credited to each secondary muscle (primary muscles get all of it).
+SECONDARY_MUSCLE_FRACTION = float(os.getenv("SECONDARY_MUSCLE_FRACTION", "0.5"))
+
+# training_load needs numpy, which is slow to import; load it on first attribute access
+# so importing the API does not pay for it until an analytics request arrives.
+_TRAINING_LOAD_NAMES = {
+    "SetColumns",
+    "acute_chronic_load",
+    "category_trends",
+    "get_training_analytics",
+    "load_user_sets",
+    "muscle_weights",
+    "weekly_muscle_volume",
+}
+
+def __getattr__(name):
+    if name in _TRAINING_LOAD_NAMES:
+        from . import training_load
+        return getattr(training_load, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,196 @@
+from dataclasses import dataclass
+from datetime import date, timedelta
+from uuid import UUID
+import numpy as np
+from sqlalchemy import String, select, type_coerce
+from sqlalchemy.orm import Session
+from src.backend.analytics import SECONDARY_MUSCLE_FRACTION
+from src.backend.cache.exercise_catalog import exercise_catalog
+from src.backend.crud.user import resolve_user_id
+from src.backend.database.functions import epoch_day
+from src.backend.models.workout import Workout
+from src.backend.models.logged_exercise import LoggedExercise
+from src.backend.models.logged_exercise_set import LoggedExerciseSet
+
+EPOCH = date(1970, 1, 1)
+# 1970-01-01 was a Thursday; shifting by 3 days makes week buckets start on Monday.
+_WEEK_OFFSET = 3
+
+@dataclass(frozen=True)
+class SetColumns:
+    """
+    A user's sets as parallel arrays, one element per set. `exercise` indexes into `exercise_ids`.
+    """
+    day: np.ndarray
+    exercise: np.ndarray
+    reps: np.ndarray
+    weight: np.ndarray
+    exercise_ids: tuple
+
+    def __len__(self):
+        return len(self.day)
+
+    @property
+    def volume(self):
+        return self.reps * self.weight
+
+    @property
+    def week(self):
+        return (self.day + _WEEK_OFFSET) // 7
+
+def _day_to_date(day) -> date:
+    return EPOCH + timedelta(days=int(day))
+
+def _week_to_date(week) -> date:
+    return EPOCH + timedelta(days=int(week) * 7 - _WEEK_OFFSET)
+
+def load_user_sets(db: Session, user_id: UUID) -> SetColumns:
+    """
+    Fetch every set a user has logged with one query. The day is computed in SQL and the exercise
+    id is read as text, so rows carry only plain numbers and strings and convert to arrays cheaply.
+    """
+    query = (
+        select(
+            epoch_day(Workout.created_time),
+            type_coerce(LoggedExercise.exercise_id, String),
+            LoggedExerciseSet.reps,
+            LoggedExerciseSet.weight,
+        )
+        .join(LoggedExercise, LoggedExercise.workout_id == Workout.id)
+        .join(LoggedExerciseSet, LoggedExerciseSet.logged_exercise_id == LoggedExercise.id)
+        .where(Workout.user_id == user_id)
+    )
+    # Core execution on the session's connection skips ORM row processing.
+    rows = db.connection().execute(query).all()
+    if not rows:
+        empty = np.zeros(0, dtype=np.int64)
+        return SetColumns(empty, empty, empty, np.zeros(0), ())
+
+    day, exercise, reps, weight = zip(*rows)
+    raw_ids, exercise_index = np.unique(np.array(exercise), return_inverse=True)
+    return SetColumns(
+        day=np.array(day, dtype=np.int64),
+        exercise=exercise_index.astype(np.intp),
+        reps=np.array(reps, dtype=np.int64),
+        weight=np.array(weight, dtype=np.float64),
+        exercise_ids=tuple(UUID(str(raw)) for raw in raw_ids),
+    )
+
+def muscle_weights(db: Session, exercise_ids, secondary_fraction: float = SECONDARY_MUSCLE_FRACTION):
+    """
+    (muscles, matrix) where matrix[e, m] is the share of exercise e's volume credited to muscle m.
+    """
+    catalog = [exercise_catalog.get_by_id(db, exercise_id) for exercise_id in exercise_ids]
+    muscles = sorted({
+        muscle
+        for exercise in catalog if exercise
+        for muscle in exercise.primary_muscles + (exercise.secondary_muscles or ())
+    })
+    column = {muscle: i for i, muscle in enumerate(muscles)}
+    matrix = np.zeros((len(exercise_ids), len(muscles)))
+    for row, exercise in enumerate(catalog):
+        if exercise is None:
+            continue
+        for muscle in exercise.secondary_muscles or ():
+            matrix[row, column[muscle]] = max(matrix[row, column[muscle]], secondary_fraction)
+        for muscle in exercise.primary_muscles:
+            matrix[row, column[muscle]] = 1.0
+    return tuple(muscles), matrix
+
+def _weekly_by_group(sets: SetColumns, group: np.ndarray, n_groups: int):
+    # Volume summed per (week, group) in one bincount over a flattened index.
+    week = sets.week
+    first = week.min()
+    n_weeks = int(week.max() - first) + 1
+    flat = (week - first) * n_groups + group
+    totals = np.bincount(flat, weights=sets.volume, minlength=n_weeks * n_groups)
+    return first, totals.reshape(n_weeks, n_groups)
+
+def weekly_muscle_volume(sets: SetColumns, weights: np.ndarray):
+    """
+    (week_starts, volume) with volume[w, m] the load on muscle m in week w, oldest week first.
+    """
+    if not len(sets):
+        return [], np.zeros((0, weights.shape[1]))
+    first, per_exercise = _weekly_by_group(sets, sets.exercise, len(sets.exercise_ids))
+    volume = per_exercise @ weights
+    return [_week_to_date(first + i) for i in range(len(volume))], volume
+
+def _rolling_mean(daily: np.ndarray, window: int):
+    cumulative = np.concatenate(([0.0], np.cumsum(daily)))
+    ends = np.arange(1, len(daily) + 1)
+    starts = np.maximum(ends - window, 0)
+    return (cumulative[ends] - cumulative[starts]) / window
+
+def acute_chronic_load(sets: SetColumns, acute_days: int = 7, chronic_days: int = 28):
+    """
+    Daily volume with its rolling acute and chronic means and their ratio (0 where there is no
+    chronic load yet), for every day from the first set to the last.
+    """
+    if not len(sets):
+        empty = np.zeros(0)
+        return [], empty, empty, empty, empty
+    first = sets.day.min()
+    daily = np.bincount(sets.day - first, weights=sets.volume)
+    acute = _rolling_mean(daily, acute_days)
+    chronic = _rolling_mean(daily, chronic_days)
+    ratio = np.divide(acute, chronic, out=np.zeros_like(acute), where=chronic > 0)
+    days = [_day_to_date(first + i) for i in range(len(daily))]
+    return days, daily, acute, chronic, ratio
+
+def category_trends(db: Session, sets: SetColumns, weeks: int = 12):
+    """
+    Per exercise category: mean weekly volume over the last `weeks` weeks and the least-squares
+    slope of weekly volume over the same window (volume gained or lost per week).
+    """
+    if not len(sets):
+        return {}
+    labels = []
+    for exercise_id in sets.exercise_ids:
+        exercise = exercise_catalog.get_by_id(db, exercise_id)
+        labels.append(exercise.category.value if exercise and exercise.category else "Uncategorized")
+    categories, exercise_category = np.unique(np.array(labels), return_inverse=True)
+    _, volume = _weekly_by_group(sets, exercise_category[sets.exercise], len(categories))
+    volume = volume[-weeks:]
+
+    mean = volume.mean(axis=0)
+    if len(volume) > 1:
+        slope = np.polyfit(np.arange(len(volume)), volume, 1)[0]
+    else:
+        slope = np.zeros(len(categories))
+    return {
+        str(category): {"mean_weekly_volume": float(m), "slope": float(s)}
+        for category, m, s in zip(categories, mean, slope)
+    }
+
+def get_training_analytics(username: str, db: Session, weeks: int = 12, secondary_fraction: float = SECONDARY_MUSCLE_FRACTION):
+    """
+    Weekly per-muscle volume, daily acute:chronic load and per-category trends for the last
+    `weeks` weeks of a user's history, computed from a single query.
+    """
+    analytics = {"weekly_muscle_volume": [], "load": [], "category_trends": {}}
+    user_id = resolve_user_id(db, username)
+    if not user_id:
+        return analytics
+    sets = load_user_sets(db, user_id)
+    if not len(sets):
+        return analytics
+
+    muscles, weights = muscle_weights(db, sets.exercise_ids, secondary_fraction)
+    week_starts, volume = weekly_muscle_volume(sets, weights)
+    analytics["weekly_muscle_volume"] = [
+        {"week_start": week_start, "volume": dict(zip(muscles, row.tolist()))}
+        for week_start, row in zip(week_starts[-weeks:], volume[-weeks:])
+    ]
+
+    days, daily, acute, chronic, ratio = acute_chronic_load(sets)
+    window = slice(-weeks * 7, None)
+    analytics["load"] = [
+        {"date": day, "volume": v, "acute": a, "chronic": c, "ratio": r}
+        for day, v, a, c, r in zip(
+            days[window], daily[window].tolist(), acute[window].tolist(),
+            chronic[window].tolist(), ratio[window].tolist()
+        )
+    ]
+    analytics["category_trends"] = category_trends(db, sets, weeks)
+    return analytics
@@ -0,0 +1,89 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, Union
+from uuid import UUID
+
+from src.backend.database.async_session import get_async_db
+from src.backend.api.responses import orm_response
+from src.backend.api.workout import workout_page_response
+from src.backend.crud import aio
+from src.backend.crud.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from src.backend.schemas.workout import WorkoutCreateSimple, WorkoutCreatedOut, WorkoutOut, WorkoutPage, WorkoutUpdate
+
+# Async versions of the per-workout and per-user workout routes, served from the AsyncEngine when
+# DB_ASYNC=1. Mounted ahead of the sync workout router, so these paths take precedence and every
+# other workout route keeps its sync handler.
+router = APIRouter()
+
+@router.get("/{workout_id}", response_model=WorkoutOut)
+async def get_workout_by_id_handler(workout_id: UUID, db: AsyncSession = Depends(get_async_db)):
+    """
+    Get a specific workout by its ID.
+    """
+    workout = await aio.get_workout_by_workout_id(db, workout_id)
+    if not workout:
+        raise HTTPException(status_code=404, detail="Workout not found")
+    return orm_response(workout, WorkoutOut)
+
+@router.get("/user/{username}", response_model=Union[WorkoutPage, list[WorkoutOut]])
+async def get_workouts_by_user_handler(
+    username: str,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get all workouts for a given user, newest first.
+    Passing `limit` and/or `cursor` returns a page with a `next_cursor` instead of the full list.
+    """
+    if limit is None and cursor is None:
+        return orm_response(await aio.get_all_workouts_by_name(username, db), WorkoutOut)
+    try:
+        items, next_cursor = await aio.get_workouts_page_by_name(username, db, limit or DEFAULT_PAGE_SIZE, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return workout_page_response(items, next_cursor)
+
+@router.get("/user/{username}/latest", response_model=WorkoutOut)
+async def get_latest_workout_by_user_handler(username: str, db: AsyncSession = Depends(get_async_db)):
+    """
+    Get the most recent workout for a user.
+    """
+    workout = await aio.get_last_workout(username, db)
+    if not workout:
+        raise HTTPException(status_code=404, detail="No workouts found for this user")
+    return orm_response(workout, WorkoutOut)
+
+@router.get("/user/{username}/latest/{workout_type}", response_model=WorkoutOut)
+async def get_latest_workout_by_type_handler(username: str, workout_type: str, db: AsyncSession = Depends(get_async_db)):
+    """
+    Get the most recent workout of a specific type for a user.
+    """
+    workout = await aio.get_last_workout_based_on_username_and_type(username, workout_type, db)
+    if not workout:
+        raise HTTPException(status_code=404, detail="No workouts of this type found for this user")
+    return orm_response(workout, WorkoutOut)
+
+@router.post("/", response_model=WorkoutCreatedOut, status_code=status.HTTP_201_CREATED)
+async def create_workout_handler(workout: WorkoutCreateSimple, db: AsyncSession = Depends(get_async_db)):
+    """
+    Create a new workout with user and logged exercises.
+    `new_records` lists the personal records (per exercise and rep count) the workout set.
+    """
+    return await aio.create_workout(db, workout)
+
+@router.patch("/{workout_id}", response_model=WorkoutOut)
+async def update_workout_handler(workout_id: UUID, updates: WorkoutUpdate, db: AsyncSession = Depends(get_async_db)):
+    updated = await aio.update_workout(db, workout_id, updates)
+    if not updated:
+        raise HTTPException(status_code=404, detail="Workout not found or not updated")
+    return updated
+
+@router.delete("/{workout_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_workout_handler(workout_id: UUID, db: AsyncSession = Depends(get_async_db)):
+    """
+    Delete a workout by ID.
+    """
+    if not await aio.delete_workout(db, workout_id):
+        raise HTTPException(status_code=404, detail="Workout not found")
+    return None
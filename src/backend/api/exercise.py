@@ -1,12 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from uuid import UUID
 from typing import List
 
 from src.backend.database.configure import get_db
+from src.backend.database.replicas import get_read_db
+from src.backend.api.responses import orm_response
+from src.backend.api.streaming import stream_json_array
 from src.backend.models.enums import ExerciseGroup
 from src.backend.models.exercise import Exercise
-from src.backend.schemas.exercise import ExerciseCreate, ExerciseOut, ExerciseUpdate
+from src.backend.schemas.exercise import ExerciseCreate, ExerciseOut, ExerciseSummaryOut, ExerciseUpdate
 from src.backend.crud.exercise import (
     create_batch_exercise,
     create_exercise,
@@ -14,32 +17,50 @@ from src.backend.crud.exercise import (
     get_all_exercises,
     get_all_exercises_categorized,
     get_exercise_by_id,
+    get_exercise_by_name,
+    search_exercises_by_prefix,
     update_exercise,
 )
 
 router = APIRouter()
 
 @router.get("/", response_model=List[ExerciseOut])
-def get_exercises(name: str = None, db: Session = Depends(get_db)):
-    exercises = get_all_exercises(db)
+def get_exercises(name: str = None, stream: bool = False, db: Session = Depends(get_read_db)):
+    """
+    List exercises, or the one named `name`. With `stream=true` the full list is written incrementally.
+    """
     if name:
-        exercises = [e for e in exercises if e.name.lower() == name.lower()]
-    return exercises
+        exercise = get_exercise_by_name(db, name)
+        return orm_response([exercise] if exercise else [], ExerciseOut)
+    if stream:
+        return stream_json_array(get_all_exercises(db), ExerciseOut)
+    return orm_response(get_all_exercises(db), ExerciseOut)
 
 @router.get("/categorized")
-def get_exercises_categorized(db: Session = Depends(get_db)):
+def get_exercises_categorized(db: Session = Depends(get_read_db)):
     return get_all_exercises_categorized(db)
 
 @router.get("/categories", response_model=List[str])
 def get_exercise_categories():
     return [group.value for group in ExerciseGroup]
 
+@router.get("/search", response_model=List[ExerciseSummaryOut])
+def search_exercises(
+    prefix: str = Query(..., min_length=1),
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Autocomplete: exercises whose name starts with `prefix` (case-insensitive), alphabetically.
+    """
+    return orm_response(search_exercises_by_prefix(db, prefix, limit), ExerciseSummaryOut)
+
 @router.get("/{exercise_id}", response_model=ExerciseOut)
-def get_exercise_by_id_handler(exercise_id: UUID, db: Session = Depends(get_db)):
+def get_exercise_by_id_handler(exercise_id: UUID, db: Session = Depends(get_read_db)):
     exercise = get_exercise_by_id(db, exercise_id)
     if not exercise:
         raise HTTPException(status_code=404, detail="Exercise not found")
-    return exercise
+    return orm_response(exercise, ExerciseOut)
 
 @router.post("/", response_model=ExerciseOut)
 def create_exercise_handler(exercise: ExerciseCreate, db: Session = Depends(get_db)):
@@ -0,0 +1,98 @@
+import csv
+import io
+import json
+import zlib
+from typing import Iterable, Iterator
+from src.backend.crud.export import memoized
+
+EXPORT_FORMATS = {
+    # format: (media type, file extension, gzip the body)
+    "csv": ("text/csv", "csv", True),
+    "ndjson": ("application/x-ndjson", "ndjson", True),
+    # Parquet compresses each row group itself, so gzipping it again would only cost CPU.
+    "parquet": ("application/vnd.apache.parquet", "parquet", False),
+}
+
+def _with_iso_times(columns, rows):
+    # Datetimes as ISO 8601, converted once per distinct value (every set of a workout shares one).
+    index = columns.index("created_time")
+    iso = memoized(lambda value: value.isoformat())
+    return [row[:index] + (iso(row[index]),) + row[index + 1:] for row in rows]
+
+def encode_csv(columns, chunks: Iterable[list]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for rows in chunks:
+        writer.writerows(_with_iso_times(columns, rows))
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+def encode_ndjson(columns, chunks: Iterable[list]) -> Iterator[bytes]:
+    encoder = json.JSONEncoder()
+    for rows in chunks:
+        yield "".join(
+            encoder.encode(dict(zip(columns, row))) + "\n"
+            for row in _with_iso_times(columns, rows)
+        ).encode()
+
+class _ChunkSink(io.RawIOBase):
+    # Write-only file object that hands back whatever was written since the last drain.
+    def __init__(self):
+        self._parts = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+def encode_parquet(columns, chunks: Iterable[list]) -> Iterator[bytes]:
+    """
+    One Parquet row group per chunk, streamed as each group is written; the footer goes last.
+    """
+    # Imported here so pyarrow is only loaded by processes that actually export Parquet.
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        ("workout_id", pa.string()),
+        ("created_time", pa.timestamp("us")),
+        ("workout_type", pa.string()),
+        ("notes", pa.string()),
+        ("exercise_id", pa.string()),
+        ("exercise", pa.string()),
+        ("set_number", pa.int32()),
+        ("reps", pa.int32()),
+        ("weight", pa.float64()),
+    ])
+    sink = _ChunkSink()
+    with pq.ParquetWriter(sink, schema, compression="zstd") as writer:
+        for rows in chunks:
+            values = list(zip(*rows))
+            arrays = dict(zip(columns, values))
+            writer.write_table(pa.table(arrays, schema=schema))
+            yield sink.drain()
+    yield sink.drain()
+
+def gzip_stream(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """
+    Compress a byte stream into a single gzip member as it is produced.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+ENCODERS = {"csv": encode_csv, "ndjson": encode_ndjson, "parquet": encode_parquet}
@@ -3,6 +3,8 @@ from sqlalchemy.orm import Session
 from uuid import UUID
 
 from src.backend.database.configure import get_db
+from src.backend.database.replicas import get_read_db
+from src.backend.api.responses import orm_response
 from src.backend.schemas.logged_exercise import LoggedExerciseCreate, LoggedExerciseOut
 from src.backend.crud.logged_exercise import (
     log_exercise,
@@ -22,11 +24,11 @@ def create_logged_exercise(workout_id: UUID, entry: LoggedExerciseCreate, db: Se
     return log_exercise(db, entry, workout_id)
 
 @router.get("/{workout_id}/entries", response_model=list[LoggedExerciseOut])
-def read_logged_exercises_by_workout(workout_id: UUID, db: Session = Depends(get_db)):
+def read_logged_exercises_by_workout(workout_id: UUID, db: Session = Depends(get_read_db)):
     """
     Get all logged exercises for a given workout.
     """
-    return get_logged_exercises_by_workout(db, workout_id)
+    return orm_response(get_logged_exercises_by_workout(db, workout_id), LoggedExerciseOut)
 
 @router.delete("/{workout_id}/entry/{exercise_id}", status_code=status.HTTP_204_NO_CONTENT)
 def remove_logged_exercise(workout_id: UUID, exercise_id: UUID, db: Session = Depends(get_db)):
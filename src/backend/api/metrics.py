@@ -0,0 +1,22 @@
+from fastapi import APIRouter
+from src.backend.cache import cache_stats
+from src.backend.database.pool import pool_stats, thread_stats
+from src.backend.database.replicas import read_router
+
+router = APIRouter()
+
+@router.get("/cache")
+def get_cache_metrics():
+    """
+    Hit/miss/eviction counters and sizes for every in-process cache in this worker.
+    """
+    return cache_stats()
+
+@router.get("/pool")
+async def get_pool_metrics():
+    """
+    Connection pool occupancy (checked out, overflow) and checkout wait times per engine, plus
+    the worker thread pool that runs sync handlers, and how many read replicas are in rotation.
+    Async so reading it never waits for a thread.
+    """
+    return {"pools": pool_stats(), "threads": thread_stats(), "replicas": read_router.stats()}
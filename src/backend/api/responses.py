@@ -0,0 +1,80 @@
+import typing
+from functools import lru_cache
+from typing import Any, Type
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+_MISSING = object()
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Encode plain data (dicts, lists, UUIDs, datetimes, enums) to JSON bytes with orjson.
+    UTC datetimes end in "Z", as they do in Pydantic's output.
+    """
+    return orjson.dumps(content, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with `dumps`. The content must already be plain data; nothing is
+    passed through jsonable_encoder.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def _nested_model(annotation):
+    # (model, many) for fields typed Model, Optional[Model] or List[Model]; (None, False) otherwise.
+    origin = typing.get_origin(annotation)
+    if origin is list:
+        model, _ = _nested_model(typing.get_args(annotation)[0])
+        return model, True
+    if origin is typing.Union:
+        for arg in typing.get_args(annotation):
+            if arg is not type(None):
+                return _nested_model(arg)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, False
+    return None, False
+
+
+@lru_cache(maxsize=None)
+def orm_dumper(schema: Type[BaseModel]):
+    """
+    A function turning an ORM row (or any object exposing `schema`'s fields as attributes) into the
+    dict `schema` would serialize to, without validating it. Only for rows read back from our own
+    database, which already satisfy the schema; anything else must go through the model.
+    Loaded attributes are read straight from the instance dict, skipping the ORM descriptors.
+    """
+    fields = []
+    for name, field in schema.model_fields.items():
+        model, many = _nested_model(field.annotation)
+        default = None if field.is_required() else field.get_default(call_default_factory=True)
+        fields.append((name, orm_dumper(model) if model else None, many, default))
+
+    def dump(obj):
+        state = getattr(obj, "__dict__", {})
+        out = {}
+        for name, nested, many, default in fields:
+            value = state.get(name, _MISSING)
+            if value is _MISSING:
+                value = getattr(obj, name, default)
+            if nested is not None and value is not None:
+                value = [nested(item) for item in value] if many else nested(value)
+            out[name] = value
+        return out
+
+    return dump
+
+
+def orm_response(content, schema: Type[BaseModel], status_code: int = 200) -> FastJSONResponse:
+    """
+    Serialize an ORM row, or a list of them, as `schema` without re-validating it.
+    """
+    dump = orm_dumper(schema)
+    if isinstance(content, (list, tuple)):
+        return FastJSONResponse([dump(item) for item in content], status_code=status_code)
+    return FastJSONResponse(dump(content), status_code=status_code)
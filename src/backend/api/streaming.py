@@ -0,0 +1,129 @@
+import codecs
+import json
+from typing import AsyncIterator, Iterable, Type
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from src.backend.api.responses import dumps, orm_dumper
+
+MAX_ITEM_BYTES = 1024 * 1024
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+
+
+class MalformedItem:
+    """
+    Placeholder yielded for an NDJSON line that is not valid JSON, so callers can report it
+    against that item and keep going.
+    """
+
+    def __init__(self, message: str):
+        self.message = message
+
+
+async def iter_json_items(chunks: AsyncIterator[bytes], max_item_bytes: int = MAX_ITEM_BYTES):
+    """
+    Incrementally parse a request body that is either a JSON array or newline-delimited JSON,
+    yielding one decoded item at a time. Only the current unparsed item is held in memory.
+
+    Raises ValueError when a JSON array is malformed or a single item exceeds `max_item_bytes`.
+    """
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    pos = 0
+    mode = None  # "array" or "ndjson"
+    done = False
+    eof = False
+    chunk_iter = chunks.__aiter__()
+
+    while not done:
+        if not eof:
+            try:
+                chunk = await chunk_iter.__anext__()
+                buffer = buffer[pos:] + text_decoder.decode(chunk)
+            except StopAsyncIteration:
+                buffer = buffer[pos:] + text_decoder.decode(b"", final=True)
+                eof = True
+            pos = 0
+
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos >= len(buffer):
+                break
+
+            if mode is None:
+                if buffer[pos] == "[":
+                    mode = "array"
+                    pos += 1
+                    expect_separator = False
+                else:
+                    mode = "ndjson"
+                continue
+
+            if mode == "array":
+                if buffer[pos] == "]":
+                    done = True
+                    break
+                if expect_separator:
+                    if buffer[pos] != ",":
+                        raise ValueError(f"Expected ',' or ']' in JSON array, found {buffer[pos]!r}")
+                    pos += 1
+                    expect_separator = False
+                    continue
+                try:
+                    item, end = _decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise ValueError("Malformed JSON array item")
+                    break
+                pos = end
+                expect_separator = True
+                yield item
+            else:
+                newline = buffer.find("\n", pos)
+                if newline == -1 and not eof:
+                    break
+                line_end = len(buffer) if newline == -1 else newline
+                line = buffer[pos:line_end]
+                pos = line_end
+                try:
+                    item = json.loads(line)
+                except json.JSONDecodeError as e:
+                    item = MalformedItem(f"Invalid JSON: {e.msg}")
+                yield item
+
+        if len(buffer) - pos > max_item_bytes:
+            raise ValueError(f"Item exceeds {max_item_bytes} bytes")
+        if eof and not done:
+            if mode == "array":
+                raise ValueError("Unterminated JSON array")
+            done = True
+
+
+STREAM_FLUSH_BYTES = 64 * 1024
+
+
+def iter_json_array(items: Iterable, schema: Type[BaseModel], flush_bytes: int = STREAM_FLUSH_BYTES):
+    """
+    Serialize trusted ORM rows as `schema` one at a time and yield the encoded JSON array in chunks
+    of roughly `flush_bytes`. The opening bracket goes out before the first item is fetched, so neither
+    time-to-first-byte nor memory depends on how many items there are.
+    """
+    dump = orm_dumper(schema)
+    yield b"["
+    buffer = bytearray()
+    separator = b""
+    for item in items:
+        buffer += separator
+        buffer += dumps(dump(item))
+        separator = b","
+        if len(buffer) >= flush_bytes:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b"]"
+    yield bytes(buffer)
+
+
+def stream_json_array(items: Iterable, schema: Type[BaseModel]) -> StreamingResponse:
+    return StreamingResponse(iter_json_array(items, schema), media_type="application/json")
@@ -2,11 +2,15 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from uuid import UUID
 from src.backend.database.configure import get_db
+from src.backend.database.replicas import get_read_db
+from src.backend.api.responses import orm_response
+from src.backend.api.streaming import stream_json_array
 from src.backend.schemas.user import UserCreate, UserUpdate, UserOut
 from src.backend.crud.user import (
     create_user,
     get_user_by_id,
     get_all_users,
+    iter_all_users,
     delete_user,
     update_user
 )
@@ -21,21 +25,24 @@ def create_user_handler(user: UserCreate, db: Session = Depends(get_db)):
     return create_user(db, user)
 
 @router.get("/{user_id}", response_model=UserOut)
-def get_user_by_id_handler(user_id: UUID, db: Session = Depends(get_db)):
+def get_user_by_id_handler(user_id: UUID, db: Session = Depends(get_read_db)):
     """
     Get a single user by their UUID.
     """
     user = get_user_by_id(db, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return user
+    return orm_response(user, UserOut)
 
 @router.get("/", response_model=list[UserOut])
-def get_all_users_handler(db: Session = Depends(get_db)):
+def get_all_users_handler(stream: bool = False, db: Session = Depends(get_read_db)):
     """
     Get a list of all users.
+    With `stream=true` the array is written incrementally while the users are fetched in chunks.
     """
-    return get_all_users(db)
+    if stream:
+        return stream_json_array(iter_all_users(db), UserOut)
+    return orm_response(get_all_users(db), UserOut)
 
 @router.delete("/{user_id}", response_model=bool)
 def delete_user_handler(user_id: UUID, db: Session = Depends(get_db)):
@@ -1,81 +1,231 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import os
+from functools import partial
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
+from typing import Literal, Optional, Union
 from uuid import UUID
 
 from src.backend.database.configure import get_db
-from src.backend.schemas.workout import WorkoutCreateSimple, WorkoutUpdate, WorkoutOut
+from src.backend.database.replicas import get_read_db
+from src.backend.api.responses import FastJSONResponse, orm_dumper, orm_response
+from src.backend.api.export import ENCODERS, EXPORT_FORMATS, gzip_stream
+from src.backend.api.streaming import MalformedItem, iter_json_items, stream_json_array
+from src.backend import analytics
+from src.backend.analytics import SECONDARY_MUSCLE_FRACTION
+from src.backend.schemas.analytics import TrainingAnalyticsOut
+from src.backend.schemas.personal_record import PersonalRecordOut
+from src.backend.schemas.workout import (
+    ProgressionPointOut,
+    WorkoutBatchItemResult,
+    WorkoutBatchResult,
+    WorkoutCreateSimple,
+    WorkoutCreatedOut,
+    WorkoutMonthCount,
+    WorkoutOut,
+    WorkoutPage,
+    WorkoutStatsOut,
+    WorkoutUpdate,
+    WorkoutVolumeOut,
+)
+from src.backend.crud.export import EXPORT_COLUMNS, iter_user_set_rows
+from src.backend.crud.progression import get_exercise_progression
+from src.backend.crud.user import resolve_user_id
+from src.backend.crud.records import get_personal_records
+from src.backend.crud.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from src.backend.models.enums import ExerciseGroup
 from src.backend.crud.workout import (
     create_workout,
+    create_workouts_bulk,
     get_workout_by_workout_id,
     get_all_workouts,
+    iter_all_workouts,
     delete_workout,
     get_last_workout,
     get_last_workout_based_on_username_and_type,
     get_all_workouts_by_name,
+    get_workouts_page,
+    get_workouts_page_by_name,
     update_workout,
     calculate_num_workouts_by_month,
+    get_workout_month_histogram,
+    get_workout_stats,
+    get_workout_volume,
     calculate_num_workouts_by_type
 )
 
 router = APIRouter()
 
+BATCH_CHUNK_SIZE = int(os.getenv("WORKOUT_BATCH_CHUNK_SIZE", "500"))
+
+def workout_page_response(items, next_cursor: Optional[str]):
+    dump = orm_dumper(WorkoutOut)
+    return FastJSONResponse({"items": [dump(workout) for workout in items], "next_cursor": next_cursor})
+
+def _workout_page(fetch_page, limit: Optional[int], cursor: Optional[str]):
+    try:
+        items, next_cursor = fetch_page(limit or DEFAULT_PAGE_SIZE, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return workout_page_response(items, next_cursor)
+
 ## Dev Purposes
 
 
-@router.get("/", response_model=list[WorkoutOut])
-def get_all_workouts_handler(db: Session = Depends(get_db)):
+@router.get("/", response_model=Union[WorkoutPage, list[WorkoutOut]])
+def get_all_workouts_handler(
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    stream: bool = False,
+    db: Session = Depends(get_read_db)
+):
     """
     Get all workouts in the system.
+    Passing `limit` and/or `cursor` returns a page with a `next_cursor` instead of the full list.
+    With `stream=true` the full list is written incrementally while workouts are fetched in chunks.
     """
-    return get_all_workouts(db)
+    if stream:
+        if limit is not None or cursor is not None:
+            raise HTTPException(status_code=400, detail="stream cannot be combined with limit or cursor")
+        return stream_json_array(iter_all_workouts(db), WorkoutOut)
+    if limit is None and cursor is None:
+        return orm_response(get_all_workouts(db), WorkoutOut)
+    return _workout_page(partial(get_workouts_page, db), limit, cursor)
 
 @router.get("/{workout_id}", response_model=WorkoutOut)
-def get_workout_by_id_handler(workout_id: UUID, db: Session = Depends(get_db)):
+def get_workout_by_id_handler(workout_id: UUID, db: Session = Depends(get_read_db)):
     """
     Get a specific workout by its ID.
     """
     workout = get_workout_by_workout_id(db, workout_id)
     if not workout:
         raise HTTPException(status_code=404, detail="Workout not found")
-    return workout
+    return orm_response(workout, WorkoutOut)
 
 ## Prod Based, everything is gated by a user
 
 
-@router.get("/user/{username}", response_model=list[WorkoutOut])
-def get_workouts_by_user_handler(username: str, db: Session = Depends(get_db)):
+@router.get("/user/{username}", response_model=Union[WorkoutPage, list[WorkoutOut]])
+def get_workouts_by_user_handler(
+    username: str,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_read_db)
+):
     """
-    Get all workouts for a given user.
+    Get all workouts for a given user, newest first.
+    Passing `limit` and/or `cursor` returns a page with a `next_cursor` instead of the full list.
     """
-    return get_all_workouts_by_name(username, db)
+    if limit is None and cursor is None:
+        return orm_response(get_all_workouts_by_name(username, db), WorkoutOut)
+    return _workout_page(partial(get_workouts_page_by_name, username, db), limit, cursor)
+
+@router.get("/user/{username}/export")
+def export_workouts_handler(
+    username: str,
+    export_format: Literal["csv", "parquet", "ndjson"] = Query("csv", alias="format"),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Download a user's full history, one row per set, streamed in chunks from a server-side cursor.
+    CSV and NDJSON bodies are gzip-compressed on the fly; Parquet uses its own compression.
+    """
+    user_id = resolve_user_id(db, username)
+    if not user_id:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    media_type, extension, gzipped = EXPORT_FORMATS[export_format]
+    body = ENCODERS[export_format](EXPORT_COLUMNS, iter_user_set_rows(db, user_id))
+    headers = {"Content-Disposition": f'attachment; filename="{username}-workouts.{extension}"'}
+    if gzipped:
+        body = gzip_stream(body)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type=media_type, headers=headers)
 
 @router.get("/user/{username}/latest", response_model=WorkoutOut)
-def get_latest_workout_by_user_handler(username: str, db: Session = Depends(get_db)):
+def get_latest_workout_by_user_handler(username: str, db: Session = Depends(get_read_db)):
     """
     Get the most recent workout for a user.
     """
     workout = get_last_workout(username, db)
     if not workout:
         raise HTTPException(status_code=404, detail="No workouts found for this user")
-    return workout
+    return orm_response(workout, WorkoutOut)
 
 @router.get("/user/{username}/latest/{workout_type}", response_model=WorkoutOut)
-def get_latest_workout_by_type_handler(username: str, workout_type: str, db: Session = Depends(get_db)):
+def get_latest_workout_by_type_handler(username: str, workout_type: str, db: Session = Depends(get_read_db)):
     """
     Get the most recent workout of a specific type for a user.
     """
     workout = get_last_workout_based_on_username_and_type(username, workout_type, db)
     if not workout:
         raise HTTPException(status_code=404, detail="No workouts of this type found for this user")
-    return workout
+    return orm_response(workout, WorkoutOut)
 
-@router.post("/", response_model=WorkoutOut, status_code=status.HTTP_201_CREATED)
+@router.post("/", response_model=WorkoutCreatedOut, status_code=status.HTTP_201_CREATED)
 def create_workout_handler(workout: WorkoutCreateSimple, db: Session = Depends(get_db)):
     """
     Create a new workout with user and logged exercises.
+    `new_records` lists the personal records (per exercise and rep count) the workout set.
     """
     return create_workout(db, workout)
 
+@router.post("/batch", response_model=WorkoutBatchResult)
+async def create_workouts_batch_handler(request: Request, db: Session = Depends(get_db)):
+    """
+    Bulk-import workouts. The body is a JSON array or newline-delimited JSON of WorkoutCreateSimple
+    objects and is parsed incrementally; workouts are committed in chunks of BATCH_CHUNK_SIZE and
+    every item gets its own result.
+    """
+    results = []
+    pending = []
+
+    async def flush():
+        outcomes = await run_in_threadpool(create_workouts_bulk, db, [workout for _, workout in pending])
+        results.extend(WorkoutBatchItemResult(index=index, **outcome) for (index, _), outcome in zip(pending, outcomes))
+        pending.clear()
+
+    index = -1
+    parse_error = None
+    items = iter_json_items(request.stream())
+    while True:
+        try:
+            item = await items.__anext__()
+        except StopAsyncIteration:
+            break
+        except ValueError as e:
+            parse_error = str(e)
+            break
+
+        index += 1
+        if isinstance(item, MalformedItem):
+            results.append(WorkoutBatchItemResult(index=index, error=item.message))
+            continue
+        try:
+            pending.append((index, WorkoutCreateSimple.model_validate(item)))
+        except ValidationError as e:
+            detail = "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors())
+            results.append(WorkoutBatchItemResult(index=index, error=f"Invalid workout: {detail}"))
+            continue
+        if len(pending) >= BATCH_CHUNK_SIZE:
+            await flush()
+
+    if pending:
+        await flush()
+    if parse_error and not results:
+        raise HTTPException(status_code=400, detail=parse_error)
+
+    results.sort(key=lambda result: result.index)
+    created = sum(1 for result in results if result.id)
+    return WorkoutBatchResult(
+        created=created,
+        failed=len(results) - created,
+        error=parse_error,
+        results=results
+    )
+
 @router.patch("/{workout_id}", response_model=WorkoutOut)
 def update_workout_handler(workout_id: UUID, updates: WorkoutUpdate, db: Session = Depends(get_db)):
     updated = update_workout(db, workout_id, updates)
@@ -95,13 +245,67 @@ def delete_workout_handler(workout_id: UUID, db: Session = Depends(get_db)):
 
 ## Statistics/Analytics
 
-# Weight Progression for each exercise
 # Ratings of workouts?
 
+@router.get("/user/{username}/analytics", response_model=TrainingAnalyticsOut)
+def get_training_analytics_handler(
+    username: str,
+    weeks: int = Query(12, ge=1, le=520),
+    secondary_fraction: float = Query(SECONDARY_MUSCLE_FRACTION, ge=0, le=1),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Weekly volume per muscle group, daily acute (7-day) vs chronic (28-day) load and
+    per-category volume trends over the last `weeks` weeks.
+    """
+    # Attribute access, not a module-level import, so numpy loads on the first analytics request.
+    return analytics.get_training_analytics(username, db, weeks, secondary_fraction)
+
+@router.get("/user/{username}/records", response_model=list[PersonalRecordOut])
+def get_personal_records_handler(username: str, exercise_id: Optional[UUID] = None, db: Session = Depends(get_read_db)):
+    """
+    Heaviest weight and estimated 1RM per exercise and rep count, optionally for one exercise.
+    """
+    return get_personal_records(username, db, exercise_id)
+
+@router.get("/user/{username}/progression/{exercise_id}", response_model=list[ProgressionPointOut])
+def get_exercise_progression_handler(username: str, exercise_id: UUID, db: Session = Depends(get_read_db)):
+    """
+    Per-session top set, estimated 1RM and total volume for one exercise, oldest first.
+    """
+    return get_exercise_progression(username, exercise_id, db)
+
+@router.get("/user/{username}/stats", response_model=WorkoutStatsOut)
+def get_workout_stats_handler(username: str, db: Session = Depends(get_read_db)):
+    """
+    Workout counts per type, per month and per weekday plus first/last workout, in one call.
+    """
+    return get_workout_stats(username, db)
+
 @router.get("/user/{username}/frequency/month")
-def get_workout_frequency_by_month(username: str, db: Session = Depends(get_db)):
+def get_workout_frequency_by_month(username: str, db: Session = Depends(get_read_db)):
     return calculate_num_workouts_by_month(username, db)
 
+@router.get("/user/{username}/frequency/month/histogram", response_model=list[WorkoutMonthCount])
+def get_workout_month_histogram_handler(username: str, db: Session = Depends(get_read_db)):
+    """
+    Workouts per calendar month (YYYY-MM), oldest first, with empty months filled in.
+    """
+    return get_workout_month_histogram(username, db)
+
 @router.get("/user/{username}/frequency/{workout_type}")
-def get_workout_frequency_by_type(username: str, workout_type: str, db: Session = Depends(get_db)):
-    return calculate_num_workouts_by_type(username, workout_type, db)
\ No newline at end of file
+def get_workout_frequency_by_type(username: str, workout_type: str, db: Session = Depends(get_read_db)):
+    return calculate_num_workouts_by_type(username, workout_type, db)
+
+@router.get("/user/{username}/volume", response_model=WorkoutVolumeOut)
+def get_workout_volume_handler(
+    username: str,
+    period: str = Query("all", pattern=r"^(all|\d{4}-\d{2})$"),
+    workout_type: Optional[ExerciseGroup] = None,
+    db: Session = Depends(get_read_db)
+):
+    """
+    Workout, set and rep counts plus total volume for a month (YYYY-MM) or all time,
+    optionally for one workout type.
+    """
+    return get_workout_volume(username, db, period, workout_type.value if workout_type else None)
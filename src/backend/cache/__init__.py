@@ -0,0 +1,2 @@
+from .ttl import TTLCache, cache_stats, clear_caches, register_cache
+from .invalidation import mark_user_written, user_write_version
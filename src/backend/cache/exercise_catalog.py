@@ -0,0 +1,186 @@
+import bisect
+import os
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Optional
+from uuid import UUID
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from src.backend.cache.ttl import register_cache
+from src.backend.database.configure import primary_bind
+from src.backend.models.enums import ExerciseGroup
+from src.backend.models.exercise import Exercise
+
+@dataclass(frozen=True)
+class CatalogExercise:
+    id: UUID
+    name: str
+    category: Optional[ExerciseGroup]
+    primary_muscles: tuple
+    secondary_muscles: Optional[tuple]
+    description: Optional[str]
+
+    @classmethod
+    def from_model(cls, exercise: Exercise):
+        return cls(
+            id=exercise.id,
+            name=exercise.name,
+            category=exercise.category,
+            primary_muscles=tuple(exercise.primary_muscles or ()),
+            secondary_muscles=tuple(exercise.secondary_muscles) if exercise.secondary_muscles is not None else None,
+            description=exercise.description,
+        )
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    exercises: tuple
+    by_id: MappingProxyType
+    by_name: MappingProxyType
+    by_category: MappingProxyType
+    sorted_names: tuple
+    loaded_at: float
+    generation: int = 0
+
+    @classmethod
+    def build(cls, exercises, loaded_at: float, generation: int = 0):
+        exercises = tuple(sorted(exercises, key=lambda e: e.name.lower()))
+        by_category = {}
+        for exercise in exercises:
+            key = exercise.category.value if exercise.category else "Uncategorized"
+            by_category.setdefault(key, []).append(exercise)
+        return cls(
+            exercises=exercises,
+            by_id=MappingProxyType({e.id: e for e in exercises}),
+            by_name=MappingProxyType({e.name.lower(): e for e in exercises}),
+            by_category=MappingProxyType({k: tuple(v) for k, v in by_category.items()}),
+            sorted_names=tuple(e.name.lower() for e in exercises),
+            loaded_at=loaded_at,
+            generation=generation,
+        )
+
+    def search_prefix(self, prefix: str, limit: int):
+        # `exercises` is sorted by lowercased name, so matches are one contiguous run found by bisection.
+        prefix = prefix.lower()
+        start = bisect.bisect_left(self.sorted_names, prefix)
+        matches = []
+        for name, exercise in zip(self.sorted_names[start:start + limit], self.exercises[start:start + limit]):
+            if not name.startswith(prefix):
+                break
+            matches.append(exercise)
+        return matches
+
+class ExerciseCatalog:
+    """
+    Immutable in-memory snapshot of the exercises table, indexed by id, case-insensitive name,
+    category and sorted name (for prefix search). Reads never touch the database once loaded; writes in this process swap in a
+    freshly loaded snapshot after they commit. `max_age` bounds how long writes made by other
+    workers stay invisible.
+
+    Requests that find the snapshot expired while another reload is running keep serving the
+    expired snapshot instead of each reading the table. Nothing waits on a reload: the lock is
+    never held across a query, because under AsyncSession.run_sync the query yields to the
+    event loop and a second coroutine blocking on the lock would stall the whole worker. Every
+    load reads in a session of its own so it sees all commits made before it started, and a
+    snapshot only replaces one with an older generation. Loads and miss checks always go to the
+    primary, never to a possibly lagging read replica.
+    """
+
+    def __init__(self, max_age: float = 300.0, clock=time.monotonic):
+        self.max_age = max_age
+        self._clock = clock
+        self._snapshot = None
+        self._generation = 0
+        self._reloading = 0
+        self._lock = threading.Lock()
+        self.reads = 0
+        self.loads = 0
+
+    def _is_stale(self, snapshot) -> bool:
+        return snapshot is None or self._clock() - snapshot.loaded_at >= self.max_age
+
+    def snapshot(self, db: Session) -> CatalogSnapshot:
+        snapshot = self._snapshot
+        if self._is_stale(snapshot):
+            snapshot = self._reload(db, only_if_stale=True)
+        self.reads += 1
+        return snapshot
+
+    def refresh(self, db: Session) -> CatalogSnapshot:
+        """
+        Reload unconditionally; write paths call this after they commit.
+        """
+        return self._reload(db, only_if_stale=False)
+
+    def _reload(self, db: Session, only_if_stale: bool) -> CatalogSnapshot:
+        with self._lock:
+            current = self._snapshot
+            if only_if_stale and current is not None and (self._reloading or not self._is_stale(current)):
+                # Reloaded, or being reloaded, by another request.
+                return current
+            self._generation += 1
+            generation = self._generation
+            self._reloading += 1
+        try:
+            exercises = self._load(db)
+        finally:
+            with self._lock:
+                self._reloading -= 1
+        snapshot = CatalogSnapshot.build(exercises, self._clock(), generation)
+        with self._lock:
+            if self._snapshot is None or snapshot.generation > self._snapshot.generation:
+                self._snapshot = snapshot
+            self.loads += 1
+            return self._snapshot
+
+    def _load(self, db: Session):
+        with Session(bind=primary_bind(db)) as session:
+            return [CatalogExercise.from_model(e) for e in session.query(Exercise)]
+
+    def _exists_on_primary(self, db: Session, condition) -> bool:
+        with Session(bind=primary_bind(db)) as session:
+            return session.query(Exercise.id).filter(condition).first() is not None
+
+    def get_all(self, db: Session):
+        return list(self.snapshot(db).exercises)
+
+    def get_by_id(self, db: Session, exercise_id: UUID):
+        exercise = self.snapshot(db).by_id.get(exercise_id)
+        if exercise is None and self._exists_on_primary(db, Exercise.id == exercise_id):
+            # Created by another worker since the snapshot was taken.
+            exercise = self.refresh(db).by_id.get(exercise_id)
+        return exercise
+
+    def get_by_name(self, db: Session, name: str):
+        exercise = self.snapshot(db).by_name.get(name.lower())
+        if exercise is None and self._exists_on_primary(db, func.lower(Exercise.name) == name.lower()):
+            exercise = self.refresh(db).by_name.get(name.lower())
+        return exercise
+
+    def search_prefix(self, db: Session, prefix: str, limit: int):
+        return self.snapshot(db).search_prefix(prefix, limit)
+
+    def get_categorized(self, db: Session):
+        return {category: list(exercises) for category, exercises in self.snapshot(db).by_category.items()}
+
+    def invalidate(self):
+        self._snapshot = None
+
+    def clear(self):
+        self.invalidate()
+        self.reads = 0
+        self.loads = 0
+
+    def stats(self):
+        snapshot = self._snapshot
+        return {
+            "size": len(snapshot.exercises) if snapshot else 0,
+            "max_age": self.max_age,
+            "age": self._clock() - snapshot.loaded_at if snapshot else None,
+            "reads": self.reads,
+            "loads": self.loads,
+        }
+
+exercise_catalog = ExerciseCatalog(max_age=float(os.getenv("EXERCISE_CATALOG_MAX_AGE", "300")))
+register_cache("exercise_catalog", exercise_catalog)
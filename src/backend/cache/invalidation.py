@@ -0,0 +1,35 @@
+from sqlalchemy import event, select, update
+from sqlalchemy.orm import Session
+from src.backend.models.user import User
+
+# Write paths mark the users whose data they touched on the session. The commit bumps those
+# users' write_version in the same transaction, so caches keyed on it miss in every worker and
+# process once the write is visible. Nothing is bumped for transactions that roll back.
+
+_SESSION_KEY = "written_user_ids"
+
+def mark_user_written(db, user_id):
+    if isinstance(db, Session):
+        db.info.setdefault(_SESSION_KEY, set()).add(user_id)
+
+def user_write_version(db, user_id):
+    """
+    The user's current write_version, or None for an unknown user. Cache keys that include it
+    miss as soon as any process commits a write for the user.
+    """
+    return db.scalar(select(User.write_version).where(User.id == user_id))
+
+@event.listens_for(Session, "before_commit")
+def _bump_write_versions(session):
+    user_ids = session.info.pop(_SESSION_KEY, None)
+    if user_ids:
+        session.execute(
+            update(User)
+            .where(User.id.in_(user_ids))
+            .values(write_version=User.write_version + 1)
+            .execution_options(synchronize_session=False)
+        )
+
+@event.listens_for(Session, "after_rollback")
+def _discard_user_writes(session):
+    session.info.pop(_SESSION_KEY, None)
@@ -0,0 +1,81 @@
+import threading
+import time
+from collections import OrderedDict
+
+_registry = {}
+
+class TTLCache:
+    """
+    Thread-safe, size-bounded LRU cache whose entries also expire after `ttl` seconds.
+    Every instance is registered by name so hit/miss counters can be exposed in one place.
+    """
+
+    def __init__(self, name: str, maxsize: int = 1024, ttl: float = 300.0, clock=time.monotonic):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        register_cache(name, self)
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+def register_cache(name: str, cache):
+    """
+    Register any object exposing stats() and clear() for the metrics endpoint and test resets.
+    """
+    _registry[name] = cache
+
+def cache_stats():
+    return {name: cache.stats() for name, cache in _registry.items()}
+
+def clear_caches():
+    for cache in _registry.values():
+        cache.clear()
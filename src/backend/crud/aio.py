@@ -0,0 +1,74 @@
+"""
+Async variants of the CRUD functions, for use with an AsyncSession.
+
+Plain reads are native async queries. Writes, and reads built on the legacy Query API, run the
+sync implementation on the session's connection through AsyncSession.run_sync, so rollups,
+records and cache invalidation live in one place. Neither ties up a thread while the database
+is working. Every commit happens inside the sync call, which reloads what it returns, so the
+results are safe to serialize without further I/O.
+"""
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
+from src.backend.crud import workout as crud_workout
+from src.backend.crud.loading import workout_load_options
+from src.backend.crud.user import user_id_cache
+from src.backend.models.enums import ExerciseGroup
+from src.backend.models.user import User
+from src.backend.models.workout import Workout
+from src.backend.schemas.workout import WorkoutCreateSimple, WorkoutUpdate
+
+def _workouts():
+    return select(Workout).options(*workout_load_options())
+
+async def resolve_user_id(db: AsyncSession, username: str):
+    user_id = user_id_cache.get(username)
+    if user_id is None:
+        user_id = await db.scalar(select(User.id).where(User.username == username))
+        if user_id is not None:
+            user_id_cache.set(username, user_id)
+    return user_id
+
+async def get_user_by_id(db: AsyncSession, user_id: UUID):
+    return await db.get(User, user_id)
+
+async def get_workout_by_workout_id(db: AsyncSession, workout_id: UUID):
+    return (await db.scalars(_workouts().where(Workout.id == workout_id))).first()
+
+async def get_all_workouts_by_name(username: str, db: AsyncSession):
+    user_id = await resolve_user_id(db, username)
+    if not user_id:
+        return []
+    query = _workouts().where(Workout.user_id == user_id).order_by(Workout.created_time.desc())
+    return (await db.scalars(query)).all()
+
+async def get_workouts_page_by_name(username: str, db: AsyncSession, limit: int, cursor: str = None):
+    return await db.run_sync(lambda session: crud_workout.get_workouts_page_by_name(username, session, limit, cursor))
+
+async def get_last_workout(username: str, db: AsyncSession):
+    user_id = await resolve_user_id(db, username)
+    if not user_id:
+        return None
+    query = _workouts().where(Workout.user_id == user_id).order_by(Workout.created_time.desc()).limit(1)
+    return (await db.scalars(query)).first()
+
+async def get_last_workout_based_on_username_and_type(username: str, workout_type: str, db: AsyncSession):
+    user_id = await resolve_user_id(db, username)
+    if not user_id:
+        return None
+    query = (
+        _workouts()
+        .where(Workout.user_id == user_id, Workout.workout_type == ExerciseGroup(workout_type))
+        .order_by(Workout.created_time.desc())
+        .limit(1)
+    )
+    return (await db.scalars(query)).first()
+
+async def create_workout(db: AsyncSession, workout_data: WorkoutCreateSimple):
+    return await db.run_sync(crud_workout.create_workout, workout_data)
+
+async def update_workout(db: AsyncSession, workout_id: UUID, updates: WorkoutUpdate):
+    return await db.run_sync(crud_workout.update_workout, workout_id, updates)
+
+async def delete_workout(db: AsyncSession, workout_id: UUID):
+    return await db.run_sync(crud_workout.delete_workout, workout_id)
@@ -0,0 +1,43 @@
+import os
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+from uuid import UUID
+from src.backend.cache import mark_user_written
+from src.backend.models.workout import Workout
+from src.backend.models.logged_exercise import LoggedExercise
+from src.backend.models.logged_exercise_set import LoggedExerciseSet
+
+# Workouts removed per transaction when deleting a user's history. Each batch is three DELETEs
+# keyed by workout id, so locks are held only for as long as one batch takes.
+DELETE_BATCH_SIZE = int(os.getenv("DELETE_BATCH_SIZE", "1000"))
+
+def delete_workout_rows(db: Session, workout_ids):
+    """
+    Delete workouts with their logged exercises and sets using set-based DELETEs, children first,
+    without loading any of them. Runs in the caller's transaction.
+    """
+    logged_exercise_ids = select(LoggedExercise.id).where(LoggedExercise.workout_id.in_(workout_ids))
+    db.execute(
+        delete(LoggedExerciseSet)
+        .where(LoggedExerciseSet.logged_exercise_id.in_(logged_exercise_ids))
+        .execution_options(synchronize_session=False)
+    )
+    # These two criteria can be evaluated in Python, so instances already in the session are
+    # detached rather than left behind as stale rows.
+    db.execute(delete(LoggedExercise).where(LoggedExercise.workout_id.in_(workout_ids)).execution_options(synchronize_session="evaluate"))
+    db.execute(delete(Workout).where(Workout.id.in_(workout_ids)).execution_options(synchronize_session="evaluate"))
+
+def delete_user_workouts(db: Session, user_id: UUID, batch_size: int = DELETE_BATCH_SIZE):
+    """
+    Delete every workout a user has, `batch_size` workouts per committed transaction.
+    Rollups and records are left to the caller. Returns the number of workouts deleted.
+    """
+    deleted = 0
+    while True:
+        workout_ids = db.scalars(select(Workout.id).where(Workout.user_id == user_id).limit(batch_size)).all()
+        if not workout_ids:
+            return deleted
+        mark_user_written(db, user_id)
+        delete_workout_rows(db, workout_ids)
+        db.commit()
+        deleted += len(workout_ids)
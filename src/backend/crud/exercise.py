@@ -1,7 +1,8 @@
-from collections import defaultdict
+from sqlalchemy import func, insert, select
 from sqlalchemy.orm import Session
-from uuid import UUID
-from typing import List
+from uuid import UUID, uuid4
+from typing import Iterable, List
+from src.backend.cache.exercise_catalog import exercise_catalog
 from src.backend.models.exercise import Exercise
 from src.backend.schemas.exercise import ExerciseCreate, ExerciseUpdate
 
@@ -10,39 +11,91 @@ def create_exercise(db: Session, exercise_data: ExerciseCreate):
     db.add(exercise)
     db.commit()
     db.refresh(exercise)
+    exercise_catalog.refresh(db)
     return exercise
 
+def _insert_ignoring_duplicates(db: Session):
+    # Dialect-native "skip rows whose unique name already exists", so concurrent imports don't race.
+    # The other dialects' insert constructs are imported only when that dialect is in use.
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        return insert(Exercise).prefix_with("IGNORE")
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+        return sqlite_insert(Exercise).on_conflict_do_nothing(index_elements=["name"])
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+        return postgresql_insert(Exercise).on_conflict_do_nothing(index_elements=["name"])
+    return insert(Exercise)
+
 def create_batch_exercise(db: Session, exercises_data: List[ExerciseCreate]):
-    exercises_list = []
+    rows = {}
     for exercise_data in exercises_data:
-        # Check if exercise already exists by name
-        existing = db.query(Exercise).filter(Exercise.name == exercise_data.name).first()
-        if existing:
-            continue  # Skip duplicates (or collect if you want to return them too)
+        rows.setdefault(exercise_data.name, {"id": uuid4(), **exercise_data.model_dump()})
+    if not rows:
+        return []
 
-        exercise = Exercise(**exercise_data.model_dump())
-        db.add(exercise)
-        db.commit()
-        db.refresh(exercise)
-        exercises_list.append(exercise)
+    # Skip names that already exist (one query), then insert the rest in one multi-row statement.
+    existing = set(db.scalars(select(Exercise.name).where(Exercise.name.in_(list(rows)))))
+    new_rows = [row for name, row in rows.items() if name not in existing]
+    if not new_rows:
+        return []
+    db.execute(_insert_ignoring_duplicates(db), new_rows)
+    db.commit()
 
-    return exercises_list
+    # Rows that lost a race with a concurrent importer were ignored and are not in the snapshot.
+    snapshot = exercise_catalog.refresh(db)
+    return [snapshot.by_id[row["id"]] for row in new_rows if row["id"] in snapshot.by_id]
 
 def get_exercise_by_id(db: Session, exercise_id: UUID):
-    return db.query(Exercise).filter(Exercise.id == exercise_id).first()
+    return exercise_catalog.get_by_id(db, exercise_id)
+
+def get_exercise_by_name(db: Session, name: str):
+    return exercise_catalog.get_by_name(db, name)
+
+def search_exercises_by_prefix(db: Session, prefix: str, limit: int = 10):
+    return exercise_catalog.search_prefix(db, prefix, limit)
+
+def resolve_exercise_ids(db: Session, names: Iterable[str]):
+    """
+    Map exercise names to ids: catalog hits cost nothing and every name the catalog does not
+    know is looked up in a single IN query.
+    Matching is case-insensitive ("deadlift" logs against "Deadlift"), the same as the catalog
+    and the lower(name) index, and as the default MySQL collation already compared names.
+    Returns the {lowercased name: id} mapping and the list of names that do not exist.
+    """
+    snapshot = exercise_catalog.snapshot(db)
+    resolved = {}
+    unknown = {}
+    for name in names:
+        key = name.lower()
+        exercise = snapshot.by_name.get(key)
+        if exercise is not None:
+            resolved[key] = exercise.id
+        elif key not in resolved:
+            unknown.setdefault(key, name)
+
+    if unknown:
+        rows = db.query(Exercise.name, Exercise.id).filter(func.lower(Exercise.name).in_(list(unknown))).all()
+        for name, exercise_id in rows:
+            resolved[name.lower()] = exercise_id
+            unknown.pop(name.lower(), None)
+        if rows:
+            # Created by another worker; reload on the next catalog read.
+            exercise_catalog.invalidate()
+
+    return resolved, list(unknown.values())
+
+def exercises_not_found_detail(names: List[str]):
+    if len(names) == 1:
+        return f"Exercise '{names[0]}' not found"
+    return "Exercises not found: " + ", ".join(f"'{name}'" for name in names)
 
 def get_all_exercises(db: Session):
-    return db.query(Exercise).all()
+    return exercise_catalog.get_all(db)
 
 def get_all_exercises_categorized(db: Session):
-    exercises = db.query(Exercise).all()
-    grouped = defaultdict(list)
-    for exercise in exercises:
-        if exercise.category:
-            grouped[exercise.category.value].append(exercise)
-        else:
-            grouped["Uncategorized"].append(exercise)
-    return grouped
+    return exercise_catalog.get_categorized(db)
 
 def update_exercise(db: Session, exercise_id: UUID, updates: ExerciseUpdate):
     exercise = db.query(Exercise).filter(Exercise.id == exercise_id).first()
@@ -52,6 +105,7 @@ def update_exercise(db: Session, exercise_id: UUID, updates: ExerciseUpdate):
         setattr(exercise, field, value)
     db.commit()
     db.refresh(exercise)
+    exercise_catalog.refresh(db)
     return exercise
 
 def delete_exercise(db: Session, exercise_id: UUID):
@@ -60,4 +114,5 @@ def delete_exercise(db: Session, exercise_id: UUID):
         return False
     db.delete(exercise)
     db.commit()
+    exercise_catalog.refresh(db)
     return True
\ No newline at end of file
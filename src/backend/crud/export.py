@@ -0,0 +1,77 @@
+import os
+from sqlalchemy import String, select, type_coerce
+from sqlalchemy.orm import Session
+from uuid import UUID
+from src.backend.models.enums import ExerciseGroup
+from src.backend.models.exercise import Exercise
+from src.backend.models.workout import Workout
+from src.backend.models.logged_exercise import LoggedExercise
+from src.backend.models.logged_exercise_set import LoggedExerciseSet
+
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "5000"))
+
+# One row per set, flattened with its workout and exercise.
+EXPORT_COLUMNS = (
+    "workout_id", "created_time", "workout_type", "notes",
+    "exercise_id", "exercise", "set_number", "reps", "weight",
+)
+
+def user_set_rows_query(user_id: UUID):
+    # Ids and the workout type are read as raw text: they repeat across a workout's sets, so
+    # converting each distinct value once beats building a UUID/enum object for every row.
+    return (
+        select(
+            type_coerce(Workout.id, String), Workout.created_time, type_coerce(Workout.workout_type, String),
+            Workout.notes, type_coerce(Exercise.id, String), Exercise.name,
+            LoggedExerciseSet.set_number, LoggedExerciseSet.reps, LoggedExerciseSet.weight,
+        )
+        .join(LoggedExercise, LoggedExercise.workout_id == Workout.id)
+        .join(Exercise, Exercise.id == LoggedExercise.exercise_id)
+        .join(LoggedExerciseSet, LoggedExerciseSet.logged_exercise_id == LoggedExercise.id)
+        .where(Workout.user_id == user_id)
+        .order_by(Workout.created_time, Workout.id, LoggedExercise.id, LoggedExerciseSet.set_number)
+    )
+
+def memoized(convert):
+    """
+    Wrap a one-argument conversion so each distinct non-null value is converted only once.
+    """
+    cache = {}
+
+    def lookup(value):
+        if value is None:
+            return None
+        try:
+            return cache[value]
+        except KeyError:
+            cache[value] = converted = convert(value)
+            return converted
+
+    return lookup
+
+def _canonical_uuid(raw) -> str:
+    return str(UUID(str(raw)))
+
+def _workout_type_value(raw) -> str:
+    return ExerciseGroup[raw].value if raw in ExerciseGroup.__members__ else ExerciseGroup(raw).value
+
+def iter_user_set_rows(db: Session, user_id: UUID, chunk_size: int = EXPORT_CHUNK_SIZE):
+    """
+    Yield a user's set rows (in EXPORT_COLUMNS order) as lists of at most `chunk_size` tuples,
+    read through a server-side cursor so only one chunk is held in memory at a time.
+    Ids come back as canonical UUID strings and the workout type as its display value.
+    """
+    exercise_id = memoized(_canonical_uuid)
+    workout_type = memoized(_workout_type_value)
+    result = db.connection().execute(
+        user_set_rows_query(user_id).execution_options(stream_results=True, yield_per=chunk_size)
+    )
+    try:
+        for partition in result.partitions():
+            workout_id = memoized(_canonical_uuid)
+            yield [
+                (workout_id(w_id), created, workout_type(w_type), notes, exercise_id(e_id), name, set_number, reps, weight)
+                for w_id, created, w_type, notes, e_id, name, set_number, reps, weight in partition
+            ]
+    finally:
+        result.close()
@@ -0,0 +1,38 @@
+import os
+from sqlalchemy.orm import joinedload, selectinload
+from src.backend.models.logged_exercise import LoggedExercise
+from src.backend.models.workout import Workout
+
+# Shared eager-loading options for everything that is serialized as WorkoutOut / LoggedExerciseOut.
+#
+# A workout graph is loaded in a fixed number of statements, independent of how many workouts,
+# logged exercises or sets are returned (SQLAlchemy batches selectin loads 500 parents at a time):
+#   1. SELECT workouts ...
+#   2. SELECT logged_exercises JOIN exercises WHERE workout_id IN (...)
+#   3. SELECT logged_exercise_sets WHERE logged_exercise_id IN (...)
+# Logged exercises loaded on their own skip the first statement and join their exercise directly.
+
+WORKOUT_GRAPH_QUERIES = 3
+LOGGED_EXERCISE_GRAPH_QUERIES = 2
+
+# Rows per chunk when a full listing is streamed. Workouts are streamed as keyset pages, each one
+# buffered query plus its selectin loads, so a streamed listing costs
+# WORKOUT_GRAPH_QUERIES * ceil(rows / STREAM_CHUNK_SIZE) statements. Listings without eager loads
+# (users) are read through a server-side cursor with yield_per instead.
+STREAM_CHUNK_SIZE = int(os.getenv("STREAM_CHUNK_SIZE", "500"))
+
+
+def workout_load_options():
+    return (
+        selectinload(Workout.logged_exercises)
+        .joinedload(LoggedExercise.exercise),
+        selectinload(Workout.logged_exercises)
+        .selectinload(LoggedExercise.sets),
+    )
+
+
+def logged_exercise_load_options():
+    return (
+        joinedload(LoggedExercise.exercise),
+        selectinload(LoggedExercise.sets),
+    )
@@ -3,6 +3,30 @@ from uuid import UUID
 from src.backend.models.logged_exercise import LoggedExercise
 from src.backend.schemas.logged_exercise import LoggedExerciseCreate
 from src.backend.models.logged_exercise_set import LoggedExerciseSet
+from src.backend.models.workout import Workout
+from src.backend.crud.loading import logged_exercise_load_options
+from src.backend.crud.records import recompute_records, record_new_sets
+from src.backend.crud.rollup import RollupDeltas
+
+def _apply_set_changes(db: Session, workout_id: UUID, exercise_id: UUID, sets, sign: int):
+    # Keep the workout owner's rollups and personal records in step with added (sign=1) or removed sets.
+    workout = (
+        db.query(Workout.user_id, Workout.workout_type, Workout.created_time)
+        .filter(Workout.id == workout_id)
+        .first()
+    )
+    if workout is None:
+        return
+    deltas = RollupDeltas()
+    deltas.add(workout.user_id, workout.workout_type, workout.created_time, sets, sign=sign, workouts=0)
+    deltas.apply(db)
+    if sign > 0:
+        record_new_sets(db, [
+            (workout.user_id, exercise_id, reps, weight, workout_id, workout.created_time)
+            for reps, weight in sets
+        ])
+    else:
+        recompute_records(db, workout.user_id, {(exercise_id, reps) for reps, _ in sets})
 
 def log_exercise(db: Session, log_data: LoggedExerciseCreate, workout_id: UUID):
     logged_sets = [
@@ -21,13 +45,19 @@ def log_exercise(db: Session, log_data: LoggedExerciseCreate, workout_id: UUID):
     )
 
     db.add(log_entry)
+    _apply_set_changes(db, workout_id, log_data.exercise_id, [(s.reps, s.weight) for s in log_data.sets], sign=1)
     db.commit()
     db.refresh(log_entry)
     return log_entry
 
 
 def get_logged_exercises_by_workout(db: Session, workout_id: UUID):
-    return db.query(LoggedExercise).filter(LoggedExercise.workout_id == workout_id).all()
+    return (
+        db.query(LoggedExercise)
+        .options(*logged_exercise_load_options())
+        .filter(LoggedExercise.workout_id == workout_id)
+        .all()
+    )
 
 def delete_logged_exercise(db: Session, workout_id: UUID, exercise_id: UUID):
     log_entry = db.query(LoggedExercise).filter(
@@ -36,6 +66,8 @@ def delete_logged_exercise(db: Session, workout_id: UUID, exercise_id: UUID):
     ).first()
     if not log_entry:
         return False
+    sets = [(s.reps, s.weight) for s in log_entry.sets]
     db.delete(log_entry)
+    _apply_set_changes(db, workout_id, exercise_id, sets, sign=-1)
     db.commit()
     return True
\ No newline at end of file
@@ -0,0 +1,50 @@
+import base64
+import json
+from datetime import datetime
+from sqlalchemy import and_, or_
+from uuid import UUID
+from src.backend.models.workout import Workout
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Keyset pagination over workouts ordered newest first by (created_time, id).
+# Each page is a range scan that starts right after the previous page's last row,
+# so fetching page 1000 costs the same as fetching page 1 (unlike OFFSET).
+
+def encode_cursor(workout: Workout) -> str:
+    payload = json.dumps([workout.created_time.isoformat(), workout.id.hex])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_time, workout_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_time), UUID(workout_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+def paginate_workouts(query, limit: int, cursor: str = None):
+    """
+    Apply newest-first keyset pagination to a Workout query.
+    Returns the page of workouts and the cursor for the next page (None on the last page).
+    """
+    if cursor:
+        created_time, workout_id = decode_cursor(cursor)
+        query = query.filter(
+            or_(
+                Workout.created_time < created_time,
+                and_(Workout.created_time == created_time, Workout.id < workout_id)
+            )
+        )
+
+    rows = (
+        query
+        .order_by(Workout.created_time.desc(), Workout.id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, encode_cursor(rows[-1])
+    return rows, None
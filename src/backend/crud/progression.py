@@ -0,0 +1,101 @@
+import os
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session
+from uuid import UUID
+from src.backend.cache import TTLCache, user_write_version
+from src.backend.crud.user import resolve_user_id
+from src.backend.models.workout import Workout
+from src.backend.models.logged_exercise import LoggedExercise
+from src.backend.models.logged_exercise_set import LoggedExerciseSet
+
+# (user id, users.write_version, exercise id) -> progression series, stored as a tuple so cached
+# values are never shared mutable state. Every workout write bumps the version in the database,
+# so entries filled before it miss in every worker and process. The version is read before the
+# series, so a fill that races a write can only store newer rows under the older version, which
+# is never asked for again. Superseded entries age out through the LRU bound and the TTL.
+progression_cache = TTLCache(
+    "exercise_progression",
+    maxsize=int(os.getenv("PROGRESSION_CACHE_SIZE", "10000")),
+    ttl=float(os.getenv("PROGRESSION_CACHE_TTL", "300")),
+)
+
+def estimated_one_rep_max(reps: int, weight: float) -> float:
+    """
+    Epley estimate; a single is taken at face value and a set with no reps estimates nothing.
+    """
+    if reps <= 0:
+        return 0.0
+    if reps == 1:
+        return weight
+    return weight * (1 + reps / 30)
+
+def estimated_one_rep_max_sql(reps, weight):
+    return case(
+        (reps <= 0, 0.0),
+        (reps == 1, weight),
+        else_=weight * (1 + reps / 30.0),
+    )
+
+def progression_query(user_id: UUID, exercise_id: UUID):
+    """
+    One row per session (workout) that logged the exercise, oldest first: the top set
+    (heaviest weight, most reps on ties), best estimated 1RM, set count and total volume.
+    Computed with window functions so only the per-session rows leave the database.
+    """
+    session = LoggedExercise.workout_id
+    e1rm = estimated_one_rep_max_sql(LoggedExerciseSet.reps, LoggedExerciseSet.weight)
+    sets = (
+        select(
+            session.label("workout_id"),
+            Workout.created_time.label("created_time"),
+            LoggedExerciseSet.reps.label("reps"),
+            LoggedExerciseSet.weight.label("weight"),
+            func.row_number().over(
+                partition_by=session,
+                order_by=(LoggedExerciseSet.weight.desc(), LoggedExerciseSet.reps.desc())
+            ).label("rank"),
+            func.max(e1rm).over(partition_by=session).label("estimated_1rm"),
+            func.count().over(partition_by=session).label("set_count"),
+            func.sum(LoggedExerciseSet.reps * LoggedExerciseSet.weight).over(partition_by=session).label("volume"),
+        )
+        .join(LoggedExercise, LoggedExercise.workout_id == Workout.id)
+        .join(LoggedExerciseSet, LoggedExerciseSet.logged_exercise_id == LoggedExercise.id)
+        .where(Workout.user_id == user_id, LoggedExercise.exercise_id == exercise_id)
+        .subquery()
+    )
+    return (
+        select(
+            sets.c.workout_id, sets.c.created_time, sets.c.reps, sets.c.weight,
+            sets.c.estimated_1rm, sets.c.set_count, sets.c.volume,
+        )
+        .where(sets.c.rank == 1)
+        .order_by(sets.c.created_time, sets.c.workout_id)
+    )
+
+def get_exercise_progression(username: str, exercise_id: UUID, db: Session):
+    """
+    Per-session top set, estimated 1RM and volume for one exercise, oldest first.
+    Served from cache until the user's next write, made by any process: a hit costs one
+    primary-key read of the user's write_version.
+    """
+    user_id = resolve_user_id(db, username)
+    if not user_id:
+        return []
+    key = (user_id, user_write_version(db, user_id), exercise_id)
+    series = progression_cache.get(key)
+    if series is not None:
+        return list(series)
+
+    series = tuple(
+        {
+            "workout_id": row.workout_id,
+            "created_time": row.created_time,
+            "top_set": {"reps": row.reps, "weight": row.weight},
+            "estimated_1rm": float(row.estimated_1rm),
+            "set_count": row.set_count,
+            "total_volume": float(row.volume or 0.0),
+        }
+        for row in db.execute(progression_query(user_id, exercise_id))
+    )
+    progression_cache.set(key, series)
+    return list(series)
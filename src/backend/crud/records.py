@@ -0,0 +1,210 @@
+from sqlalchemy import delete, func, insert, select, tuple_
+from sqlalchemy.orm import Session
+from uuid import UUID
+from src.backend.cache.exercise_catalog import exercise_catalog
+from src.backend.crud.progression import estimated_one_rep_max
+from src.backend.crud.user import resolve_user_id
+from src.backend.models.personal_record import PersonalRecord
+from src.backend.models.workout import Workout
+from src.backend.models.logged_exercise import LoggedExercise
+from src.backend.models.logged_exercise_set import LoggedExerciseSet
+
+# Keys per IN (...) lookup, well under the bind-parameter limits of every supported backend.
+RECORD_LOOKUP_CHUNK = 500
+
+def best_sets(entries):
+    """
+    Reduce (user_id, exercise_id, reps, weight, workout_id, achieved_at) set entries to the best
+    one per (user, exercise, reps): heaviest weight, first seen on ties. Sets with no reps are ignored.
+    """
+    best = {}
+    for user_id, exercise_id, reps, weight, workout_id, achieved_at in entries:
+        if reps <= 0:
+            continue
+        key = (user_id, exercise_id, reps)
+        current = best.get(key)
+        if current is None or weight > current[0]:
+            best[key] = (weight, workout_id, achieved_at)
+    return best
+
+def _stored_records(db: Session, keys, for_update: bool = False):
+    keys = list(keys)
+    columns = tuple_(PersonalRecord.user_id, PersonalRecord.exercise_id, PersonalRecord.reps)
+    records = {}
+    for start in range(0, len(keys), RECORD_LOOKUP_CHUNK):
+        query = (
+            db.query(PersonalRecord)
+            .filter(columns.in_(keys[start:start + RECORD_LOOKUP_CHUNK]))
+            # Records may have been raised by an upsert earlier in this transaction.
+            .populate_existing()
+        )
+        if for_update:
+            # A locking read returns the latest committed row, not the transaction's snapshot.
+            query = query.with_for_update()
+        for record in query:
+            records[(record.user_id, record.exercise_id, record.reps)] = record
+    return records
+
+def _set_record(record: PersonalRecord, weight: float, workout_id: UUID, achieved_at):
+    record.weight = weight
+    record.estimated_1rm = estimated_one_rep_max(record.reps, weight)
+    record.workout_id = workout_id
+    record.achieved_at = achieved_at
+
+_RECORD_FIELDS = ("estimated_1rm", "workout_id", "achieved_at")
+
+def _upsert_keeping_heavier(db: Session):
+    # Dialect-native "insert the record, or replace the stored one only if this weight beats it",
+    # so two requests setting the first record for a key at once cannot both try to INSERT it.
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+        stmt = mysql_insert(PersonalRecord)
+        beaten = stmt.inserted.weight > PersonalRecord.weight
+        # MySQL applies the assignments in order, so weight is compared before it is raised.
+        return stmt.on_duplicate_key_update([
+            *((name, func.if_(beaten, stmt.inserted[name], getattr(PersonalRecord, name))) for name in _RECORD_FIELDS),
+            ("weight", func.greatest(PersonalRecord.weight, stmt.inserted.weight)),
+        ])
+    if dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        stmt = dialect_insert(PersonalRecord)
+        return stmt.on_conflict_do_update(
+            index_elements=["user_id", "exercise_id", "reps"],
+            set_={name: stmt.excluded[name] for name in ("weight", *_RECORD_FIELDS)},
+            where=stmt.excluded.weight > PersonalRecord.weight,
+        )
+    return insert(PersonalRecord)
+
+def record_new_sets(db: Session, entries):
+    """
+    Raise stored records with newly written sets. Records are fetched in a single keyed query,
+    and the new or beaten ones are written in one upsert that keeps the heavier weight if a
+    concurrent write got there first. Returns the records that were set or beaten, as read back
+    after the upsert: a set that a concurrent write matched or beat first is not reported.
+    """
+    candidates = best_sets(entries)
+    if not candidates:
+        return []
+    stored = _stored_records(db, candidates)
+    improved = []
+    for (user_id, exercise_id, reps), (weight, workout_id, achieved_at) in candidates.items():
+        record = stored.get((user_id, exercise_id, reps))
+        if record is not None and weight <= record.weight:
+            continue
+        record = PersonalRecord(user_id=user_id, exercise_id=exercise_id, reps=reps)
+        _set_record(record, weight, workout_id, achieved_at)
+        improved.append(record)
+    if improved:
+        db.execute(_upsert_keeping_heavier(db), [
+            {column: getattr(record, column) for column in ("user_id", "exercise_id", "reps", "weight", *_RECORD_FIELDS)}
+            for record in improved
+        ])
+        held = _stored_records(db, ((r.user_id, r.exercise_id, r.reps) for r in improved), for_update=True)
+        improved = [
+            record for record in improved
+            if (stored_record := held.get((record.user_id, record.exercise_id, record.reps))) is not None
+            and stored_record.workout_id == record.workout_id and stored_record.weight == record.weight
+        ]
+    return improved
+
+def _ranked_sets(*filters):
+    # Best set first within each (user, exercise, reps).
+    return (
+        select(
+            Workout.user_id, LoggedExercise.exercise_id, LoggedExerciseSet.reps, LoggedExerciseSet.weight,
+            Workout.id.label("workout_id"), Workout.created_time,
+            func.row_number().over(
+                partition_by=(Workout.user_id, LoggedExercise.exercise_id, LoggedExerciseSet.reps),
+                order_by=(LoggedExerciseSet.weight.desc(), Workout.created_time, Workout.id)
+            ).label("rank"),
+        )
+        .join(LoggedExercise, LoggedExercise.workout_id == Workout.id)
+        .join(LoggedExerciseSet, LoggedExerciseSet.logged_exercise_id == LoggedExercise.id)
+        .where(LoggedExerciseSet.reps > 0, *filters)
+        .subquery()
+    )
+
+def recompute_records(db: Session, user_id: UUID, keys):
+    """
+    Re-derive one user's records for the given (exercise_id, reps) keys from their remaining sets,
+    after the sets that may have held them were edited or deleted.
+    """
+    keys = list({(exercise_id, reps) for exercise_id, reps in keys if reps > 0})
+    if not keys:
+        return
+    db.flush()
+    columns = tuple_(LoggedExercise.exercise_id, LoggedExerciseSet.reps)
+    best = {}
+    for start in range(0, len(keys), RECORD_LOOKUP_CHUNK):
+        ranked = _ranked_sets(Workout.user_id == user_id, columns.in_(keys[start:start + RECORD_LOOKUP_CHUNK]))
+        for row in db.execute(select(ranked).where(ranked.c.rank == 1)):
+            best[(row.exercise_id, row.reps)] = row
+    stored = _stored_records(db, ((user_id, exercise_id, reps) for exercise_id, reps in keys))
+
+    for exercise_id, reps in keys:
+        row = best.get((exercise_id, reps))
+        record = stored.get((user_id, exercise_id, reps))
+        if row is None:
+            if record is not None:
+                db.delete(record)
+            continue
+        if record is None:
+            record = PersonalRecord(user_id=user_id, exercise_id=exercise_id, reps=reps)
+            db.add(record)
+        _set_record(record, row.weight, row.workout_id, row.created_time)
+
+def rebuild_records(db, user_id: UUID = None):
+    """
+    Recompute personal records from the raw workout tables, for one user or for everyone.
+    Runs in the caller's transaction. Returns the number of records written.
+    """
+    ranked = _ranked_sets(*(() if user_id is None else (Workout.user_id == user_id,)))
+    clear = delete(PersonalRecord)
+    if user_id is not None:
+        clear = clear.where(PersonalRecord.user_id == user_id)
+
+    rows = [
+        {
+            "user_id": row.user_id,
+            "exercise_id": row.exercise_id,
+            "reps": row.reps,
+            "weight": row.weight,
+            "estimated_1rm": estimated_one_rep_max(row.reps, row.weight),
+            "workout_id": row.workout_id,
+            "achieved_at": row.created_time,
+        }
+        for row in db.execute(select(ranked).where(ranked.c.rank == 1))
+    ]
+    db.execute(clear)
+    if rows:
+        db.execute(insert(PersonalRecord), rows)
+    return len(rows)
+
+def record_out(db: Session, record: PersonalRecord):
+    exercise = exercise_catalog.get_by_id(db, record.exercise_id)
+    return {
+        "exercise_id": record.exercise_id,
+        "exercise_name": exercise.name if exercise else None,
+        "reps": record.reps,
+        "weight": record.weight,
+        "estimated_1rm": record.estimated_1rm,
+        "workout_id": record.workout_id,
+        "achieved_at": record.achieved_at,
+    }
+
+def get_personal_records(username: str, db: Session, exercise_id: UUID = None):
+    """
+    A user's records ordered by exercise name then rep count; optionally for one exercise.
+    """
+    user_id = resolve_user_id(db, username)
+    if not user_id:
+        return []
+    query = db.query(PersonalRecord).filter(PersonalRecord.user_id == user_id)
+    if exercise_id is not None:
+        query = query.filter(PersonalRecord.exercise_id == exercise_id)
+    records = [record_out(db, record) for record in query]
+    return sorted(records, key=lambda r: ((r["exercise_name"] or "").lower(), r["reps"]))
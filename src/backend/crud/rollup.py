@@ -0,0 +1,143 @@
+from collections import defaultdict
+from datetime import datetime
+from sqlalchemy import delete, distinct, extract, func, insert, select
+from uuid import UUID
+from src.backend.cache import mark_user_written
+from src.backend.models.enums import ExerciseGroup
+from src.backend.models.workout import Workout
+from src.backend.models.logged_exercise import LoggedExercise
+from src.backend.models.logged_exercise_set import LoggedExerciseSet
+from src.backend.models.workout_rollup import WorkoutRollup, ALL_TIME, UNCATEGORIZED
+
+# Every workout contributes to four rollup rows: its month and ALL_TIME, each under its own
+# workout type and under ALL_TYPES. Any (period, type) read is then a primary-key lookup.
+ALL_TYPES = "*"
+
+TOTALS = ("workout_count", "set_count", "total_reps", "total_volume")
+
+def period_key(created_time: datetime) -> str:
+    return f"{created_time.year:04d}-{created_time.month:02d}"
+
+def workout_type_key(workout_type) -> str:
+    if workout_type is None:
+        return UNCATEGORIZED
+    return ExerciseGroup(workout_type).value
+
+def _upsert_adding_totals(db):
+    # Dialect-native "insert the row, or add to the existing one's totals", so two requests that
+    # write the first workout of a (user, period, type) at once cannot both try to INSERT it.
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+        stmt = mysql_insert(WorkoutRollup)
+        return stmt.on_duplicate_key_update({name: getattr(WorkoutRollup, name) + stmt.inserted[name] for name in TOTALS})
+    if dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        stmt = dialect_insert(WorkoutRollup)
+        return stmt.on_conflict_do_update(
+            index_elements=["user_id", "period", "workout_type"],
+            set_={name: getattr(WorkoutRollup, name) + stmt.excluded[name] for name in TOTALS},
+        )
+    return insert(WorkoutRollup)
+
+class RollupDeltas:
+    """
+    Accumulates signed changes to a user's rollup rows during a write, then applies them with
+    one multi-row upsert that adds each delta to its row (creating rows that do not exist yet).
+    Rows left with no workouts are deleted, so the table always matches rebuild_rollups().
+    """
+
+    def __init__(self):
+        self._deltas = defaultdict(lambda: [0, 0, 0, 0.0])
+
+    def add(self, user_id: UUID, workout_type, created_time: datetime, sets, sign: int = 1, workouts: int = 1):
+        """
+        Record a workout (or, with workouts=0, just some of its sets) being added (sign=1)
+        or removed (sign=-1). `sets` is an iterable of (reps, weight) pairs.
+        """
+        set_count, reps, volume = 0, 0, 0.0
+        for set_reps, set_weight in sets:
+            set_count += 1
+            reps += set_reps
+            volume += set_reps * set_weight
+        for period in (period_key(created_time), ALL_TIME):
+            for type_key in (workout_type_key(workout_type), ALL_TYPES):
+                totals = self._deltas[(user_id, period, type_key)]
+                totals[0] += sign * workouts
+                totals[1] += sign * set_count
+                totals[2] += sign * reps
+                totals[3] += sign * volume
+
+    def apply(self, db):
+        rows = []
+        emptied_users = set()
+        for (user_id, period, type_key), totals in self._deltas.items():
+            mark_user_written(db, user_id)
+            if not any(totals):
+                continue
+            rows.append({"user_id": user_id, "period": period, "workout_type": type_key, **dict(zip(TOTALS, totals))})
+            if totals[0] < 0:
+                emptied_users.add(user_id)
+        self._deltas.clear()
+        if not rows:
+            return
+        db.execute(_upsert_adding_totals(db), rows)
+        if emptied_users:
+            db.execute(
+                delete(WorkoutRollup)
+                .where(WorkoutRollup.user_id.in_(emptied_users), WorkoutRollup.workout_count <= 0)
+                .execution_options(synchronize_session=False)
+            )
+
+def workout_sets(workout: Workout):
+    return [(s.reps, s.weight) for le in workout.logged_exercises for s in le.sets]
+
+def get_rollup(db, user_id: UUID, period: str = ALL_TIME, workout_type: str = ALL_TYPES):
+    return db.get(WorkoutRollup, (user_id, period, workout_type))
+
+def rebuild_rollups(db, user_id: UUID = None):
+    """
+    Recompute rollup rows from the raw workout tables, for one user or for everyone.
+    Used for backfill and to repair drift; runs in the caller's transaction.
+    Returns the number of rollup rows written.
+    """
+    year = extract("year", Workout.created_time)
+    month = extract("month", Workout.created_time)
+    query = (
+        select(
+            Workout.user_id, Workout.workout_type, year, month,
+            func.count(distinct(Workout.id)),
+            func.count(LoggedExerciseSet.id),
+            func.coalesce(func.sum(LoggedExerciseSet.reps), 0),
+            func.coalesce(func.sum(LoggedExerciseSet.reps * LoggedExerciseSet.weight), 0),
+        )
+        .select_from(Workout)
+        .outerjoin(LoggedExercise, LoggedExercise.workout_id == Workout.id)
+        .outerjoin(LoggedExerciseSet, LoggedExerciseSet.logged_exercise_id == LoggedExercise.id)
+        .group_by(Workout.user_id, Workout.workout_type, year, month)
+    )
+    clear = delete(WorkoutRollup)
+    if user_id is not None:
+        query = query.where(Workout.user_id == user_id)
+        clear = clear.where(WorkoutRollup.user_id == user_id)
+
+    rows = defaultdict(lambda: [0, 0, 0, 0.0])
+    for row_user_id, workout_type, y, m, workouts, sets, reps, volume in db.execute(query):
+        for period in (f"{int(y):04d}-{int(m):02d}", ALL_TIME):
+            for type_key in (workout_type_key(workout_type), ALL_TYPES):
+                totals = rows[(row_user_id, period, type_key)]
+                totals[0] += workouts
+                totals[1] += sets
+                totals[2] += int(reps)
+                totals[3] += float(volume)
+
+    db.execute(clear)
+    if rows:
+        db.execute(insert(WorkoutRollup), [
+            {"user_id": key[0], "period": key[1], "workout_type": key[2], **dict(zip(TOTALS, totals))}
+            for key, totals in rows.items()
+        ])
+    return len(rows)
@@ -1,8 +1,50 @@
+import os
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from uuid import UUID
+from src.backend.cache import TTLCache, mark_user_written
+from src.backend.crud.cascade import delete_user_workouts
+from src.backend.crud.loading import STREAM_CHUNK_SIZE
 from src.backend.models.user import User
+from src.backend.models.personal_record import PersonalRecord
+from src.backend.models.workout_rollup import WorkoutRollup
 from src.backend.schemas.user import UserCreate, UserUpdate
 
+# username -> user id, so per-user workout queries can filter on workouts.user_id without joining users.
+# The TTL bounds staleness across workers; writes in this process invalidate immediately.
+user_id_cache = TTLCache(
+    "user_ids",
+    maxsize=int(os.getenv("USER_ID_CACHE_SIZE", "10000")),
+    ttl=float(os.getenv("USER_ID_CACHE_TTL", "300")),
+)
+
+def resolve_user_id(db: Session, username: str):
+    user_id = user_id_cache.get(username)
+    if user_id is None:
+        user_id = db.query(User.id).filter(User.username == username).scalar()
+        if user_id is not None:
+            user_id_cache.set(username, user_id)
+    return user_id
+
+def resolve_user_ids(db: Session, usernames):
+    """
+    Resolve many usernames at once; cache misses are looked up in a single IN query.
+    Unknown usernames are left out of the returned {username: id} mapping.
+    """
+    resolved = {}
+    misses = set()
+    for username in usernames:
+        user_id = user_id_cache.get(username)
+        if user_id is None:
+            misses.add(username)
+        else:
+            resolved[username] = user_id
+    if misses:
+        for username, user_id in db.query(User.username, User.id).filter(User.username.in_(misses)):
+            user_id_cache.set(username, user_id)
+            resolved[username] = user_id
+    return resolved
+
 def create_user(db: Session, user_data: UserCreate):
     user = User(**user_data.model_dump())
     db.add(user)
@@ -16,20 +58,39 @@ def get_user_by_id(db: Session, user_id: UUID):
 def get_all_users(db: Session):
     return db.query(User).all()
 
+def iter_all_users(db: Session, chunk_size: int = STREAM_CHUNK_SIZE):
+    """
+    Every user, fetched `chunk_size` rows at a time.
+    """
+    return db.scalars(select(User).execution_options(yield_per=chunk_size))
+
 def update_user(db: Session, user_id: UUID, updates: UserUpdate):
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
         return None
+    old_username = user.username
     for field, value in updates.model_dump(exclude_unset=True).items():
         setattr(user, field, value)
     db.commit()
     db.refresh(user)
+    user_id_cache.invalidate(old_username)
+    user_id_cache.invalidate(user.username)
     return user
 
 def delete_user(db: Session, user_id: UUID):
+    """
+    Delete a user and their whole history. Workouts go first, in committed batches; the user row,
+    rollups and records go last in one transaction, so an interrupted delete can simply be retried.
+    """
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
         return False
+    username = user.username
+    delete_user_workouts(db, user_id)
+    mark_user_written(db, user_id)
+    db.query(WorkoutRollup).filter(WorkoutRollup.user_id == user_id).delete(synchronize_session=False)
+    db.query(PersonalRecord).filter(PersonalRecord.user_id == user_id).delete(synchronize_session=False)
     db.delete(user)
     db.commit()
-    return True
\ No newline at end of file
+    user_id_cache.invalidate(username)
+    return True
@@ -1,140 +1,389 @@
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from dateutil.relativedelta import relativedelta
-from http.client import HTTPException
-from src.backend.models.user import User
+from fastapi import HTTPException
+from src.backend.database.functions import weekday
 from src.backend.models.enums import ExerciseGroup
-from src.backend.models.exercise import Exercise
 from src.backend.models.workout import Workout
 from src.backend.models.logged_exercise import LoggedExercise
 from src.backend.models.logged_exercise_set import LoggedExerciseSet
+from src.backend.crud.cascade import delete_workout_rows
+from src.backend.crud.loading import STREAM_CHUNK_SIZE, workout_load_options
+from src.backend.crud.pagination import paginate_workouts
+from src.backend.crud.exercise import exercises_not_found_detail, resolve_exercise_ids
+from src.backend.crud.user import resolve_user_id, resolve_user_ids
+from src.backend.crud.records import recompute_records, record_new_sets
+from src.backend.crud.rollup import ALL_TYPES, RollupDeltas, get_rollup, workout_sets
+from src.backend.models.workout_rollup import ALL_TIME, WorkoutRollup
 from src.backend.schemas.workout import WorkoutCreateSimple, WorkoutUpdate
+from sqlalchemy import delete, extract, func, insert, or_, select, update
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
+from typing import List
 from uuid import UUID, uuid4
 
-def create_workout(db: Session, workout_data: WorkoutCreateSimple):
-    user = db.query(User).filter(User.username == workout_data.username).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    logged_exercises = []
+def build_workout_rows(user_id: UUID, workout_data: WorkoutCreateSimple, exercise_ids: dict):
+    """
+    Flatten a workout payload into plain rows for the workouts, logged_exercises and
+    logged_exercise_sets tables so they can be written with multi-row INSERTs.
+    `exercise_ids` maps lowercased exercise names to ids.
+    """
+    workout_id = uuid4()
+    workout_row = {
+        "id": workout_id,
+        "user_id": user_id,
+        "created_time": workout_data.created_time or datetime.now(timezone.utc),
+        "notes": workout_data.notes,
+        "workout_type": workout_data.workout_type,
+    }
+    logged_exercise_rows = []
+    set_rows = []
     for entry in workout_data.logged_exercises:
-        exercise = db.query(Exercise).filter(Exercise.name == entry.name).first()
-        if not exercise:
-            raise HTTPException(status_code=404, detail=f"Exercise '{entry.name}' not found")
-
-        # Create set entries
-        logged_sets = [
-            LoggedExerciseSet(
-                set_number=s.set_number,
-                reps=s.reps,
-                weight=s.weight
-            )
+        logged_exercise_id = uuid4()
+        logged_exercise_rows.append({
+            "id": logged_exercise_id,
+            "workout_id": workout_id,
+            "exercise_id": exercise_ids[entry.name.lower()],
+        })
+        set_rows.extend(
+            {
+                "id": uuid4(),
+                "logged_exercise_id": logged_exercise_id,
+                "set_number": s.set_number,
+                "reps": s.reps,
+                "weight": s.weight,
+            }
             for s in entry.sets
-        ]
-
-        logged_exercise = LoggedExercise(
-            exercise_id=exercise.id,
-            sets=logged_sets
         )
-        logged_exercises.append(logged_exercise)
-
-    workout = Workout(
-        user_id=user.id,
-        created_time=workout_data.created_time,
-        notes=workout_data.notes,
-        workout_type=workout_data.workout_type,
-        logged_exercises=logged_exercises
+    return workout_row, logged_exercise_rows, set_rows
+
+def add_workout_rows_to_rollup(deltas: RollupDeltas, workout_row: dict, set_rows: list):
+    deltas.add(
+        workout_row["user_id"], workout_row["workout_type"], workout_row["created_time"],
+        ((row["reps"], row["weight"]) for row in set_rows)
     )
 
-    db.add(workout)
+def workout_row_set_entries(workout_row: dict, logged_exercise_rows: list, set_rows: list):
+    # (user_id, exercise_id, reps, weight, workout_id, achieved_at) per set, for record tracking.
+    exercise_ids = {row["id"]: row["exercise_id"] for row in logged_exercise_rows}
+    return [
+        (workout_row["user_id"], exercise_ids[row["logged_exercise_id"]], row["reps"], row["weight"],
+         workout_row["id"], workout_row["created_time"])
+        for row in set_rows
+    ]
+
+def workout_record_keys(workout: Workout):
+    return {(le.exercise_id, s.reps) for le in workout.logged_exercises for s in le.sets}
+
+def insert_workout_rows(db: Session, workout_rows: list, logged_exercise_rows: list, set_rows: list):
+    # One multi-row INSERT per table, parents first for the foreign keys.
+    for model, rows in ((Workout, workout_rows), (LoggedExercise, logged_exercise_rows), (LoggedExerciseSet, set_rows)):
+        if rows:
+            db.execute(insert(model), rows)
+
+def create_workout(db: Session, workout_data: WorkoutCreateSimple):
+    user_id = resolve_user_id(db, workout_data.username)
+    if not user_id:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    exercise_ids, missing = resolve_exercise_ids(db, (entry.name for entry in workout_data.logged_exercises))
+    if missing:
+        raise HTTPException(status_code=404, detail=exercises_not_found_detail(missing))
+
+    workout_row, logged_exercise_rows, set_rows = build_workout_rows(user_id, workout_data, exercise_ids)
+    insert_workout_rows(db, [workout_row], logged_exercise_rows, set_rows)
+    deltas = RollupDeltas()
+    add_workout_rows_to_rollup(deltas, workout_row, set_rows)
+    deltas.apply(db)
+    new_records = record_new_sets(db, workout_row_set_entries(workout_row, logged_exercise_rows, set_rows))
+    new_records = [(r.exercise_id, r.reps, r.weight, r.estimated_1rm) for r in new_records]
     db.commit()
-    db.refresh(workout)
 
+    workout = get_workout_by_workout_id(db, workout_row["id"])
+    workout.new_records = [
+        {"exercise_id": exercise_id, "reps": reps, "weight": weight, "estimated_1rm": e1rm}
+        for exercise_id, reps, weight, e1rm in new_records
+    ]
     return workout
 
 
+def create_workouts_bulk(db: Session, workouts: List[WorkoutCreateSimple]):
+    """
+    Insert many workouts in one transaction with one multi-row INSERT per table.
+    Workouts with an unknown user or exercise are skipped and reported; the rest are committed together.
+    Returns one {"id": ...} or {"error": ...} result per input workout, in order.
+    """
+    user_ids = resolve_user_ids(db, {w.username for w in workouts})
+    exercise_ids, _ = resolve_exercise_ids(
+        db, {entry.name for w in workouts for entry in w.logged_exercises}
+    )
+
+    results = []
+    workout_rows, logged_exercise_rows, set_rows = [], [], []
+    record_entries = []
+    deltas = RollupDeltas()
+    for workout_data in workouts:
+        user_id = user_ids.get(workout_data.username)
+        if not user_id:
+            results.append({"error": "User not found"})
+            continue
+        missing = [e.name for e in workout_data.logged_exercises if e.name.lower() not in exercise_ids]
+        if missing:
+            results.append({"error": exercises_not_found_detail(missing)})
+            continue
+        workout_row, le_rows, workout_set_rows = build_workout_rows(user_id, workout_data, exercise_ids)
+        workout_rows.append(workout_row)
+        logged_exercise_rows.extend(le_rows)
+        set_rows.extend(workout_set_rows)
+        add_workout_rows_to_rollup(deltas, workout_row, workout_set_rows)
+        record_entries.extend(workout_row_set_entries(workout_row, le_rows, workout_set_rows))
+        results.append({"id": workout_row["id"]})
+
+    try:
+        insert_workout_rows(db, workout_rows, logged_exercise_rows, set_rows)
+        deltas.apply(db)
+        record_new_sets(db, record_entries)
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        error = f"Batch insert failed: {e.__class__.__name__}"
+        results = [{"error": r.get("error", error)} for r in results]
+    return results
+
 def get_workout_by_workout_id(db: Session, workout_id: UUID):
-    return db.query(Workout).filter(Workout.id == workout_id).first()
+    return (
+        db.query(Workout)
+        .options(*workout_load_options())
+        .filter(Workout.id == workout_id)
+        .first()
+    )
 
 def get_last_workout(username: str, db: Session):
+    user_id = resolve_user_id(db, username)
+    if not user_id:
+        return None
     return ( 
         db.query(Workout)
-        .join(User, Workout.user_id == User.id)
-        .filter(User.username == username)
+        .options(*workout_load_options())
+        .filter(Workout.user_id == user_id)
         .order_by(Workout.created_time.desc())
         .first()
     )
 
 def get_all_workouts_by_name(username: str, db: Session):
+    user_id = resolve_user_id(db, username)
+    if not user_id:
+        return []
     return (
         db.query(Workout)
-        .join(User, Workout.user_id == User.id)
-        .filter(User.username == username)
+        .options(*workout_load_options())
+        .filter(Workout.user_id == user_id)
         .order_by(Workout.created_time.desc())
         .all()
     )
 
+def get_workouts_page_by_name(username: str, db: Session, limit: int, cursor: str = None):
+    user_id = resolve_user_id(db, username)
+    if not user_id:
+        return [], None
+    query = (
+        db.query(Workout)
+        .options(*workout_load_options())
+        .filter(Workout.user_id == user_id)
+    )
+    return paginate_workouts(query, limit, cursor)
+
 def get_last_workout_based_on_username_and_type(username: str, workout_type: str, db: Session):
+    user_id = resolve_user_id(db, username)
+    if not user_id:
+        return None
     return ( 
         db.query(Workout)
-        .join(User, Workout.user_id == User.id)
-        .filter(User.username == username, Workout.workout_type == ExerciseGroup(workout_type))
+        .options(*workout_load_options())
+        .filter(Workout.user_id == user_id, Workout.workout_type == ExerciseGroup(workout_type))
         .order_by(Workout.created_time.desc())
         .first()
     )
 
 def get_all_workouts(db: Session):
-    return db.query(Workout).all()
+    return db.query(Workout).options(*workout_load_options()).all()
+
+def iter_all_workouts(db: Session, chunk_size: int = STREAM_CHUNK_SIZE):
+    """
+    Every workout with its graph loaded, newest first, fetched as keyset pages of `chunk_size`.
+    Pages that have been consumed are released, so memory stays bounded however many workouts
+    there are. Each page is an ordinary buffered query: a server-side cursor cannot stay open
+    while the selectin loads run on the same connection (PyMySQL drains it after the first chunk).
+    """
+    cursor = None
+    while True:
+        page, cursor = paginate_workouts(db.query(Workout).options(*workout_load_options()), chunk_size, cursor)
+        yield from page
+        if cursor is None:
+            return
+
+def get_workouts_page(db: Session, limit: int, cursor: str = None):
+    query = db.query(Workout).options(*workout_load_options())
+    return paginate_workouts(query, limit, cursor)
+
+@dataclass
+class WorkoutDiff:
+    """
+    Row changes that turn a stored workout's logged exercises and sets into an update payload.
+    `removed_sets` and `added_sets` hold (exercise_id, reps, weight) for rollup and record upkeep;
+    an edited set appears in both.
+    """
+    deleted_logged_exercise_ids: list = field(default_factory=list)
+    deleted_set_ids: list = field(default_factory=list)
+    logged_exercise_rows: list = field(default_factory=list)
+    set_rows: list = field(default_factory=list)
+    set_updates: list = field(default_factory=list)
+    removed_sets: list = field(default_factory=list)
+    added_sets: list = field(default_factory=list)
+
+    def apply(self, db: Session):
+        # One bulk statement per kind of change, children before parents for deletes.
+        if self.deleted_set_ids or self.deleted_logged_exercise_ids:
+            db.execute(
+                delete(LoggedExerciseSet)
+                .where(or_(
+                    LoggedExerciseSet.id.in_(self.deleted_set_ids),
+                    LoggedExerciseSet.logged_exercise_id.in_(self.deleted_logged_exercise_ids),
+                ))
+                .execution_options(synchronize_session=False)
+            )
+        if self.deleted_logged_exercise_ids:
+            db.execute(
+                delete(LoggedExercise)
+                .where(LoggedExercise.id.in_(self.deleted_logged_exercise_ids))
+                .execution_options(synchronize_session=False)
+            )
+        insert_workout_rows(db, [], self.logged_exercise_rows, self.set_rows)
+        if self.set_updates:
+            db.execute(update(LoggedExerciseSet), self.set_updates)
+
+def _diff_sets(diff: WorkoutDiff, logged_exercise: LoggedExercise, sets: list):
+    stored = defaultdict(deque)
+    for s in sorted(logged_exercise.sets, key=lambda s: s.set_number):
+        stored[s.set_number].append(s)
+    exercise_id = logged_exercise.exercise_id
+    for set_data in sets:
+        matches = stored.get(set_data["set_number"])
+        if not matches:
+            diff.set_rows.append({"id": uuid4(), "logged_exercise_id": logged_exercise.id, **set_data})
+            diff.added_sets.append((exercise_id, set_data["reps"], set_data["weight"]))
+            continue
+        s = matches.popleft()
+        if (s.reps, s.weight) != (set_data["reps"], set_data["weight"]):
+            diff.set_updates.append({"id": s.id, "reps": set_data["reps"], "weight": set_data["weight"]})
+            diff.removed_sets.append((exercise_id, s.reps, s.weight))
+            diff.added_sets.append((exercise_id, set_data["reps"], set_data["weight"]))
+    for matches in stored.values():
+        for s in matches:
+            diff.deleted_set_ids.append(s.id)
+            diff.removed_sets.append((exercise_id, s.reps, s.weight))
+
+def diff_logged_exercises(workout: Workout, entries: list, exercise_ids: dict) -> WorkoutDiff:
+    """
+    Compare a workout's stored logged exercises with `entries` (LoggedExerciseCreateByName dicts).
+    Entries pair up with stored logged exercises of the same exercise in order of appearance and
+    sets pair up by set number, so unchanged rows produce no statements at all.
+    `exercise_ids` maps lowercased exercise names to ids.
+    """
+    diff = WorkoutDiff()
+    stored = defaultdict(deque)
+    for logged_exercise in workout.logged_exercises:
+        stored[logged_exercise.exercise_id].append(logged_exercise)
+    for entry in entries:
+        exercise_id = exercise_ids[entry["name"].lower()]
+        matches = stored.get(exercise_id)
+        if matches:
+            _diff_sets(diff, matches.popleft(), entry["sets"])
+            continue
+        logged_exercise_id = uuid4()
+        diff.logged_exercise_rows.append({"id": logged_exercise_id, "workout_id": workout.id, "exercise_id": exercise_id})
+        for set_data in entry["sets"]:
+            diff.set_rows.append({"id": uuid4(), "logged_exercise_id": logged_exercise_id, **set_data})
+            diff.added_sets.append((exercise_id, set_data["reps"], set_data["weight"]))
+    for matches in stored.values():
+        for logged_exercise in matches:
+            diff.deleted_logged_exercise_ids.append(logged_exercise.id)
+            diff.removed_sets.extend((logged_exercise.exercise_id, s.reps, s.weight) for s in logged_exercise.sets)
+    return diff
 
 def update_workout(db: Session, workout_id: UUID, updates: WorkoutUpdate):
-    workout = db.query(Workout).filter(Workout.id == workout_id).first()
+    """
+    Apply a partial update. Logged exercises and sets are diffed against what is stored, so only
+    the rows that actually changed are written, each kind of change with one bulk statement.
+    """
+    workout = get_workout_by_workout_id(db, workout_id)
     if not workout:
         return None
     payload = updates.model_dump(exclude_unset=True)
-    if "logged_exercises" in payload and payload["logged_exercises"]:
-        workout.logged_exercises.clear()
-        for le_data in payload["logged_exercises"]:
-            exercise = db.query(Exercise).filter(Exercise.name == le_data["name"]).first()
-            if not exercise:
-                raise ValueError(f"Exercise '{le_data['name']}' not found.")
-            le = LoggedExercise(
-                id=uuid4(),
-                workout_id=workout.id,
-                exercise_id=exercise.id
-            )
-            db.add(le)
-            for set_data in le_data["sets"]:
-                le_set = LoggedExerciseSet(
-                    id = uuid4(),
-                    logged_exercise_id = le.id,
-                    set_number = set_data["set_number"],
-                    reps=set_data["reps"],
-                    weight=set_data["weight"]
-                )
-                db.add(le_set)
-    for field, value in payload.items():
-        if field != "logged_exercises":
-            setattr(workout, field, value)
+    entries = payload.pop("logged_exercises", None)
+    diff = WorkoutDiff()
+    if entries:
+        exercise_ids, missing = resolve_exercise_ids(db, (entry["name"] for entry in entries))
+        if missing:
+            raise ValueError(exercises_not_found_detail(missing))
+        diff = diff_logged_exercises(workout, entries, exercise_ids)
+
+    old_key = (workout.workout_type, workout.created_time)
+    for name, value in payload.items():
+        if getattr(workout, name) != value:
+            setattr(workout, name, value)
+    new_key = (workout.workout_type, workout.created_time)
+
+    deltas = RollupDeltas()
+    record_keys = {(exercise_id, reps) for exercise_id, reps, _ in diff.removed_sets + diff.added_sets}
+    if new_key != old_key:
+        # The workout moves to other rollup rows (and its records to another date).
+        sets = workout_sets(workout)
+        deltas.add(workout.user_id, *old_key, sets, sign=-1)
+        deltas.add(workout.user_id, *new_key, sets)
+        if new_key[1] != old_key[1]:
+            record_keys |= workout_record_keys(workout)
+    deltas.add(workout.user_id, *new_key, ((r, w) for _, r, w in diff.removed_sets), sign=-1, workouts=0)
+    deltas.add(workout.user_id, *new_key, ((r, w) for _, r, w in diff.added_sets), workouts=0)
+
+    diff.apply(db)
+    deltas.apply(db)
+    recompute_records(db, workout.user_id, record_keys)
     db.commit()
-    db.refresh(workout)
-    return workout
+    return get_workout_by_workout_id(db, workout.id)
 
 def delete_workout(db: Session, workout_id: UUID):
-    workout = db.query(Workout).filter(Workout.id == workout_id).first()
+    workout = db.execute(
+        select(Workout.user_id, Workout.workout_type, Workout.created_time).where(Workout.id == workout_id)
+    ).first()
     if not workout:
         return False
-    db.delete(workout)
+    sets = db.execute(
+        select(LoggedExercise.exercise_id, LoggedExerciseSet.reps, LoggedExerciseSet.weight)
+        .join(LoggedExerciseSet, LoggedExerciseSet.logged_exercise_id == LoggedExercise.id)
+        .where(LoggedExercise.workout_id == workout_id)
+    ).all()
+    deltas = RollupDeltas()
+    deltas.add(workout.user_id, workout.workout_type, workout.created_time, ((reps, weight) for _, reps, weight in sets), sign=-1)
+    delete_workout_rows(db, [workout_id])
+    deltas.apply(db)
+    recompute_records(db, workout.user_id, {(exercise_id, reps) for exercise_id, reps, _ in sets})
     db.commit()
     return True
     
 def calculate_num_workouts_by_month(username: str, db: Session):
-    workouts = get_all_workouts_by_name(username, db)
-    num_workouts = len(workouts)
-    
+    user_id = resolve_user_id(db, username)
+    if not user_id:
+        return 0
+    num_workouts, earliest_time, latest_time = (
+        db.query(func.count(Workout.id), func.min(Workout.created_time), func.max(Workout.created_time))
+        .filter(Workout.user_id == user_id)
+        .one()
+    )
+
     if num_workouts <= 1:
         return num_workouts
-    
-    latest_time = workouts[0].created_time
-    earliest_time = workouts[-1].created_time
 
     diff = relativedelta(latest_time, earliest_time)
     total_months = diff.years * 12 + diff.months + (diff.days / 30)
@@ -143,15 +392,113 @@ def calculate_num_workouts_by_month(username: str, db: Session):
         return float(num_workouts)
 
     return num_workouts / total_months
+
+def get_workout_month_histogram(username: str, db: Session):
+    """
+    Number of workouts per calendar month, oldest first, including empty months between
+    the first and last workout. Read from the user's monthly rollup rows.
+    """
+    user_id = resolve_user_id(db, username)
+    if not user_id:
+        return []
+    rows = (
+        db.query(WorkoutRollup.period, WorkoutRollup.workout_count)
+        .filter(
+            WorkoutRollup.user_id == user_id,
+            WorkoutRollup.workout_type == ALL_TYPES,
+            WorkoutRollup.period != ALL_TIME,
+            WorkoutRollup.workout_count > 0,
+        )
+        .all()
+    )
+    if not rows:
+        return []
+
+    counts = {(int(period[:4]), int(period[5:])): count for period, count in rows}
+    (year, month), last = min(counts), max(counts)
+    histogram = []
+    while (year, month) <= last:
+        histogram.append({"month": f"{year:04d}-{month:02d}", "count": counts.get((year, month), 0)})
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return histogram
     
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+def get_workout_stats(username: str, db: Session):
+    """
+    Per-type, per-month and per-weekday workout counts plus first/last workout time,
+    all folded from a single grouped query.
+    """
+    stats = {
+        "total_workouts": 0,
+        "first_workout": None,
+        "last_workout": None,
+        "by_type": {group.value: 0 for group in ExerciseGroup},
+        "by_month": {},
+        "by_weekday": {day: 0 for day in WEEKDAYS},
+    }
+    user_id = resolve_user_id(db, username)
+    if not user_id:
+        return stats
+
+    year = extract("year", Workout.created_time)
+    month = extract("month", Workout.created_time)
+    day = weekday(Workout.created_time)
+    rows = (
+        db.query(
+            Workout.workout_type, year, month, day,
+            func.count(Workout.id), func.min(Workout.created_time), func.max(Workout.created_time)
+        )
+        .filter(Workout.user_id == user_id)
+        .group_by(Workout.workout_type, year, month, day)
+        .all()
+    )
+
+    by_type, by_month, by_weekday = stats["by_type"], stats["by_month"], stats["by_weekday"]
+    for workout_type, y, m, d, count, first, last in rows:
+        type_key = workout_type.value if workout_type else "Uncategorized"
+        month_key = f"{int(y):04d}-{int(m):02d}"
+        by_type[type_key] = by_type.get(type_key, 0) + count
+        by_month[month_key] = by_month.get(month_key, 0) + count
+        by_weekday[WEEKDAYS[int(d)]] += count
+        stats["total_workouts"] += count
+        if stats["first_workout"] is None or first < stats["first_workout"]:
+            stats["first_workout"] = first
+        if stats["last_workout"] is None or last > stats["last_workout"]:
+            stats["last_workout"] = last
+    stats["by_month"] = dict(sorted(by_month.items()))
+    return stats
+
 def calculate_num_workouts_by_type(username: str, workout_type: str, db: Session):
-    return (
-        db.query(Workout)
-        .join(User, Workout.user_id == User.id)
-        .filter(
-            User.username == username,
-            Workout.workout_type == ExerciseGroup(workout_type)
+    user_id = resolve_user_id(db, username)
+    if not user_id:
+        return 0
+    rollup = get_rollup(db, user_id, ALL_TIME, ExerciseGroup(workout_type).value)
+    return rollup.workout_count if rollup else 0
+
+def get_workout_volume(username: str, db: Session, period: str = ALL_TIME, workout_type: str = None):
+    """
+    Workout count, set count, total reps and total volume (reps x weight) for one period
+    ("YYYY-MM" or "all"), optionally restricted to one workout type. A single rollup row lookup.
+    """
+    type_key = ExerciseGroup(workout_type).value if workout_type else ALL_TYPES
+    volume = {
+        "period": period,
+        "workout_type": workout_type,
+        "workout_count": 0,
+        "set_count": 0,
+        "total_reps": 0,
+        "total_volume": 0.0,
+    }
+    user_id = resolve_user_id(db, username)
+    if not user_id:
+        return volume
+    rollup = get_rollup(db, user_id, period, type_key)
+    if rollup:
+        volume.update(
+            workout_count=rollup.workout_count,
+            set_count=rollup.set_count,
+            total_reps=rollup.total_reps,
+            total_volume=rollup.total_volume,
         )
-        .order_by(Workout.created_time.desc())
-        .count()
-    )
\ No newline at end of file
+    return volume
@@ -0,0 +1,33 @@
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from src.backend.database.configure import ASYNC_DATABASE_URL, POOL_OPTIONS, credentials
+from src.backend.database.credentials import attach_credentials
+from src.backend.database.pool import TimedAsyncQueuePool, register_pool
+
+# Created on first use, so the async driver is only needed when async mode is switched on.
+_engine = None
+_sessionmaker = None
+
+def get_async_engine():
+    global _engine
+    if _engine is None:
+        _engine = create_async_engine(ASYNC_DATABASE_URL, poolclass=TimedAsyncQueuePool, **POOL_OPTIONS)
+        attach_credentials(_engine.sync_engine, credentials)
+        register_pool("async", _engine.sync_engine)
+    return _engine
+
+def async_session_factory() -> async_sessionmaker:
+    global _sessionmaker
+    if _sessionmaker is None:
+        _sessionmaker = async_sessionmaker(get_async_engine(), autoflush=False)
+    return _sessionmaker
+
+async def get_async_db():
+    async with async_session_factory()() as db:
+        yield db
+
+async def dispose_async_engine():
+    global _engine, _sessionmaker
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _sessionmaker = None
@@ -1,49 +1,56 @@
 import os
-import json
-import boto3
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from src.backend.database.credentials import attach_credentials, credentials_from_env
+from src.backend.database.pool import TimedQueuePool, register_pool
 
 load_dotenv()
 
-def get_db_credentials():
-    if os.getenv("TESTING", "0") == "1":
-        return {
-            "username": "test_user",
-            "password": "test_pass"
-        }
-    
-    secret_name = os.getenv("DB_SECRET_NAME")
-    region_name = os.getenv("AWS_REGION", "us-east-2")
-
-    if not secret_name:
-        raise ValueError("DB_SECRET_NAME environment variable is required.")
-
-    client = boto3.client("secretsmanager", region_name=region_name)
-    response = client.get_secret_value(SecretId=secret_name)
-    secret = json.loads(response["SecretString"])
-
-    return {
-        "username": secret["username"],
-        "password": secret["password"]
-    }
-
-secrets = get_db_credentials()
+# Resolved on the first connection, not at import, and refreshed when the TTL lapses or the
+# database rejects them (see database/credentials.py).
+credentials = credentials_from_env()
 
 DB_HOST = os.getenv("DB_HOST", "localhost")
 DB_PORT = os.getenv("DB_PORT", "3306")
 DB_NAME = "triance"
 
-DATABASE_URL = (
-    f"mysql+pymysql://{secrets['username']}:{secrets['password']}"
-    f"@{DB_HOST}:{DB_PORT}/{DB_NAME}"
-)
-
-engine = create_engine(DATABASE_URL)
+DATABASE_URL = f"mysql+pymysql://{DB_HOST}:{DB_PORT}/{DB_NAME}"
+
+# Connection pool. Recycle stays under the server's idle timeout and pre-ping replaces connections
+# that were dropped while idle, so the first request after a quiet period does not fail.
+POOL_OPTIONS = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", "10")),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+    "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+    "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+    "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "1") == "1",
+}
+# Size of AnyIO's worker thread pool, which runs every sync handler and threadpool call, not only
+# the ones that use the database. Unset keeps AnyIO's default (40). Setting it to
+# DB_POOL_SIZE + DB_MAX_OVERFLOW makes excess DB requests queue for a thread rather than for a
+# connection, at the cost of also capping handlers that never touch the database.
+THREAD_POOL_SIZE = int(os.getenv("THREAD_POOL_SIZE", "0")) or None
+
+# DB_ASYNC=1 additionally serves the async routes from an AsyncEngine (see database/async_session.py).
+ASYNC_DB = os.getenv("DB_ASYNC", "0") == "1"
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or DATABASE_URL.replace("mysql+pymysql://", "mysql+aiomysql://", 1)
+
+engine = create_engine(DATABASE_URL, poolclass=TimedQueuePool, **POOL_OPTIONS)
+attach_credentials(engine, credentials)
+register_pool("primary", engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+# Session.info key under which read sessions (see database/replicas.py) keep the primary engine.
+PRIMARY_BIND = "primary_bind"
+
+def primary_bind(db):
+    """
+    The engine that takes writes for `db`: its own bind, unless it is a replica read session.
+    """
+    return db.info.get(PRIMARY_BIND) or db.get_bind()
+
 def get_db():
     db = SessionLocal()
     try:
@@ -0,0 +1,99 @@
+import json
+import os
+import threading
+import time
+from sqlalchemy import event
+
+# MySQL's ER_ACCESS_DENIED_ERROR, raised (as args[0]) by pymysql and aiomysql on bad credentials.
+ACCESS_DENIED = 1045
+
+class CachedCredentials:
+    """
+    Database credentials fetched on first use and cached for `ttl` seconds.
+    `fetch` returns {"username": ..., "password": ...}; it is called again once the TTL has
+    passed or after invalidate(), e.g. when the database rejected the cached password because
+    the secret was rotated.
+    """
+
+    def __init__(self, fetch, ttl: float = 3600.0, clock=time.monotonic):
+        self._fetch = fetch
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._credentials = None
+        self._expires_at = 0.0
+
+    def get(self):
+        with self._lock:
+            if self._credentials is None or self._clock() >= self._expires_at:
+                self._credentials = self._fetch()
+                self._expires_at = self._clock() + self.ttl
+            return self._credentials
+
+    def invalidate(self):
+        with self._lock:
+            self._credentials = None
+
+def secrets_manager_credentials(secret_name: str, region_name: str):
+    def fetch():
+        if not secret_name:
+            raise ValueError("DB_SECRET_NAME environment variable is required.")
+        import boto3  # only paid for when credentials are actually needed
+        client = boto3.client("secretsmanager", region_name=region_name)
+        secret = json.loads(client.get_secret_value(SecretId=secret_name)["SecretString"])
+        return {"username": secret["username"], "password": secret["password"]}
+    return fetch
+
+def file_credentials(path: str):
+    def fetch():
+        with open(path) as f:
+            secret = json.load(f)
+        return {"username": secret["username"], "password": secret["password"]}
+    return fetch
+
+def env_credentials():
+    return {"username": os.environ["DB_USERNAME"], "password": os.getenv("DB_PASSWORD", "")}
+
+def credentials_from_env() -> CachedCredentials:
+    """
+    Pick the credential source from the environment, in order: TESTING=1 (fixed test values),
+    DB_CREDENTIALS_FILE (a JSON file with username/password), DB_USERNAME/DB_PASSWORD, and
+    otherwise the AWS Secrets Manager secret named by DB_SECRET_NAME.
+    Nothing is fetched, and nothing is checked, until the first connection.
+    """
+    if os.getenv("TESTING", "0") == "1":
+        fetch = lambda: {"username": "test_user", "password": "test_pass"}
+    elif os.getenv("DB_CREDENTIALS_FILE"):
+        fetch = file_credentials(os.environ["DB_CREDENTIALS_FILE"])
+    elif os.getenv("DB_USERNAME"):
+        fetch = env_credentials
+    else:
+        fetch = secrets_manager_credentials(os.getenv("DB_SECRET_NAME"), os.getenv("AWS_REGION", "us-east-2"))
+    return CachedCredentials(fetch, ttl=float(os.getenv("DB_CREDENTIALS_TTL", "3600")))
+
+def is_auth_error(error: Exception) -> bool:
+    args = getattr(error, "args", ())
+    return bool(args) and args[0] == ACCESS_DENIED
+
+def connect_with_credentials(credentials: CachedCredentials, dialect, cargs, cparams):
+    """
+    Open a DBAPI connection with the current credentials. If the database rejects them, they are
+    refetched once and the connection retried, so a rotated secret is picked up without a restart.
+    """
+    for attempt in range(2):
+        secret = credentials.get()
+        cparams.update(user=secret["username"], password=secret["password"])
+        try:
+            return dialect.connect(*cargs, **cparams)
+        except Exception as e:
+            if attempt or not is_auth_error(e):
+                raise
+            credentials.invalidate()
+
+def attach_credentials(engine, credentials: CachedCredentials):
+    """
+    Supply `credentials` to every new connection `engine` opens, instead of baking them into the URL.
+    """
+    @event.listens_for(engine, "do_connect")
+    def _connect(dialect, conn_rec, cargs, cparams):
+        return connect_with_credentials(credentials, dialect, cargs, cparams)
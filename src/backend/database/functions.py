@@ -0,0 +1,48 @@
+from sqlalchemy import Integer
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+# Portable SQL functions for analytics queries whose spelling differs per dialect.
+
+class weekday(FunctionElement):
+    """
+    Day of the week of a datetime expression, 0 = Monday ... 6 = Sunday (like datetime.weekday()).
+    """
+    type = Integer()
+    inherit_cache = True
+    name = "weekday"
+
+@compiles(weekday)
+def _weekday_default(element, compiler, **kw):
+    return "(EXTRACT(ISODOW FROM %s) - 1)" % compiler.process(element.clauses, **kw)
+
+@compiles(weekday, "mysql")
+def _weekday_mysql(element, compiler, **kw):
+    return "WEEKDAY(%s)" % compiler.process(element.clauses, **kw)
+
+@compiles(weekday, "sqlite")
+def _weekday_sqlite(element, compiler, **kw):
+    return "((CAST(STRFTIME('%%w', %s) AS INTEGER) + 6) %% 7)" % compiler.process(element.clauses, **kw)
+
+class epoch_day(FunctionElement):
+    """
+    Whole days between 1970-01-01 and the calendar date of a datetime expression, so analytics
+    can bucket rows by day without decoding datetimes in Python.
+    """
+    type = Integer()
+    inherit_cache = True
+    name = "epoch_day"
+
+@compiles(epoch_day)
+def _epoch_day_default(element, compiler, **kw):
+    return "(CAST(%s AS DATE) - DATE '1970-01-01')" % compiler.process(element.clauses, **kw)
+
+@compiles(epoch_day, "mysql")
+def _epoch_day_mysql(element, compiler, **kw):
+    return "(TO_DAYS(%s) - 719528)" % compiler.process(element.clauses, **kw)
+
+@compiles(epoch_day, "sqlite")
+def _epoch_day_sqlite(element, compiler, **kw):
+    # julianday() is much cheaper per row than STRFTIME('%s'); the cast truncates, which equals
+    # flooring for every date from 1970 on.
+    return "CAST(JULIANDAY(%s) - 2440587.5 AS INTEGER)" % compiler.process(element.clauses, **kw)
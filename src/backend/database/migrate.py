@@ -0,0 +1,112 @@
+"""
+Versioned, forward-only schema migrations for existing databases.
+
+Migrations live in src/backend/database/migrations as NNNN_description.py modules exposing
+`upgrade(connection)`. Applied versions are recorded in the schema_migrations table, so running
+this repeatedly only applies what is pending and never drops data (unlike sync_tables.py).
+
+Usage:
+    python -m src.backend.database.migrate            # apply pending migrations
+    python -m src.backend.database.migrate --status   # show applied/pending versions
+"""
+import argparse
+import importlib
+import pkgutil
+from datetime import datetime, timezone
+from sqlalchemy import Column, DateTime, Index, MetaData, String, Table, inspect, select, text
+
+MIGRATIONS_PACKAGE = "src.backend.database.migrations"
+
+schema_migrations = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("version", String(255), primary_key=True),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+def discover_migrations():
+    package = importlib.import_module(MIGRATIONS_PACKAGE)
+    versions = sorted(
+        module.name for module in pkgutil.iter_modules(package.__path__)
+        if module.name[:4].isdigit()
+    )
+    return [(version, importlib.import_module(f"{MIGRATIONS_PACKAGE}.{version}")) for version in versions]
+
+def get_applied_versions(engine):
+    with engine.begin() as connection:
+        schema_migrations.create(connection, checkfirst=True)
+        return set(connection.execute(select(schema_migrations.c.version)).scalars())
+
+def migrate(engine):
+    """
+    Apply every pending migration in version order. Returns the versions that were applied.
+    """
+    applied = get_applied_versions(engine)
+    newly_applied = []
+    for version, module in discover_migrations():
+        if version in applied:
+            continue
+        with engine.begin() as connection:
+            module.upgrade(connection)
+            connection.execute(schema_migrations.insert().values(
+                version=version,
+                applied_at=datetime.now(timezone.utc)
+            ))
+        newly_applied.append(version)
+    return newly_applied
+
+def index_exists(connection, table_name: str, name: str):
+    # The inspector skips expression-based indexes on some dialects, so ask the catalog directly.
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        query = text("SELECT 1 FROM sqlite_master WHERE type = 'index' AND tbl_name = :table AND name = :name")
+    elif dialect == "mysql":
+        query = text(
+            "SELECT 1 FROM information_schema.statistics "
+            "WHERE table_schema = DATABASE() AND table_name = :table AND index_name = :name"
+        )
+    else:
+        return any(index["name"] == name for index in inspect(connection).get_indexes(table_name))
+    return connection.execute(query, {"table": table_name, "name": name}).first() is not None
+
+def column_exists(connection, table_name: str, name: str):
+    return any(column["name"] == name for column in inspect(connection).get_columns(table_name))
+
+def create_index_if_missing(connection, name: str, table_name: str, *columns: str):
+    """
+    Create an index unless one with the same name, or one covering the same leading columns
+    (e.g. the implicit index MySQL builds for a foreign key), already exists.
+    Columns may carry a " DESC" suffix.
+    """
+    if index_exists(connection, table_name, name):
+        return False
+    column_names = [column.split()[0] for column in columns]
+    if any(existing["column_names"] == column_names for existing in inspect(connection).get_indexes(table_name)):
+        return False
+
+    table = Table(table_name, MetaData(), autoload_with=connection)
+    expressions = []
+    for column in columns:
+        column_name, *direction = column.split()
+        expression = table.c[column_name]
+        if direction and direction[0].upper() == "DESC":
+            expression = expression.desc()
+        expressions.append(expression)
+    Index(name, *expressions).create(connection)
+    return True
+
+if __name__ == "__main__":
+    from src.backend.database.configure import engine
+
+    parser = argparse.ArgumentParser(description="Apply pending schema migrations.")
+    parser.add_argument("--status", action="store_true", help="List applied and pending migrations without applying them.")
+    args = parser.parse_args()
+
+    if args.status:
+        applied = get_applied_versions(engine)
+        for version, _ in discover_migrations():
+            print(f"{'applied' if version in applied else 'pending'}  {version}")
+    else:
+        for version in migrate(engine):
+            print(f"Applied {version}")
+        print("Database schema is up to date.")
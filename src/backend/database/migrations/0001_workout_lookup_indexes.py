@@ -0,0 +1,23 @@
+"""
+Indexes for the per-user workout lookups (latest workout, history pages, per-type counts)
+and for the child-row joins that SQLite does not index implicitly.
+"""
+from src.backend.database.migrate import create_index_if_missing
+
+def upgrade(connection):
+    create_index_if_missing(
+        connection, "ix_workouts_user_created", "workouts",
+        "user_id", "created_time DESC", "id DESC"
+    )
+    create_index_if_missing(
+        connection, "ix_workouts_user_type_created", "workouts",
+        "user_id", "workout_type", "created_time DESC"
+    )
+    create_index_if_missing(
+        connection, "ix_logged_exercises_workout_id", "logged_exercises",
+        "workout_id"
+    )
+    create_index_if_missing(
+        connection, "ix_logged_exercise_sets_logged_exercise_id", "logged_exercise_sets",
+        "logged_exercise_id"
+    )
@@ -0,0 +1,12 @@
+"""
+Functional index on lower(exercises.name) for case-insensitive exercise lookups.
+MySQL builds it as a functional key part, which requires MySQL 8.0.13+.
+"""
+from sqlalchemy import Index, MetaData, Table, func
+from src.backend.database.migrate import index_exists
+
+def upgrade(connection):
+    if index_exists(connection, "exercises", "ix_exercises_name_lower"):
+        return
+    exercises = Table("exercises", MetaData(), autoload_with=connection)
+    Index("ix_exercises_name_lower", func.lower(exercises.c.name)).create(connection)
@@ -0,0 +1,79 @@
+"""
+workout_rollups table: per-user running totals by (period, workout type), kept current by the
+workout write paths. Backfilled from existing workouts when created.
+
+The table and the backfill are spelled out here rather than taken from the model and
+crud/rollup.py, so later changes to those cannot change what this migration does.
+"""
+from collections import defaultdict
+from sqlalchemy import (
+    Column, DateTime, Float, ForeignKey, Integer, MetaData, String, Table, Uuid,
+    column, distinct, extract, func, select, table,
+)
+
+ALL_TIME = "all"
+ALL_TYPES = "*"
+UNCATEGORIZED = "Uncategorized"
+# workouts.workout_type stores ExerciseGroup member names; rollups key on their display values.
+WORKOUT_TYPES = {
+    "PUSH": "Push", "PULL": "Pull", "QUADS": "Quads", "HAMS": "Hams",
+    "FULL_BODY": "Full Body", "UPPER": "Upper", "LOWER": "Lower", "CUSTOM": "Custom",
+}
+
+metadata = MetaData()
+Table("users", metadata, Column("id", Uuid, primary_key=True))
+workout_rollups = Table(
+    "workout_rollups", metadata,
+    Column("user_id", Uuid, ForeignKey("users.id"), primary_key=True),
+    Column("period", String(7), primary_key=True),
+    Column("workout_type", String(32), primary_key=True),
+    Column("workout_count", Integer, nullable=False),
+    Column("set_count", Integer, nullable=False),
+    Column("total_reps", Integer, nullable=False),
+    Column("total_volume", Float, nullable=False),
+)
+
+workouts = table("workouts", column("id", Uuid), column("user_id", Uuid), column("workout_type", String), column("created_time", DateTime))
+logged_exercises = table("logged_exercises", column("id", Uuid), column("workout_id", Uuid))
+logged_exercise_sets = table("logged_exercise_sets", column("id", Uuid), column("logged_exercise_id", Uuid), column("reps", Integer), column("weight", Float))
+
+def upgrade(connection):
+    workout_rollups.create(connection, checkfirst=True)
+
+    year = extract("year", workouts.c.created_time)
+    month = extract("month", workouts.c.created_time)
+    query = (
+        select(
+            workouts.c.user_id, workouts.c.workout_type, year, month,
+            func.count(distinct(workouts.c.id)),
+            func.count(logged_exercise_sets.c.id),
+            func.coalesce(func.sum(logged_exercise_sets.c.reps), 0),
+            func.coalesce(func.sum(logged_exercise_sets.c.reps * logged_exercise_sets.c.weight), 0),
+        )
+        .select_from(workouts)
+        .outerjoin(logged_exercises, logged_exercises.c.workout_id == workouts.c.id)
+        .outerjoin(logged_exercise_sets, logged_exercise_sets.c.logged_exercise_id == logged_exercises.c.id)
+        .group_by(workouts.c.user_id, workouts.c.workout_type, year, month)
+    )
+
+    # Every workout counts toward its month and ALL_TIME, each under its type and under ALL_TYPES.
+    rows = defaultdict(lambda: [0, 0, 0, 0.0])
+    for user_id, workout_type, y, m, workout_count, set_count, reps, volume in connection.execute(query):
+        type_key = WORKOUT_TYPES[workout_type] if workout_type else UNCATEGORIZED
+        for period in (f"{int(y):04d}-{int(m):02d}", ALL_TIME):
+            for key in (type_key, ALL_TYPES):
+                totals = rows[(user_id, period, key)]
+                totals[0] += workout_count
+                totals[1] += set_count
+                totals[2] += int(reps)
+                totals[3] += float(volume)
+
+    connection.execute(workout_rollups.delete())
+    if rows:
+        connection.execute(workout_rollups.insert(), [
+            {
+                "user_id": user_id, "period": period, "workout_type": key,
+                "workout_count": totals[0], "set_count": totals[1], "total_reps": totals[2], "total_volume": totals[3],
+            }
+            for (user_id, period, key), totals in rows.items()
+        ])
@@ -0,0 +1,68 @@
+"""
+personal_records table: best weight per (user, exercise, rep count), kept current by the
+workout write paths. Backfilled from existing sets when created.
+
+The table and the backfill are spelled out here rather than taken from the model and
+crud/records.py, so later changes to those cannot change what this migration does.
+"""
+from sqlalchemy import (
+    Column, DateTime, Float, ForeignKey, Integer, MetaData, Table, Uuid,
+    column, func, select, table,
+)
+
+metadata = MetaData()
+Table("users", metadata, Column("id", Uuid, primary_key=True))
+Table("exercises", metadata, Column("id", Uuid, primary_key=True))
+personal_records = Table(
+    "personal_records", metadata,
+    Column("user_id", Uuid, ForeignKey("users.id"), primary_key=True),
+    Column("exercise_id", Uuid, ForeignKey("exercises.id"), primary_key=True),
+    Column("reps", Integer, primary_key=True),
+    Column("weight", Float, nullable=False),
+    Column("estimated_1rm", Float, nullable=False),
+    Column("workout_id", Uuid, nullable=False),
+    Column("achieved_at", DateTime, nullable=False),
+)
+
+workouts = table("workouts", column("id", Uuid), column("user_id", Uuid), column("created_time", DateTime))
+logged_exercises = table("logged_exercises", column("id", Uuid), column("workout_id", Uuid), column("exercise_id", Uuid))
+logged_exercise_sets = table("logged_exercise_sets", column("logged_exercise_id", Uuid), column("reps", Integer), column("weight", Float))
+
+def _estimated_one_rep_max(reps: int, weight: float) -> float:
+    # Epley; a single is taken at face value.
+    return weight if reps == 1 else weight * (1 + reps / 30)
+
+def upgrade(connection):
+    personal_records.create(connection, checkfirst=True)
+
+    # Heaviest set per (user, exercise, reps); the earliest workout wins ties.
+    ranked = (
+        select(
+            workouts.c.user_id, logged_exercises.c.exercise_id, logged_exercise_sets.c.reps,
+            logged_exercise_sets.c.weight, workouts.c.id.label("workout_id"), workouts.c.created_time,
+            func.row_number().over(
+                partition_by=(workouts.c.user_id, logged_exercises.c.exercise_id, logged_exercise_sets.c.reps),
+                order_by=(logged_exercise_sets.c.weight.desc(), workouts.c.created_time, workouts.c.id)
+            ).label("rank"),
+        )
+        .join(logged_exercises, logged_exercises.c.workout_id == workouts.c.id)
+        .join(logged_exercise_sets, logged_exercise_sets.c.logged_exercise_id == logged_exercises.c.id)
+        .where(logged_exercise_sets.c.reps > 0)
+        .subquery()
+    )
+    rows = [
+        {
+            "user_id": row.user_id,
+            "exercise_id": row.exercise_id,
+            "reps": row.reps,
+            "weight": row.weight,
+            "estimated_1rm": _estimated_one_rep_max(row.reps, row.weight),
+            "workout_id": row.workout_id,
+            "achieved_at": row.created_time,
+        }
+        for row in connection.execute(select(ranked).where(ranked.c.rank == 1))
+    ]
+
+    connection.execute(personal_records.delete())
+    if rows:
+        connection.execute(personal_records.insert(), rows)
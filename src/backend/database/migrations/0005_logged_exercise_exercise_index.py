@@ -0,0 +1,11 @@
+"""
+Index on logged_exercises(exercise_id, workout_id) so per-exercise history (progression, records)
+starts from the exercise's rows instead of scanning every logged exercise.
+"""
+from src.backend.database.migrate import create_index_if_missing
+
+def upgrade(connection):
+    create_index_if_missing(
+        connection, "ix_logged_exercises_exercise_workout", "logged_exercises",
+        "exercise_id", "workout_id"
+    )
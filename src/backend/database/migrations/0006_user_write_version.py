@@ -0,0 +1,10 @@
+"""
+users.write_version: a per-user counter bumped by every workout write, so caches in every process
+(not just the one that handled the write) can tell their entries for that user are stale.
+"""
+from sqlalchemy import text
+from src.backend.database.migrate import column_exists
+
+def upgrade(connection):
+    if not column_exists(connection, "users", "write_version"):
+        connection.execute(text("ALTER TABLE users ADD COLUMN write_version INTEGER NOT NULL DEFAULT 0"))
@@ -0,0 +1,118 @@
+import anyio.to_thread
+import threading
+import time
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+_registry = {}
+
+class CheckoutCounters:
+    """
+    Checkout and wait-time counters for one pool. Thread-safe.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.waiting = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def start(self):
+        with self._lock:
+            self.waiting += 1
+
+    def finish(self, waited: float, timed_out: bool = False):
+        with self._lock:
+            self.waiting -= 1
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+
+    def snapshot(self):
+        with self._lock:
+            waits = self.checkouts + self.timeouts
+            return {
+                "waiting": self.waiting,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": self.wait_total,
+                "wait_seconds_max": self.wait_max,
+                "wait_seconds_avg": self.wait_total / waits if waits else 0.0,
+            }
+
+class TimedCheckout:
+    """
+    Pool mixin that measures how long each checkout waited for a connection, so queueing on
+    the pool shows up in metrics instead of only as request latency.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.counters = CheckoutCounters()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        self.counters.start()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.counters.finish(time.perf_counter() - start, timed_out=True)
+            raise
+        self.counters.finish(time.perf_counter() - start)
+        return connection
+
+    def recreate(self):
+        # engine.dispose() swaps in a recreated pool; keep counting into the same counters.
+        pool = super().recreate()
+        pool.counters = self.counters
+        return pool
+
+    def stats(self):
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            **self.counters.snapshot(),
+        }
+
+class TimedQueuePool(TimedCheckout, QueuePool):
+    pass
+
+class TimedAsyncQueuePool(TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+def register_pool(name: str, engine):
+    """
+    Expose an engine's pool under `name` in pool_stats(). The engine is kept rather than the pool,
+    because dispose() swaps the pool object.
+    """
+    _registry[name] = engine
+
+def pool_stats():
+    return {
+        name: engine.pool.stats()
+        for name, engine in _registry.items()
+        if isinstance(engine.pool, TimedCheckout)
+    }
+
+def configure_thread_limiter(total_tokens: int):
+    """
+    Size AnyIO's default thread limiter, which runs every sync handler and dependency.
+    Must be called from inside the event loop (e.g. at startup).
+    """
+    anyio.to_thread.current_default_thread_limiter().total_tokens = total_tokens
+
+def thread_stats():
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    return {
+        "total": limiter.total_tokens,
+        "borrowed": limiter.borrowed_tokens,
+        "waiting": limiter.statistics().tasks_waiting,
+    }
@@ -0,0 +1,186 @@
+import itertools
+import os
+import threading
+import time
+from fastapi import Request
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import SQLAlchemyError
+from src.backend.database.configure import POOL_OPTIONS, PRIMARY_BIND, SessionLocal, credentials, engine
+from src.backend.database.credentials import attach_credentials
+from src.backend.database.pool import TimedQueuePool, register_pool
+
+# Comma-separated URLs of read replicas. Without any, reads go to the primary like writes do.
+REPLICA_URLS = [url.strip() for url in os.getenv("DB_REPLICA_URLS", "").split(",") if url.strip()]
+# After a client's write succeeds, its reads stay on the primary this long. Keep it above the
+# replicas' usual replication lag.
+READ_YOUR_WRITES_SECONDS = float(os.getenv("DB_READ_YOUR_WRITES_SECONDS", "5"))
+# How often the background checker runs SELECT 1 against each replica.
+REPLICA_HEALTH_INTERVAL = float(os.getenv("DB_REPLICA_HEALTH_INTERVAL", "10"))
+
+# Set on responses to successful writes and sent back by the client (as a cookie, or echoed as a
+# header by clients that do not keep cookies): the time until which its reads go to the primary.
+READ_PRIMARY_COOKIE = "read_primary_until"
+READ_PRIMARY_HEADER = "x-read-primary-until"
+
+_WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+class ReplicaRouter:
+    """
+    Chooses the engine for a read-only session: the replicas in round-robin order, skipping any
+    that failed their last health check, or the primary when none is healthy or the client is
+    inside its read-your-writes window. Health is checked by a background thread; choosing an
+    engine only reads the last result, so a hung replica never stalls a request.
+    """
+
+    def __init__(self, primary, replicas=(), read_your_writes: float = READ_YOUR_WRITES_SECONDS,
+                 health_interval: float = REPLICA_HEALTH_INTERVAL, clock=time.time):
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.read_your_writes = read_your_writes
+        self.health_interval = health_interval
+        self._clock = clock
+        self._turn = itertools.count()
+        # Replicas are out of rotation until their first check passes.
+        self._healthy = [False] * len(self.replicas)
+        self._stop = threading.Event()
+        self._checker = None
+        for index, replica in enumerate(self.replicas):
+            event.listen(replica, "handle_error", self._on_error(index))
+
+    def _on_error(self, index):
+        # A dropped or refused connection takes the replica out of rotation until its next check.
+        def handle_error(context):
+            if context.is_disconnect:
+                self._healthy[index] = False
+        return handle_error
+
+    def check(self, index: int) -> bool:
+        try:
+            with self.replicas[index].connect() as connection:
+                connection.execute(text("SELECT 1"))
+            healthy = True
+        except SQLAlchemyError:
+            healthy = False
+        self._healthy[index] = healthy
+        return healthy
+
+    def check_all(self):
+        for index in range(len(self.replicas)):
+            self.check(index)
+
+    def _run_checks(self):
+        while True:
+            self.check_all()
+            if self._stop.wait(self.health_interval):
+                return
+
+    def start_health_checks(self):
+        if self.replicas and self._checker is None:
+            self._stop.clear()
+            self._checker = threading.Thread(target=self._run_checks, name="replica-health", daemon=True)
+            self._checker.start()
+
+    def ensure_health_checks(self):
+        """
+        For processes without the API lifespan, such as the dashboard: check every replica once
+        right away, so the first read can already use one, then keep checking in the background.
+        Safe to call repeatedly.
+        """
+        if self._checker is None:
+            self.check_all()
+            self.start_health_checks()
+
+    def stop_health_checks(self):
+        if self._checker is not None:
+            self._stop.set()
+            self._checker.join(timeout=self.health_interval)
+            self._checker = None
+
+    def pin_until(self) -> float:
+        return self._clock() + self.read_your_writes
+
+    def is_pinned(self, pinned_until) -> bool:
+        # Values further out than one window were not issued by us and are ignored.
+        if pinned_until is None:
+            return False
+        now = self._clock()
+        return now < pinned_until <= now + self.read_your_writes
+
+    def engine_for(self, pinned_until: float = None):
+        if not self.replicas or self.is_pinned(pinned_until):
+            return self.primary
+        start = next(self._turn)
+        for offset in range(len(self.replicas)):
+            index = (start + offset) % len(self.replicas)
+            if self._healthy[index]:
+                return self.replicas[index]
+        return self.primary
+
+    def stats(self):
+        return {"replicas": len(self.replicas), "healthy": sum(self._healthy)}
+
+def create_replica_engine(url: str, name: str):
+    replica = create_engine(url, poolclass=TimedQueuePool, **POOL_OPTIONS)
+    if make_url(url).username is None:
+        # Replicas share the primary's account unless the URL names its own.
+        attach_credentials(replica, credentials)
+    register_pool(name, replica)
+    return replica
+
+read_router = ReplicaRouter(
+    engine, [create_replica_engine(url, f"replica{i}") for i, url in enumerate(REPLICA_URLS)]
+)
+
+class ReadYourWritesMiddleware:
+    """
+    ASGI middleware that marks the client of every successful write (POST, PUT, PATCH, DELETE
+    answered below 400) with a short-lived cookie and header, so get_read_db keeps that client's
+    reads on the primary until replicas have caught up. Works across workers: the state is on the
+    client, not in any process.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in _WRITE_METHODS or not read_router.replicas:
+            return await self.app(scope, receive, send)
+
+        async def send_pinned(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                until = f"{read_router.pin_until():.3f}"
+                max_age = int(read_router.read_your_writes) + 1
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"set-cookie", f"{READ_PRIMARY_COOKIE}={until}; Max-Age={max_age}; Path=/; HttpOnly; SameSite=Lax".encode()),
+                    (READ_PRIMARY_HEADER.encode(), until.encode()),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_pinned)
+
+def read_session(pinned_until: float = None):
+    """
+    A session for read-only work, bound to the engine read_router picks. It remembers the primary,
+    so caches that must not load from a lagging replica can read from there instead.
+    """
+    return SessionLocal(bind=read_router.engine_for(pinned_until), info={PRIMARY_BIND: read_router.primary})
+
+def _pinned_until(request: Request):
+    value = request.headers.get(READ_PRIMARY_HEADER) or request.cookies.get(READ_PRIMARY_COOKIE)
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+def get_read_db(request: Request):
+    """
+    Session dependency for GET handlers. Clients that wrote within the read-your-writes window
+    (see ReadYourWritesMiddleware) are served from the primary.
+    """
+    db = read_session(_pinned_until(request))
+    try:
+        yield db
+    finally:
+        db.close()
@@ -1,29 +1,57 @@
 import os
-import jwt
+import logging
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
-from dotenv import load_dotenv
+from functools import lru_cache
 from fastapi import Depends, FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from jwt.exceptions import InvalidTokenError
-from passlib.context import CryptContext
+from sqlalchemy.exc import SQLAlchemyError
 from typing import Annotated
 
-from src.backend.database.configure import get_db
-from src.backend.api import user, exercise, workout, logged_exercise
+from src.backend.cache.exercise_catalog import exercise_catalog
+from src.backend.database.configure import ASYNC_DB, THREAD_POOL_SIZE, get_db
+from src.backend.database.replicas import READ_PRIMARY_HEADER, ReadYourWritesMiddleware, read_router, read_session
+from src.backend.database.pool import configure_thread_limiter
+from src.backend.api import user, exercise, workout, logged_exercise, metrics
 from pydantic import BaseModel
 
+logger = logging.getLogger(__name__)
+
+
+def warm_caches():
+    db = read_session()
+    try:
+        exercise_catalog.refresh(db)
+    except SQLAlchemyError:
+        logger.warning("Could not preload the exercise catalog; it will load on first use.", exc_info=True)
+    finally:
+        db.close()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if THREAD_POOL_SIZE:
+        configure_thread_limiter(THREAD_POOL_SIZE)
+    read_router.start_health_checks()
+    warm_caches()
+    yield
+    read_router.stop_health_checks()
+    if ASYNC_DB:
+        from src.backend.database.async_session import dispose_async_engine
+        await dispose_async_engine()
+
 
 app = FastAPI(
     title="Fitness Tracker API",
     description="An open-source API for tracking workouts and visualization",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # ============================================ SECURITY SETUP POC =============================================================
 
-load_dotenv()
-
+# .env has already been loaded by database.configure. jwt and passlib (with bcrypt) are imported
+# on first use below, so workers and cold starts that never see an auth request skip them.
 SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = os.getenv("ALGORITHM")
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
@@ -45,7 +73,11 @@ fake_users_db = {
     }
 }
 
-pwd_context = CryptContext(schemes=[os.getenv("SCHEME")], deprecated="auto")
+@lru_cache
+def get_pwd_context():
+    from passlib.context import CryptContext
+    return CryptContext(schemes=[os.getenv("SCHEME")], deprecated="auto")
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 class Token(BaseModel):
@@ -65,10 +97,10 @@ class AuthUserInDB(AuthUser):
     hashed_password: str
 
 def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 def get_password_hash(password):
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 def get_user(db, username: str):
     if username in db:
@@ -84,6 +116,7 @@ def authenticate_user(fake_db, username: str, password: str):
     return user
 
 def create_access_token(data: dict, expires_delta: timedelta = None):
+    import jwt
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.now(timezone.utc) + expires_delta
@@ -94,6 +127,8 @@ def create_access_token(data: dict, expires_delta: timedelta = None):
     return encoded_jwt
 
 async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]):
+    import jwt
+    from jwt.exceptions import InvalidTokenError
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -124,6 +159,7 @@ async def get_current_active_user(
 
 # =============================================================================================================================
 
+app.add_middleware(ReadYourWritesMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -136,12 +172,22 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Lets browser clients read the read-your-writes marker and echo it on later requests.
+    expose_headers=[READ_PRIMARY_HEADER],
 )
 
-app.include_router(user.router, prefix="/api/users", tags=["Users"])
-app.include_router(exercise.router, prefix="/api/exercises", tags=["Exercises"])
-app.include_router(workout.router, prefix="/api/workouts", tags=["Workouts"])
-app.include_router(logged_exercise.router, prefix="/api/logged_exercises", tags=["Logged Exercises"])
+def include_routers(app: FastAPI, async_db: bool = ASYNC_DB):
+    if async_db:
+        # Imported only in async mode; ahead of the sync workout router so its paths win.
+        from src.backend.api import async_workout
+        app.include_router(async_workout.router, prefix="/api/workouts", tags=["Workouts"])
+    app.include_router(user.router, prefix="/api/users", tags=["Users"])
+    app.include_router(exercise.router, prefix="/api/exercises", tags=["Exercises"])
+    app.include_router(workout.router, prefix="/api/workouts", tags=["Workouts"])
+    app.include_router(logged_exercise.router, prefix="/api/logged_exercises", tags=["Logged Exercises"])
+    app.include_router(metrics.router, prefix="/api/metrics", tags=["Metrics"])
+
+include_routers(app)
 
 # Root endpoint
 @app.get("/api", tags=["Root"])
@@ -2,4 +2,6 @@ from .user import User
 from .exercise import Exercise
 from .workout import Workout
 from .logged_exercise import LoggedExercise
-from .logged_exercise_set import LoggedExerciseSet
\ No newline at end of file
+from .logged_exercise_set import LoggedExerciseSet
+from .workout_rollup import WorkoutRollup
+from .personal_record import PersonalRecord
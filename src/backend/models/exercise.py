@@ -1,4 +1,4 @@
-from sqlalchemy import JSON, String, Enum as SQLEnum
+from sqlalchemy import JSON, Index, String, Enum as SQLEnum, func
 from sqlalchemy.orm import Mapped, mapped_column
 from uuid import UUID, uuid4
 from typing import Optional, List
@@ -25,4 +25,7 @@ class Exercise(Base):
             "primary_muscles": self.primary_muscles,
             "secondary_muscles": self.secondary_muscles,
             "description": self.description  # Include description in the dict output
-        }
\ No newline at end of file
+        }
+
+# Case-insensitive name lookups (WHERE lower(name) = :name) use this instead of scanning the table.
+Index("ix_exercises_name_lower", func.lower(Exercise.name))
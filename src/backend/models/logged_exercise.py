@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from uuid import UUID, uuid4
 from typing import List
@@ -10,7 +10,7 @@ class LoggedExercise(Base):
     __tablename__ = 'logged_exercises'
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
-    workout_id: Mapped[UUID] = mapped_column(ForeignKey("workouts.id"))
+    workout_id: Mapped[UUID] = mapped_column(ForeignKey("workouts.id"), index=True)
     exercise_id: Mapped[UUID] = mapped_column(ForeignKey("exercises.id"))
 
     sets: Mapped[List[LoggedExerciseSet]] = relationship(
@@ -23,3 +23,5 @@ class LoggedExercise(Base):
 
     def __repr__(self):
         return f"<LoggedExercise(workout_id={self.workout_id}, exercise_id={self.exercise_id})>"
+
+Index("ix_logged_exercises_exercise_workout", LoggedExercise.exercise_id, LoggedExercise.workout_id)
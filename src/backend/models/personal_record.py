@@ -0,0 +1,23 @@
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from uuid import UUID
+from datetime import datetime
+from src.backend.models.base import Base
+
+class PersonalRecord(Base):
+    """
+    A user's heaviest set of an exercise at a given rep count, and the workout it came from
+    (the first one to reach that weight).
+    """
+    __tablename__ = "personal_records"
+
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("users.id"), primary_key=True)
+    exercise_id: Mapped[UUID] = mapped_column(ForeignKey("exercises.id"), primary_key=True)
+    reps: Mapped[int] = mapped_column(primary_key=True)
+    weight: Mapped[float]
+    estimated_1rm: Mapped[float]
+    workout_id: Mapped[UUID]
+    achieved_at: Mapped[datetime]
+
+    def __repr__(self):
+        return f"<PersonalRecord({self.user_id}, {self.exercise_id}: {self.reps} reps @ {self.weight})>"
@@ -11,6 +11,9 @@ class User(Base):
     email: Mapped[str] = mapped_column(String(255))
     username: Mapped[str] = mapped_column(String(100), unique=True)
     created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+    # Bumped in the same transaction as every write to the user's workouts (see
+    # cache/invalidation.py), so caches in any process can tell their entries are stale.
+    write_version: Mapped[int] = mapped_column(default=0, server_default="0")
 
     def __repr__(self):
         return f'User({self.id}, "{self.username}", "{self.email}")'
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, String, Enum as SQLEnum
+from sqlalchemy import ForeignKey, Index, String, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
@@ -27,3 +27,8 @@ class Workout(Base):
             "created_time": self.created_time,  # updated field name
             "logged_exercises": [le.to_dict() for le in self.logged_exercises]
         }
+
+# Hot access paths: a user's history newest first (latest workout, keyset pages)
+# and a user's history filtered by type (latest of type, per-type counts).
+Index("ix_workouts_user_created", Workout.user_id, Workout.created_time.desc(), Workout.id.desc())
+Index("ix_workouts_user_type_created", Workout.user_id, Workout.workout_type, Workout.created_time.desc())
@@ -0,0 +1,26 @@
+from sqlalchemy import ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
+from uuid import UUID
+from src.backend.models.base import Base
+
+ALL_TIME = "all"
+UNCATEGORIZED = "Uncategorized"
+
+class WorkoutRollup(Base):
+    """
+    Running totals per (user, period, workout type), maintained in the same transaction as
+    workout writes. `period` is a calendar month ("YYYY-MM") or ALL_TIME; `workout_type` is an
+    ExerciseGroup value or UNCATEGORIZED.
+    """
+    __tablename__ = "workout_rollups"
+
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("users.id"), primary_key=True)
+    period: Mapped[str] = mapped_column(String(7), primary_key=True)
+    workout_type: Mapped[str] = mapped_column(String(32), primary_key=True)
+    workout_count: Mapped[int] = mapped_column(default=0)
+    set_count: Mapped[int] = mapped_column(default=0)
+    total_reps: Mapped[int] = mapped_column(default=0)
+    total_volume: Mapped[float] = mapped_column(default=0.0)
+
+    def __repr__(self):
+        return f"<WorkoutRollup({self.user_id}, {self.period}, {self.workout_type}: {self.workout_count} workouts)>"
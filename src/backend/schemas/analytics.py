@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+from datetime import date
+from typing import Dict, List
+
+class WeeklyMuscleVolumeOut(BaseModel):
+    week_start: date
+    volume: Dict[str, float]
+
+class DailyLoadOut(BaseModel):
+    date: date
+    volume: float
+    acute: float
+    chronic: float
+    ratio: float
+
+class CategoryTrendOut(BaseModel):
+    mean_weekly_volume: float
+    slope: float
+
+class TrainingAnalyticsOut(BaseModel):
+    weekly_muscle_volume: List[WeeklyMuscleVolumeOut]
+    load: List[DailyLoadOut]
+    category_trends: Dict[str, CategoryTrendOut]
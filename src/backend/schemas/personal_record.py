@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+from uuid import UUID
+from datetime import datetime
+from typing import Optional
+
+class NewRecordOut(BaseModel):
+    exercise_id: UUID
+    reps: int
+    weight: float
+    estimated_1rm: float
+
+class PersonalRecordOut(NewRecordOut):
+    exercise_name: Optional[str] = None
+    workout_id: UUID
+    achieved_at: datetime
@@ -1,8 +1,9 @@
 from pydantic import BaseModel, Field
 from uuid import UUID
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List
 from src.backend.schemas.logged_exercise import LoggedExerciseCreateByName, LoggedExerciseOut  
+from src.backend.schemas.personal_record import NewRecordOut
 from src.backend.models.enums import ExerciseGroup
 
 class WorkoutBase(BaseModel):
@@ -38,4 +39,54 @@ class WorkoutOut(WorkoutBase):
 
     model_config = {
         "from_attributes": True
-    }
\ No newline at end of file
+    }
+
+class WorkoutCreatedOut(WorkoutOut):
+    new_records: List[NewRecordOut] = []
+
+class WorkoutPage(BaseModel):
+    items: List[WorkoutOut]
+    next_cursor: Optional[str] = None
+
+class WorkoutBatchItemResult(BaseModel):
+    index: int
+    id: Optional[UUID] = None
+    error: Optional[str] = None
+
+class WorkoutBatchResult(BaseModel):
+    created: int
+    failed: int
+    error: Optional[str] = None
+    results: List[WorkoutBatchItemResult]
+
+class WorkoutMonthCount(BaseModel):
+    month: str
+    count: int
+
+class WorkoutStatsOut(BaseModel):
+    total_workouts: int
+    first_workout: Optional[datetime] = None
+    last_workout: Optional[datetime] = None
+    by_type: Dict[str, int]
+    by_month: Dict[str, int]
+    by_weekday: Dict[str, int]
+
+class TopSetOut(BaseModel):
+    reps: int
+    weight: float
+
+class ProgressionPointOut(BaseModel):
+    workout_id: UUID
+    created_time: datetime
+    top_set: TopSetOut
+    estimated_1rm: float
+    set_count: int
+    total_volume: float
+
+class WorkoutVolumeOut(BaseModel):
+    period: str
+    workout_type: Optional[ExerciseGroup] = None
+    workout_count: int
+    set_count: int
+    total_reps: int
+    total_volume: float
@@ -0,0 +1,92 @@
+"""
+Microbenchmark: CPU spent turning loaded workout rows into a JSON response body.
+
+Compares the validated paths (Pydantic from_attributes validation of WorkoutOut, then either the
+stdlib encoder or Pydantic's own dump_json, which is what FastAPI does for a response_model) with
+the trusted path read endpoints now use (orm_dumper + orjson). Runs against an in-memory SQLite
+database, so no configuration is needed.
+
+Usage:
+    python -m src.backend.scripts.bench_serialization
+    python -m src.backend.scripts.bench_serialization --workouts 5000 --repeat 10
+"""
+import os
+os.environ.setdefault("TESTING", "1")
+
+import argparse
+import json
+import random
+import timeit
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src.backend.api.responses import dumps, orm_dumper
+from src.backend.crud.workout import get_all_workouts
+from src.backend.database.configure import Base
+from src.backend.models.enums import ExerciseGroup
+from src.backend.models.exercise import Exercise
+from src.backend.models.logged_exercise import LoggedExercise
+from src.backend.models.logged_exercise_set import LoggedExerciseSet
+from src.backend.models.user import User
+from src.backend.models.workout import Workout
+from src.backend.schemas.workout import WorkoutOut
+
+def seed(db, workouts: int, exercises_per_workout: int, sets_per_exercise: int):
+    user = User(id=uuid4(), username="bench", email="bench@example.com")
+    exercises = [
+        Exercise(id=uuid4(), name=f"Exercise {i}", category=group, primary_muscles=["back"])
+        for i, group in enumerate(ExerciseGroup)
+    ]
+    db.add_all([user, *exercises])
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    rows = []
+    for i in range(workouts):
+        workout = Workout(id=uuid4(), user_id=user.id, created_time=start + timedelta(days=i), notes=f"Workout {i}")
+        for exercise in random.sample(exercises, exercises_per_workout):
+            logged = LoggedExercise(id=uuid4(), workout_id=workout.id, exercise_id=exercise.id)
+            logged.sets = [
+                LoggedExerciseSet(id=uuid4(), set_number=n + 1, reps=random.randint(3, 12), weight=random.choice((60.0, 82.5, 100.0)))
+                for n in range(sets_per_exercise)
+            ]
+            workout.logged_exercises.append(logged)
+        rows.append(workout)
+    db.add_all(rows)
+    db.commit()
+    db.expunge_all()
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark workout response serialization")
+    parser.add_argument("--workouts", type=int, default=1000)
+    parser.add_argument("--exercises", type=int, default=3, help="logged exercises per workout")
+    parser.add_argument("--sets", type=int, default=4, help="sets per logged exercise")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    seed(db, args.workouts, args.exercises, args.sets)
+    workouts = get_all_workouts(db)
+
+    adapter = TypeAdapter(list[WorkoutOut])
+    dump = orm_dumper(WorkoutOut)
+    paths = {
+        "validate + stdlib json": lambda: json.dumps(jsonable_encoder(adapter.validate_python(workouts, from_attributes=True))).encode(),
+        "validate + pydantic dump_json": lambda: adapter.dump_json(adapter.validate_python(workouts, from_attributes=True)),
+        "trusted rows + orjson": lambda: dumps([dump(workout) for workout in workouts]),
+    }
+    sizes = {len(body()) for body in paths.values()}
+
+    print(f"{len(workouts)} workouts, {args.exercises * args.sets} sets each, ~{max(sizes) // 1024} KiB of JSON")
+    baseline = None
+    for name, body in paths.items():
+        best = min(timeit.repeat(body, number=1, repeat=args.repeat)) * 1000
+        baseline = baseline or best
+        print(f"  {name:<32} {best:8.2f} ms/request  ({baseline / best:.1f}x)")
+    db.close()
+
+if __name__ == "__main__":
+    main()
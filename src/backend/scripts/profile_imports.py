@@ -0,0 +1,88 @@
+"""
+Report where the API process spends its import time, from a cold interpreter.
+
+Runs `python -X importtime -c "import <module>"` in a subprocess and prints the wall-clock import
+time against the startup budget, the slowest modules by self time, the cost per top-level package,
+and whether any of the dependencies that should load on first use were imported eagerly.
+Exits non-zero when the import is over budget or loads a lazy dependency, so CI can run it.
+
+Usage:
+    python -m src.backend.scripts.profile_imports
+    python -m src.backend.scripts.profile_imports --module src.backend.database.configure --top 30
+"""
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+
+# Cold import of src.backend.main, in seconds. FastAPI, Pydantic and SQLAlchemy alone take most of
+# it (~1s); the budget is generous so only a real regression, not a slow machine, fails the run.
+MAIN_IMPORT_BUDGET = float(os.getenv("MAIN_IMPORT_BUDGET", "2.0"))
+
+# Optional or heavy dependencies that must only be imported by the code paths that use them.
+LAZY_MODULES = ("numpy", "pyarrow", "passlib", "bcrypt", "jwt", "boto3", "aiomysql")
+
+_PROBE = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "import {module}\n"
+    "elapsed = time.perf_counter() - start\n"
+    "print(elapsed)\n"
+    "print(' '.join(name for name in {lazy!r} if name in sys.modules))\n"
+)
+
+@dataclass
+class ImportProfile:
+    elapsed: float
+    eager: list  # LAZY_MODULES that the import loaded anyway
+    modules: list  # (module, self_us, cumulative_us) in import order
+
+def profile_import(module: str = "src.backend.main", env=None) -> ImportProfile:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(module=module, lazy=LAZY_MODULES)],
+        env=env, capture_output=True, text=True
+    )
+    if result.returncode:
+        raise RuntimeError(f"importing {module} failed:\n{result.stderr[-2000:]}")
+    elapsed, eager = (result.stdout.splitlines() + [""])[:2]
+
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+    return ImportProfile(float(elapsed), eager.split(), modules)
+
+def by_package(modules):
+    totals = defaultdict(int)
+    for name, self_us, _ in modules:
+        totals[name.split(".")[0]] += self_us
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile cold import time of the API")
+    parser.add_argument("--module", default="src.backend.main")
+    parser.add_argument("--top", type=int, default=15, help="rows per table")
+    args = parser.parse_args()
+
+    profile = profile_import(args.module)
+    verdict = "within" if profile.elapsed <= MAIN_IMPORT_BUDGET else "OVER"
+    print(f"import {args.module}: {profile.elapsed * 1000:.0f} ms ({verdict} the {MAIN_IMPORT_BUDGET * 1000:.0f} ms budget)")
+    print(f"eagerly imported lazy dependencies: {', '.join(profile.eager) or 'none'}")
+
+    print("\nslowest modules (self time):")
+    for name, self_us, cumulative_us in sorted(profile.modules, key=lambda m: m[1], reverse=True)[:args.top]:
+        print(f"  {self_us / 1000:8.1f} ms  {cumulative_us / 1000:8.1f} ms cumulative  {name}")
+
+    print("\nby top-level package:")
+    for package, self_us in by_package(profile.modules)[:args.top]:
+        print(f"  {self_us / 1000:8.1f} ms  {package}")
+
+    if profile.elapsed > MAIN_IMPORT_BUDGET or profile.eager:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
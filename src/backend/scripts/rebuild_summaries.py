@@ -0,0 +1,45 @@
+"""
+Recompute the tables derived from raw workouts (workout_rollups, personal_records), for backfill
+or to repair drift.
+
+Usage:
+    python -m src.backend.scripts.rebuild_summaries                       # both tables, every user
+    python -m src.backend.scripts.rebuild_summaries --table records
+    python -m src.backend.scripts.rebuild_summaries --table rollups --username bob
+"""
+import argparse
+from src.backend.database.configure import SessionLocal
+from src.backend.crud.records import rebuild_records
+from src.backend.crud.rollup import rebuild_rollups
+from src.backend.crud.user import resolve_user_id
+
+# --table name -> (rebuild function, what its count means)
+REBUILDERS = {
+    "rollups": (rebuild_rollups, "rollup rows"),
+    "records": (rebuild_records, "personal records"),
+}
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild workout rollups and personal records")
+    parser.add_argument("--table", choices=sorted(REBUILDERS), help="only rebuild this table (default: both)")
+    parser.add_argument("--username", help="only rebuild this user's rows")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        user_id = None
+        if args.username:
+            user_id = resolve_user_id(db, args.username)
+            if not user_id:
+                print(f"User '{args.username}' not found.")
+                return
+        for table in [args.table] if args.table else REBUILDERS:
+            rebuild, label = REBUILDERS[table]
+            count = rebuild(db, user_id)
+            print(f"Rebuilt {count} {label}.")
+        db.commit()
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@ from sqlalchemy.orm import Session
 from src.backend.database.configure import SessionLocal
 from src.backend.models import User, Exercise, Workout, LoggedExercise, LoggedExerciseSet
 from src.backend.models.enums import ExerciseGroup
+from src.backend.crud.records import rebuild_records
+from src.backend.crud.rollup import rebuild_rollups
 import uuid
 from datetime import datetime, timedelta, timezone
 
@@ -225,6 +227,10 @@ def main():
     try:
         populate_exercises(db)
         seed_users_and_workouts(db)
+        # Seeded workouts bypass the crud write paths, so derive their rollups and records afterwards.
+        rebuild_rollups(db)
+        rebuild_records(db)
+        db.commit()
     finally:
         db.close()
 
@@ -14,13 +14,15 @@ if project_root not in sys.path:
     sys.path.append(project_root)
 
 from sqlalchemy import func, cast, Date
-from src.backend.database.configure import SessionLocal
+from src.backend.database.replicas import read_router, read_session
 from src.backend.models.user import User
 from src.backend.models.exercise import Exercise
 from src.backend.models.workout import Workout
 from src.backend.models.logged_exercise import LoggedExercise
 from src.backend.models.logged_exercise_set import LoggedExerciseSet
 
+# Streamlit reruns this script on every interaction; only the first run starts the checker.
+read_router.ensure_health_checks()
 
 # === Page Config ===
 st.set_page_config(page_title="Triance Developer Dashboard", layout="wide")
@@ -104,7 +106,7 @@ st.divider()
 st.header("4. Triance Database Table Metrics")
 
 try:
-    db = SessionLocal()
+    db = read_session()
 
     def count_rows(model):
         return db.query(func.count(model.id)).scalar()
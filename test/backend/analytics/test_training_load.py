@@ -0,0 +1,92 @@
+import pytest
+import numpy as np
+from datetime import date, datetime, timedelta
+from src.backend.analytics import (
+    SetColumns,
+    acute_chronic_load,
+    category_trends,
+    get_training_analytics,
+    load_user_sets,
+    muscle_weights,
+    weekly_muscle_volume,
+)
+from src.backend.crud import user as crud_user
+
+def _columns(days, volumes):
+    # One exercise, one rep per set, so each set's volume is its weight.
+    n = len(days)
+    return SetColumns(
+        day=np.array(days, dtype=np.int64),
+        exercise=np.zeros(n, dtype=np.intp),
+        reps=np.ones(n, dtype=np.int64),
+        weight=np.array(volumes, dtype=np.float64),
+        exercise_ids=("only",),
+    )
+
+def test_load_user_sets_returns_columns(db, test_user, test_exercise, make_workout):
+    make_workout(test_user.username, [(5, 100.0), (3, 120.0)], created_time=datetime(2024, 3, 4, 18, 30))
+    make_workout(test_user.username, [(1, 50.0)], created_time=datetime(1970, 1, 2, 23, 59))
+
+    sets = load_user_sets(db, crud_user.resolve_user_id(db, test_user.username))
+
+    assert len(sets) == 3
+    assert sorted(sets.day.tolist()) == [1, 19786, 19786]
+    assert sets.exercise_ids == (test_exercise.id,)
+    assert sorted(sets.volume.tolist()) == [50.0, 360.0, 500.0]
+
+def test_weekly_muscle_volume_credits_secondary_fraction(db, test_user, test_exercise, make_workout):
+    make_workout(test_user.username, [(10, 100.0)], created_time=datetime(2024, 3, 4))
+    make_workout(test_user.username, [(10, 50.0)], created_time=datetime(2024, 3, 10))
+    make_workout(test_user.username, [(1, 100.0)], created_time=datetime(2024, 3, 25))
+    sets = load_user_sets(db, crud_user.resolve_user_id(db, test_user.username))
+
+    muscles, weights = muscle_weights(db, sets.exercise_ids, secondary_fraction=0.25)
+    week_starts, volume = weekly_muscle_volume(sets, weights)
+
+    assert muscles == ("back", "glutes")
+    assert week_starts == [date(2024, 3, 4), date(2024, 3, 11), date(2024, 3, 18), date(2024, 3, 25)]
+    assert volume.tolist() == [[1500.0, 375.0], [0.0, 0.0], [0.0, 0.0], [100.0, 25.0]]
+
+def test_acute_chronic_load_rolling_means():
+    sets = _columns([0, 0, 6, 27], [70.0, 70.0, 140.0, 280.0])
+
+    days, daily, acute, chronic, ratio = acute_chronic_load(sets)
+
+    assert len(days) == 28 and days[0] == date(1970, 1, 1)
+    assert daily[0] == 140.0
+    assert acute[6] == pytest.approx(40.0)
+    assert acute[7] == pytest.approx(20.0)
+    assert chronic[27] == pytest.approx(20.0)
+    assert ratio[27] == pytest.approx(acute[27] / 20.0)
+
+def test_acute_chronic_load_empty():
+    days, daily, acute, chronic, ratio = acute_chronic_load(_columns([], []))
+    assert days == [] and len(ratio) == 0
+
+def test_category_trends_slope(db, test_user, test_exercise, make_workout):
+    start = datetime(2024, 1, 1)
+    for week, weight in enumerate((100.0, 110.0, 120.0, 130.0)):
+        make_workout(test_user.username, [(1, weight)], created_time=start + timedelta(weeks=week))
+    sets = load_user_sets(db, crud_user.resolve_user_id(db, test_user.username))
+
+    trends = category_trends(db, sets, weeks=4)
+
+    assert list(trends) == ["Pull"]
+    assert trends["Pull"]["slope"] == pytest.approx(10.0)
+    assert trends["Pull"]["mean_weekly_volume"] == pytest.approx(115.0)
+
+def test_get_training_analytics_single_query(db, test_user, test_exercise, make_workout, count_queries):
+    for day in range(30):
+        make_workout(test_user.username, [(5, 100.0)], created_time=datetime(2024, 1, 1) + timedelta(days=day))
+    get_training_analytics(test_user.username, db, weeks=2)
+
+    with count_queries() as statements:
+        analytics = get_training_analytics(test_user.username, db, weeks=2)
+
+    assert len(statements) == 1
+    assert len(analytics["weekly_muscle_volume"]) == 2
+    assert len(analytics["load"]) == 14
+    assert analytics["load"][-1]["ratio"] == pytest.approx(1.0)
+
+def test_get_training_analytics_unknown_user(db):
+    assert get_training_analytics("nobody", db) == {"weekly_muscle_volume": [], "load": [], "category_trends": {}}
@@ -0,0 +1,125 @@
+import asyncio
+import os
+import threading
+import anyio.to_thread
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from src.backend.cache.exercise_catalog import exercise_catalog
+from src.backend.database.async_session import get_async_db
+from src.backend.database.configure import Base, get_db
+from src.backend.database.replicas import get_read_db
+from src.backend.main import include_routers
+from test.backend.conftest import create_temp_db_engine
+
+@pytest.fixture
+def async_app():
+    engine, db_path = create_temp_db_engine()
+    Base.metadata.create_all(bind=engine)
+    SyncSession = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    AsyncSession = async_sessionmaker(async_engine, autoflush=False)
+
+    def override_get_db():
+        db = SyncSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def override_get_async_db():
+        async with AsyncSession() as db:
+            yield db
+
+    app = FastAPI()
+    include_routers(app, async_db=True)
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    yield app, async_engine
+
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+    os.remove(db_path)
+
+@pytest.fixture
+def async_client(async_app):
+    app, async_engine = async_app
+    with TestClient(app) as client:
+        client.post("/api/users/", json={"email": "async@example.com", "username": "asyncuser"})
+        client.post("/api/exercises/", json={"name": "Squat", "primary_muscles": ["quads"], "category": "Quads"})
+        yield client
+        client.portal.call(async_engine.dispose)
+
+def _workout(notes, sets=((5, 100.0),)):
+    return {
+        "username": "asyncuser",
+        "notes": notes,
+        "logged_exercises": [{
+            "name": "Squat",
+            "sets": [{"set_number": i + 1, "reps": reps, "weight": weight} for i, (reps, weight) in enumerate(sets)]
+        }]
+    }
+
+def test_async_routes_round_trip(async_client):
+    created = async_client.post("/api/workouts/", json=_workout("first", [(5, 100.0), (5, 110.0)]))
+    assert created.status_code == 201
+    assert [r["weight"] for r in created.json()["new_records"]] == [110.0]
+    workout_id = created.json()["id"]
+    async_client.post("/api/workouts/", json=_workout("second"))
+
+    assert async_client.get(f"/api/workouts/{workout_id}").json()["notes"] == "first"
+    assert [w["notes"] for w in async_client.get("/api/workouts/user/asyncuser").json()] == ["second", "first"]
+    page = async_client.get("/api/workouts/user/asyncuser", params={"limit": 1}).json()
+    assert len(page["items"]) == 1 and page["next_cursor"]
+    assert async_client.get("/api/workouts/user/asyncuser/latest").json()["notes"] == "second"
+    assert async_client.get("/api/workouts/user/nobody/latest").status_code == 404
+
+    updated = async_client.patch(f"/api/workouts/{workout_id}", json={"notes": "edited"})
+    assert updated.json()["notes"] == "edited"
+    assert async_client.delete(f"/api/workouts/{workout_id}").status_code == 204
+    assert async_client.get(f"/api/workouts/{workout_id}").status_code == 404
+
+    # Rollups written through the async session are visible to the sync routes.
+    volume = async_client.get("/api/workouts/user/asyncuser/volume").json()
+    assert (volume["workout_count"], volume["set_count"]) == (1, 1)
+
+def test_async_routes_do_not_use_the_thread_pool(async_app, async_client):
+    app, _ = async_app
+    async_client.post("/api/workouts/", json=_workout("only"))
+
+    async def run():
+        limiter = anyio.to_thread.current_default_thread_limiter()
+        limiter.total_tokens = 1
+        await limiter.acquire()
+        try:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                requests = [client.get("/api/workouts/user/asyncuser/latest") for _ in range(100)]
+                return await asyncio.wait_for(asyncio.gather(*requests), timeout=30)
+        finally:
+            limiter.release()
+
+    responses = asyncio.run(run())
+    assert all(r.status_code == 200 for r in responses)
+
+def test_concurrent_async_writes_against_a_stale_catalog(async_app, async_client):
+    app, _ = async_app
+
+    async def run():
+        exercise_catalog.invalidate()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            requests = [client.post("/api/workouts/", json=_workout(f"w{i}")) for i in range(5)]
+            responses.extend(await asyncio.gather(*requests))
+
+    # A deadlocked event loop never lets asyncio.wait_for fire, so time out from another thread.
+    responses = []
+    loop = threading.Thread(target=asyncio.run, args=(run(),), daemon=True)
+    loop.start()
+    loop.join(timeout=30)
+    assert not loop.is_alive(), "concurrent writes deadlocked the event loop"
+    assert [r.status_code for r in responses] == [201] * 5
@@ -69,6 +69,14 @@ def test_get_all_exercises(client):
     assert "Deadlift" in names
     assert "Overhead Press" in names
 
+def test_get_all_exercises_streamed(client):
+    for name in ("Deadlift", "Overhead Press"):
+        client.post("/api/exercises/", json={"name": name, "primary_muscles": ["back"], "category": "Pull"})
+
+    response = client.get("/api/exercises/", params={"stream": "true"})
+    assert response.status_code == 200
+    assert response.json() == client.get("/api/exercises/").json()
+
 def test_delete_exercise(client):
     response = client.post("/api/exercises/", json={
         "name": "Barbell Row",
@@ -132,4 +140,42 @@ def test_create_batch_exercises(client):
     assert len(data) == 2
     names = [e["name"] for e in data]
     assert "Pushup_Batch1" in names
-    assert "Plank_Batch1" in names
\ No newline at end of file
+    assert "Plank_Batch1" in names
+
+def test_get_exercises_by_name_case_insensitive(client):
+    client.post("/api/exercises/", json={
+        "name": "Front Squat",
+        "primary_muscles": ["quads"],
+        "category": "Quads"
+    })
+
+    response = client.get("/api/exercises/", params={"name": "front squat"})
+    assert response.status_code == 200
+    assert [e["name"] for e in response.json()] == ["Front Squat"]
+
+    response = client.get("/api/exercises/", params={"name": "back squat"})
+    assert response.json() == []
+
+def test_exercise_reads_served_from_catalog(client, count_queries):
+    client.post("/api/exercises/", json={
+        "name": "Front Squat",
+        "primary_muscles": ["quads"],
+        "category": "Quads"
+    })
+
+    with count_queries() as statements:
+        assert client.get("/api/exercises/").status_code == 200
+        assert client.get("/api/exercises/categorized").json()["Quads"][0]["name"] == "Front Squat"
+    assert statements == []
+
+def test_search_exercises_by_prefix(client):
+    for name, category in (("Bench Press", "Push"), ("Bent Over Row", "Pull"), ("Squat", "Quads")):
+        client.post("/api/exercises/", json={"name": name, "primary_muscles": ["x"], "category": category})
+
+    response = client.get("/api/exercises/search", params={"prefix": "ben"})
+    assert response.status_code == 200
+    assert [e["name"] for e in response.json()] == ["Bench Press", "Bent Over Row"]
+    assert set(response.json()[0]) == {"id", "name", "category"}
+
+    assert client.get("/api/exercises/search", params={"prefix": "ben", "limit": 1}).json()[0]["name"] == "Bench Press"
+    assert client.get("/api/exercises/search").status_code == 422
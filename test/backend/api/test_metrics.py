@@ -0,0 +1,13 @@
+import pytest
+
+def test_cache_metrics_report_user_id_cache(client, setup_user_and_exercise_api):
+    setup_user_and_exercise_api()
+    for _ in range(2):
+        client.get("/api/workouts/user/testuser")
+
+    res = client.get("/api/metrics/cache")
+    assert res.status_code == 200
+    stats = res.json()["user_ids"]
+    assert stats["misses"] >= 1
+    assert stats["hits"] >= 1
+    assert stats["size"] == 1
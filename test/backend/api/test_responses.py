@@ -0,0 +1,36 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+from pydantic import TypeAdapter
+from src.backend.api.responses import dumps, orm_dumper, orm_response
+from src.backend.crud import workout as crud_workout
+from src.backend.models.enums import ExerciseGroup
+from src.backend.schemas.exercise import ExerciseOut
+from src.backend.schemas.workout import WorkoutOut
+
+def _create_workouts(make_workout, username):
+    make_workout(
+        username, [(5, 180.0), (3, 192.5)], notes="Heavy pulls", workout_type=ExerciseGroup.PULL,
+        created_time=datetime(2024, 3, 1, 7, 30, 15, 123456, tzinfo=timezone.utc)
+    )
+    make_workout(username, [(10, 100)])
+
+def test_orm_response_matches_validated_output(db, test_user, test_exercise, make_workout):
+    _create_workouts(make_workout, test_user.username)
+    db.expunge_all()
+    workouts = crud_workout.get_all_workouts(db)
+
+    adapter = TypeAdapter(list[WorkoutOut])
+    validated = adapter.dump_json(adapter.validate_python(workouts, from_attributes=True))
+    assert orm_response(workouts, WorkoutOut).body == validated
+
+def test_dumps_matches_pydantic_for_utc_datetimes():
+    when = datetime(2024, 1, 1, 7, 30, 15, 123456, tzinfo=timezone.utc)
+    assert dumps({"when": when}) == b'{"when":' + TypeAdapter(datetime).dump_json(when) + b"}"
+
+def test_orm_dumper_uses_schema_defaults_for_missing_attributes():
+    row = SimpleNamespace(id=uuid4(), name="Plank", category=ExerciseGroup.CUSTOM, primary_muscles=("abs",))
+    dumped = orm_dumper(ExerciseOut)(row)
+    assert dumped["secondary_muscles"] is None
+    assert dumped["description"] is None
+    assert dumped["primary_muscles"] == ("abs",)
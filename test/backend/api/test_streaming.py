@@ -0,0 +1,68 @@
+import asyncio
+import json
+import pytest
+from types import SimpleNamespace
+from pydantic import BaseModel
+from src.backend.api.streaming import MalformedItem, iter_json_array, iter_json_items
+
+async def _chunks(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+def _parse(data: bytes, size: int = 3, **kwargs):
+    async def _collect():
+        return [item async for item in iter_json_items(_chunks(data, size), **kwargs)]
+    return asyncio.run(_collect())
+
+ITEMS = [{"name": "Squat", "n": 1}, {"name": "Écarté", "n": [1, 2, {"x": "]"}]}, {"name": "Row,", "n": None}]
+
+@pytest.mark.parametrize("size", [1, 2, 7, 4096])
+def test_parses_json_array_across_chunk_boundaries(size):
+    data = json.dumps(ITEMS, ensure_ascii=False).encode()
+    assert _parse(data, size) == ITEMS
+
+@pytest.mark.parametrize("size", [1, 5, 4096])
+def test_parses_ndjson_across_chunk_boundaries(size):
+    data = ("\n".join(json.dumps(item, ensure_ascii=False) for item in ITEMS) + "\n").encode()
+    assert _parse(data, size) == ITEMS
+
+def test_ndjson_without_trailing_newline_and_blank_lines():
+    data = b'{"a": 1}\n\n{"a": 2}'
+    assert _parse(data) == [{"a": 1}, {"a": 2}]
+
+def test_ndjson_malformed_line_is_reported_and_skipped():
+    items = _parse(b'{"a": 1}\n{"a": \n{"a": 3}\n')
+    assert items[0] == {"a": 1}
+    assert isinstance(items[1], MalformedItem)
+    assert items[2] == {"a": 3}
+
+def test_empty_body_and_empty_array():
+    assert _parse(b"") == []
+    assert _parse(b" [ ] ") == []
+
+@pytest.mark.parametrize("data", [b'[{"a": 1} {"a": 2}]', b'[{"a": 1}, {"a": ', b'[{"a": 1}'])
+def test_malformed_array_raises(data):
+    with pytest.raises(ValueError):
+        _parse(data)
+
+def test_oversized_item_raises():
+    data = json.dumps([{"notes": "x" * 100}]).encode()
+    with pytest.raises(ValueError):
+        _parse(data, size=8, max_item_bytes=50)
+
+class _Item(BaseModel):
+    name: str
+    n: int
+
+def test_json_array_is_written_incrementally():
+    items = [{"name": f"item {i}", "n": i} for i in range(100)]
+    rows = (SimpleNamespace(**item) for item in items)
+    chunks = list(iter_json_array(rows, _Item, flush_bytes=256))
+
+    assert chunks[0] == b"["
+    assert len(chunks) > 3
+    assert all(len(chunk) < 256 + 64 for chunk in chunks)
+    assert json.loads(b"".join(chunks)) == items
+
+def test_json_array_empty():
+    assert b"".join(iter_json_array(iter([]), _Item)) == b"[]"
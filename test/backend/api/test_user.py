@@ -37,6 +37,15 @@ def test_get_all_users(client, create_user_api):
     assert "a" in usernames
     assert "b" in usernames
 
+def test_get_all_users_streamed(client, create_user_api):
+    create_user_api(username="a", email="a@example.com")
+    create_user_api(username="b", email="b@example.com")
+
+    response = client.get("/api/users/", params={"stream": "true"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == client.get("/api/users/").json()
+
 def test_delete_user(client, create_user_api):
     user = create_user_api(username="deleteuser", email="delete@example.com")
     user_id = user["id"]
@@ -1,5 +1,11 @@
+import csv
+import io
+import json
+import pyarrow.parquet as pq
 import pytest
 from uuid import uuid4
+from src.backend.api import workout as workout_api
+from src.backend.crud.loading import WORKOUT_GRAPH_QUERIES
 
 def test_create_workout(client, setup_user_and_exercise_api):
     setup_user_and_exercise_api()
@@ -279,4 +285,316 @@ def test_api_workout_frequency_by_type_zero(client, setup_user_and_exercise_api)
 
     res = client.get("/api/workouts/user/typeuser2/frequency/Push")
     assert res.status_code == 200
-    assert res.json() == 0
\ No newline at end of file
+    assert res.json() == 0
+
+def _post_workouts(client, username, exercise_name, count):
+    for i in range(count):
+        client.post("/api/workouts/", json={
+            "username": username,
+            "notes": f"Workout {i}",
+            "logged_exercises": [{
+                "name": exercise_name,
+                "sets": [
+                    {"set_number": 1, "reps": 5, "weight": 100.0},
+                    {"set_number": 2, "reps": 5, "weight": 105.0}
+                ]
+            }]
+        })
+
+@pytest.mark.parametrize("path", [
+    "/api/workouts/",
+    "/api/workouts/user/budgetuser",
+    "/api/workouts/user/budgetuser/latest",
+])
+def test_workout_read_query_budget(client, setup_user_and_exercise_api, count_queries, path):
+    setup_user_and_exercise_api(username="budgetuser", email="budget@example.com")
+
+    _post_workouts(client, "budgetuser", "Squat", 1)
+    with count_queries() as statements:
+        assert client.get(path).status_code == 200
+    small = len(statements)
+
+    _post_workouts(client, "budgetuser", "Squat", 10)
+    with count_queries() as statements:
+        assert client.get(path).status_code == 200
+    large = len(statements)
+
+    assert small == large
+    assert large <= WORKOUT_GRAPH_QUERIES
+
+def test_get_workout_by_id_query_budget(client, setup_user_and_exercise_api, count_queries):
+    setup_user_and_exercise_api()
+    _post_workouts(client, "testuser", "Squat", 1)
+    workout_id = client.get("/api/workouts/user/testuser/latest").json()["id"]
+
+    with count_queries() as statements:
+        assert client.get(f"/api/workouts/{workout_id}").status_code == 200
+    assert len(statements) <= WORKOUT_GRAPH_QUERIES
+
+def test_get_workouts_by_user_paginated(client, setup_user_and_exercise_api):
+    setup_user_and_exercise_api(username="pageuser", email="page@example.com")
+    _post_workouts(client, "pageuser", "Squat", 5)
+
+    first = client.get("/api/workouts/user/pageuser", params={"limit": 2})
+    assert first.status_code == 200
+    body = first.json()
+    assert len(body["items"]) == 2
+    assert body["next_cursor"]
+
+    ids = [w["id"] for w in body["items"]]
+    cursor = body["next_cursor"]
+    while cursor:
+        body = client.get("/api/workouts/user/pageuser", params={"limit": 2, "cursor": cursor}).json()
+        ids.extend(w["id"] for w in body["items"])
+        cursor = body["next_cursor"]
+
+    assert len(ids) == 5
+    assert len(set(ids)) == 5
+
+def test_get_all_workouts_paginated_last_page(client, setup_user_and_exercise_api):
+    setup_user_and_exercise_api()
+    _post_workouts(client, "testuser", "Squat", 2)
+
+    res = client.get("/api/workouts/", params={"limit": 5})
+    assert res.status_code == 200
+    assert len(res.json()["items"]) == 2
+    assert res.json()["next_cursor"] is None
+
+def test_get_workouts_paginated_invalid_cursor(client, setup_user_and_exercise_api):
+    setup_user_and_exercise_api()
+    res = client.get("/api/workouts/user/testuser", params={"cursor": "garbage"})
+    assert res.status_code == 400
+    assert res.json()["detail"] == "Invalid cursor"
+
+def test_get_workouts_paginated_page_cost_is_constant(client, setup_user_and_exercise_api, count_queries):
+    setup_user_and_exercise_api(username="deepuser", email="deep@example.com")
+    _post_workouts(client, "deepuser", "Squat", 6)
+
+    cursor = None
+    counts = []
+    for _ in range(3):
+        with count_queries() as statements:
+            body = client.get("/api/workouts/user/deepuser", params={"limit": 2, "cursor": cursor}).json()
+        counts.append(len(statements))
+        cursor = body["next_cursor"]
+
+    assert len(set(counts)) == 1
+
+def test_get_all_workouts_streamed_matches_list(client, setup_user_and_exercise_api):
+    setup_user_and_exercise_api()
+    _post_workouts(client, "testuser", "Squat", 3)
+
+    streamed = client.get("/api/workouts/", params={"stream": "true"})
+    assert streamed.status_code == 200
+    assert streamed.headers["content-type"] == "application/json"
+    by_id = lambda workouts: sorted(workouts, key=lambda w: w["id"])
+    assert by_id(streamed.json()) == by_id(client.get("/api/workouts/").json())
+
+def test_get_all_workouts_stream_rejects_pagination(client):
+    res = client.get("/api/workouts/", params={"stream": "true", "limit": 2})
+    assert res.status_code == 400
+
+def _batch_item(username, exercise_name="Squat", notes=None, created_time=None):
+    item = {
+        "username": username,
+        "notes": notes,
+        "logged_exercises": [{
+            "name": exercise_name,
+            "sets": [{"set_number": 1, "reps": 5, "weight": 100.0}]
+        }]
+    }
+    if created_time:
+        item["created_time"] = created_time
+    return item
+
+def test_batch_create_workouts_json_array(client, setup_user_and_exercise_api):
+    setup_user_and_exercise_api()
+    items = [_batch_item("testuser", notes=f"Imported {i}", created_time=f"2023-01-0{i + 1}T10:00") for i in range(3)]
+
+    res = client.post("/api/workouts/batch", json=items)
+    assert res.status_code == 200
+    body = res.json()
+    assert body["created"] == 3
+    assert body["failed"] == 0
+    assert [r["index"] for r in body["results"]] == [0, 1, 2]
+    assert all(r["id"] for r in body["results"])
+
+    history = client.get("/api/workouts/user/testuser").json()
+    assert [w["notes"] for w in history] == ["Imported 2", "Imported 1", "Imported 0"]
+
+def test_batch_create_workouts_ndjson_reports_per_item_errors(client, setup_user_and_exercise_api, monkeypatch):
+    setup_user_and_exercise_api()
+    monkeypatch.setattr(workout_api, "BATCH_CHUNK_SIZE", 2)
+    lines = [
+        json.dumps(_batch_item("testuser")),
+        json.dumps(_batch_item("ghost")),
+        "{not json",
+        json.dumps(_batch_item("testuser", exercise_name="Snatch")),
+        json.dumps({"username": "testuser", "logged_exercises": []}),
+        json.dumps(_batch_item("testuser")),
+    ]
+
+    res = client.post(
+        "/api/workouts/batch",
+        content="\n".join(lines).encode(),
+        headers={"Content-Type": "application/x-ndjson"}
+    )
+    assert res.status_code == 200
+    body = res.json()
+    assert body["created"] == 2
+    assert body["failed"] == 4
+    results = body["results"]
+    assert [r["index"] for r in results] == list(range(6))
+    assert results[1]["error"] == "User not found"
+    assert results[2]["error"].startswith("Invalid JSON")
+    assert results[3]["error"] == "Exercise 'Snatch' not found"
+    assert results[4]["error"].startswith("Invalid workout")
+    assert results[0]["id"] and results[5]["id"]
+    assert len(client.get("/api/workouts/user/testuser").json()) == 2
+
+def test_batch_create_workouts_malformed_array(client):
+    res = client.post("/api/workouts/batch", content=b'[{"username": ')
+    assert res.status_code == 400
+
+def test_batch_create_workouts_statements_per_chunk_are_constant(client, setup_user_and_exercise_api, count_queries, monkeypatch):
+    setup_user_and_exercise_api()
+    client.post("/api/workouts/batch", json=[_batch_item("testuser")])
+
+    with count_queries() as small:
+        client.post("/api/workouts/batch", json=[_batch_item("testuser")])
+    with count_queries() as large:
+        client.post("/api/workouts/batch", json=[_batch_item("testuser") for _ in range(50)])
+
+    assert len(small) == len(large)
+
+def test_api_workout_month_histogram(client, setup_user_and_exercise_api):
+    setup_user_and_exercise_api(username="histuser", email="hist@example.com")
+    for created_time in ("2024-03-01T10:00", "2024-03-15T10:00", "2024-05-01T10:00"):
+        client.post("/api/workouts/", json=_batch_item("histuser", created_time=created_time))
+
+    res = client.get("/api/workouts/user/histuser/frequency/month/histogram")
+    assert res.status_code == 200
+    assert res.json() == [
+        {"month": "2024-03", "count": 2},
+        {"month": "2024-04", "count": 0},
+        {"month": "2024-05", "count": 1},
+    ]
+
+def test_api_workout_stats(client, setup_user_and_exercise_api):
+    setup_user_and_exercise_api(username="statsuser", email="stats@example.com")
+    for created_time, workout_type in (("2024-03-04T10:00", "Push"), ("2024-03-05T10:00", "Pull"), ("2024-04-01T10:00", "Push")):
+        item = _batch_item("statsuser", created_time=created_time)
+        item["workout_type"] = workout_type
+        client.post("/api/workouts/", json=item)
+
+    res = client.get("/api/workouts/user/statsuser/stats")
+    assert res.status_code == 200
+    stats = res.json()
+    assert stats["total_workouts"] == 3
+    assert stats["by_type"]["Push"] == 2
+    assert stats["by_month"] == {"2024-03": 2, "2024-04": 1}
+    assert stats["by_weekday"]["Monday"] == 2
+    assert stats["first_workout"].startswith("2024-03-04")
+
+def test_api_workout_volume(client, setup_user_and_exercise_api):
+    setup_user_and_exercise_api(username="voluser", email="vol@example.com")
+    for created_time, workout_type in (("2024-03-04T10:00", "Push"), ("2024-04-01T10:00", "Pull")):
+        item = _batch_item("voluser", created_time=created_time)
+        item["workout_type"] = workout_type
+        client.post("/api/workouts/", json=item)
+
+    res = client.get("/api/workouts/user/voluser/volume")
+    assert res.status_code == 200
+    total = res.json()
+    assert total["workout_count"] == 2
+    assert total["set_count"] > 0
+
+    res = client.get("/api/workouts/user/voluser/volume", params={"period": "2024-03", "workout_type": "Push"})
+    assert res.json()["workout_count"] == 1
+    assert res.json()["total_volume"] == total["total_volume"] / 2
+
+    assert client.get("/api/workouts/user/voluser/volume", params={"period": "March"}).status_code == 422
+
+def test_api_exercise_progression(client, setup_user_and_exercise_api):
+    setup_user_and_exercise_api(username="proguser", email="prog@example.com")
+    exercise_id = client.get("/api/exercises/", params={"name": "Squat"}).json()[0]["id"]
+    for created_time in ("2024-03-01T10:00", "2024-03-08T10:00"):
+        client.post("/api/workouts/", json=_batch_item("proguser", created_time=created_time))
+
+    res = client.get(f"/api/workouts/user/proguser/progression/{exercise_id}")
+    assert res.status_code == 200
+    series = res.json()
+    assert len(series) == 2
+    assert series[0]["created_time"].startswith("2024-03-01")
+    assert set(series[0]) == {"workout_id", "created_time", "top_set", "estimated_1rm", "set_count", "total_volume"}
+
+def test_api_personal_records(client, setup_user_and_exercise_api):
+    setup_user_and_exercise_api(username="pruser", email="pr@example.com")
+    item = _batch_item("pruser")
+    created = client.post("/api/workouts/", json=item)
+    assert created.status_code == 201
+    assert created.json()["new_records"]
+
+    repeat = client.post("/api/workouts/", json=item)
+    assert repeat.json()["new_records"] == []
+
+    res = client.get("/api/workouts/user/pruser/records")
+    assert res.status_code == 200
+    records = res.json()
+    assert records and all(r["exercise_name"] == "Squat" for r in records)
+    assert client.get("/api/workouts/user/nobody/records").json() == []
+
+def test_api_training_analytics(client, setup_user_and_exercise_api):
+    setup_user_and_exercise_api(username="loaduser", email="load@example.com")
+    for created_time in ("2024-03-04T10:00", "2024-03-12T10:00"):
+        client.post("/api/workouts/", json=_batch_item("loaduser", created_time=created_time))
+
+    res = client.get("/api/workouts/user/loaduser/analytics", params={"weeks": 4, "secondary_fraction": 0.5})
+    assert res.status_code == 200
+    analytics = res.json()
+    assert [w["week_start"] for w in analytics["weekly_muscle_volume"]] == ["2024-03-04", "2024-03-11"]
+    assert list(analytics["category_trends"]) == ["Quads"]
+    assert analytics["load"][-1]["date"] == "2024-03-12"
+
+    assert client.get("/api/workouts/user/loaduser/analytics", params={"secondary_fraction": 2}).status_code == 422
+
+def _export_user(client, setup_user_and_exercise_api, username):
+    setup_user_and_exercise_api(username=username, email=f"{username}@example.com")
+    for created_time in ("2024-03-01T10:00", "2024-03-02T10:00"):
+        client.post("/api/workouts/", json=_batch_item(username, notes="a, \"quoted\" note", created_time=created_time))
+
+def test_api_export_csv_is_gzipped(client, setup_user_and_exercise_api):
+    _export_user(client, setup_user_and_exercise_api, "csvuser")
+
+    res = client.get("/api/workouts/user/csvuser/export", params={"format": "csv"})
+    assert res.status_code == 200
+    assert res.headers["content-encoding"] == "gzip"
+    assert res.headers["content-type"].startswith("text/csv")
+    assert 'filename="csvuser-workouts.csv"' in res.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(res.text)))
+    assert rows and rows[0]["exercise"] == "Squat"
+    assert rows[0]["notes"] == "a, \"quoted\" note"
+    assert rows[0]["created_time"].startswith("2024-03-01")
+
+def test_api_export_ndjson(client, setup_user_and_exercise_api):
+    _export_user(client, setup_user_and_exercise_api, "ndjsonuser")
+
+    res = client.get("/api/workouts/user/ndjsonuser/export", params={"format": "ndjson"})
+    assert res.status_code == 200
+    rows = [json.loads(line) for line in res.text.splitlines()]
+    assert {row["created_time"][:10] for row in rows} == {"2024-03-01", "2024-03-02"}
+    assert isinstance(rows[0]["reps"], int)
+
+def test_api_export_parquet(client, setup_user_and_exercise_api):
+    _export_user(client, setup_user_and_exercise_api, "parquser")
+
+    res = client.get("/api/workouts/user/parquser/export", params={"format": "parquet"})
+    assert res.status_code == 200
+    assert "content-encoding" not in res.headers
+    table = pq.read_table(io.BytesIO(res.content))
+    assert table.num_rows > 0
+    assert table.column("exercise").to_pylist()[0] == "Squat"
+
+def test_api_export_errors(client):
+    assert client.get("/api/workouts/user/nobody/export").status_code == 404
+    assert client.get("/api/workouts/user/nobody/export", params={"format": "xlsx"}).status_code == 422
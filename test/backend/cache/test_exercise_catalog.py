@@ -0,0 +1,114 @@
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from src.backend.cache.exercise_catalog import ExerciseCatalog, exercise_catalog
+from src.backend.crud import exercise as crud_exercise
+from src.backend.models.enums import ExerciseGroup
+from src.backend.models.exercise import Exercise
+from src.backend.schemas.exercise import ExerciseCreate, ExerciseUpdate
+
+def _create(db, name, category=ExerciseGroup.PUSH):
+    return crud_exercise.create_exercise(db, ExerciseCreate(
+        name=name,
+        primary_muscles=["chest"],
+        category=category
+    ))
+
+def test_catalog_reads_make_no_queries_once_loaded(db, count_queries):
+    bench_id = _create(db, "Bench Press").id
+    _create(db, "Squat", ExerciseGroup.QUADS)
+
+    with count_queries() as statements:
+        assert [e.name for e in crud_exercise.get_all_exercises(db)] == ["Bench Press", "Squat"]
+        assert crud_exercise.get_exercise_by_id(db, bench_id).name == "Bench Press"
+        assert crud_exercise.get_exercise_by_name(db, "bench press").id == bench_id
+        assert set(crud_exercise.get_all_exercises_categorized(db)) == {"Push", "Quads"}
+    assert statements == []
+
+def test_catalog_refreshes_after_update_and_delete(db):
+    bench = _create(db, "Bench Press")
+    crud_exercise.get_all_exercises(db)
+
+    crud_exercise.update_exercise(db, bench.id, ExerciseUpdate(name="Flat Bench"))
+    assert crud_exercise.get_exercise_by_name(db, "Flat Bench").id == bench.id
+    assert crud_exercise.get_exercise_by_name(db, "Bench Press") is None
+
+    crud_exercise.delete_exercise(db, bench.id)
+    assert crud_exercise.get_exercise_by_id(db, bench.id) is None
+    assert crud_exercise.get_all_exercises(db) == []
+
+def test_catalog_picks_up_rows_written_by_other_workers(db):
+    crud_exercise.get_all_exercises(db)
+    db.add(Exercise(name="Dip", primary_muscles=["triceps"], category=ExerciseGroup.PUSH))
+    db.commit()
+
+    assert crud_exercise.get_exercise_by_name(db, "DIP") is not None
+    assert len(crud_exercise.get_all_exercises(db)) == 1
+
+def test_catalog_reloads_when_older_than_max_age(db, clock):
+    catalog = ExerciseCatalog(max_age=60, clock=clock)
+    catalog.get_all(db)
+    db.add(Exercise(name="Dip", primary_muscles=["triceps"], category=ExerciseGroup.PUSH))
+    db.commit()
+
+    assert catalog.get_all(db) == []
+    clock.now = 60.0
+    assert [e.name for e in catalog.get_all(db)] == ["Dip"]
+    assert catalog.stats()["loads"] == 2
+
+def test_concurrent_stale_reads_reload_once(db, clock):
+    catalog = ExerciseCatalog(max_age=60, clock=clock)
+    first = catalog.snapshot(db)
+    loads = []
+    load = catalog._load
+
+    def slow_load(session):
+        loads.append(1)
+        time.sleep(0.05)
+        return load(session)
+
+    catalog._load = slow_load
+    clock.now = 60.0
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        snapshots = list(pool.map(lambda _: catalog.snapshot(db), range(8)))
+    # One request reloads; the others keep serving the expired snapshot instead of waiting.
+    assert len(loads) == 1
+    assert first in snapshots
+    assert catalog.snapshot(db).generation == 2
+
+    catalog.refresh(db)
+    assert len(loads) == 2
+    assert catalog.snapshot(db).generation == 3
+
+def test_slower_reload_does_not_replace_a_newer_snapshot(db):
+    catalog = ExerciseCatalog(max_age=60)
+    load = catalog._load
+    db.add(Exercise(name="Dip", primary_muscles=["triceps"], category=ExerciseGroup.PUSH))
+    db.commit()
+
+    def stale_load(session):
+        # A newer reload starts and publishes while this one is still reading.
+        catalog._load = load
+        newer = catalog.refresh(db)
+        assert [e.name for e in newer.exercises] == ["Dip"]
+        return []
+
+    catalog._load = stale_load
+    assert [e.name for e in catalog.refresh(db).exercises] == ["Dip"]
+
+def test_catalog_stats(db):
+    _create(db, "Bench Press")
+    crud_exercise.get_all_exercises(db)
+
+    stats = exercise_catalog.stats()
+    assert stats["size"] == 1
+    assert stats["reads"] == 1
+
+def test_search_prefix_is_case_insensitive_sorted_and_limited(db):
+    for name in ("Bench Press", "bent over row", "Squat", "Bulgarian Split Squat", "Belt Squat"):
+        _create(db, name)
+
+    assert [e.name for e in crud_exercise.search_exercises_by_prefix(db, "BE", 10)] == ["Belt Squat", "Bench Press", "bent over row"]
+    assert [e.name for e in crud_exercise.search_exercises_by_prefix(db, "b", 2)] == ["Belt Squat", "Bench Press"]
+    assert crud_exercise.search_exercises_by_prefix(db, "z", 10) == []
+    assert crud_exercise.search_exercises_by_prefix(db, "squat jump", 10) == []
@@ -3,16 +3,22 @@ os.environ["TESTING"] = "1"
 
 import tempfile
 import pytest
+from contextlib import contextmanager
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
+from src.backend.cache import clear_caches
 from src.backend.crud import user as crud_user
 from src.backend.crud import exercise as crud_exercise
+from src.backend.crud import workout as crud_workout
 from src.backend.database.configure import Base, get_db
+from src.backend.database.replicas import get_read_db
 from src.backend.main import app
 from src.backend.models.enums import ExerciseGroup
 from src.backend.schemas.user import UserCreate
 from src.backend.schemas.exercise import ExerciseCreate
+from src.backend.schemas.workout import WorkoutCreateSimple
 
 
 def create_temp_db_engine():
@@ -22,6 +28,25 @@ def create_temp_db_engine():
     engine = create_engine(test_database_url, connect_args={"check_same_thread": False})
     return engine, path
 
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    # Monotonic clock stand-in for anything that takes `clock=`; advance it by setting `now`.
+    return FakeClock()
+
+@pytest.fixture(autouse=True)
+def reset_caches():
+    # In-process caches are module-level; every test runs against a fresh database.
+    clear_caches()
+    yield
+    clear_caches()
+
 @pytest.fixture(scope="function")
 def db():
     engine, db_path = create_temp_db_engine()
@@ -50,6 +75,7 @@ def client():
 
     Base.metadata.create_all(bind=engine)
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
 
     with TestClient(app) as c:
         yield c
@@ -58,6 +84,23 @@ def client():
     if os.path.exists(db_path):
         os.remove(db_path)
 
+@pytest.fixture
+def count_queries():
+    @contextmanager
+    def _count():
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(Engine, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(Engine, "before_cursor_execute", _record)
+
+    return _count
+
 @pytest.fixture
 def test_user(db):
     user = UserCreate(email="wktest@example.com", username="wktest")
@@ -87,6 +130,19 @@ def make_logged_exercise():
         }
     return _make
 
+@pytest.fixture
+def make_workout(db, make_logged_exercise):
+    def _make(username, sets=(), *, exercise="Deadlift", entries=None, session=None, **fields):
+        # `sets` are (reps, weight) pairs for `exercise`; pass `entries` as (name, sets) pairs to
+        # log several exercises. Other fields go to WorkoutCreateSimple.
+        entries = entries if entries is not None else [(exercise, sets)]
+        return crud_workout.create_workout(session or db, WorkoutCreateSimple(
+            username=username,
+            logged_exercises=[make_logged_exercise(name, entry_sets) for name, entry_sets in entries],
+            **fields
+        ))
+    return _make
+
 @pytest.fixture
 def setup_user_and_exercise_api(client):
     def _setup(username="testuser", email="test@example.com", exercise_name="Squat", category="Quads"):
@@ -0,0 +1,52 @@
+from sqlalchemy import func
+from src.backend.crud import user as crud_user, workout as crud_workout
+from src.backend.crud.cascade import delete_user_workouts
+from src.backend.models.logged_exercise import LoggedExercise
+from src.backend.models.logged_exercise_set import LoggedExerciseSet
+from src.backend.models.personal_record import PersonalRecord
+from src.backend.models.workout import Workout
+from src.backend.models.workout_rollup import WorkoutRollup
+from src.backend.schemas.user import UserCreate
+
+def _create_workouts(make_workout, username, count, sets=3):
+    return [make_workout(username, [(5, 100.0 + i)] * sets).id for i in range(count)]
+
+def _counts(db):
+    return tuple(db.query(func.count()).select_from(model).scalar() for model in (Workout, LoggedExercise, LoggedExerciseSet))
+
+def _deletes(statements, table):
+    return [s for s in statements if s.startswith(f"DELETE FROM {table} ")]
+
+def test_delete_workout_is_three_set_based_deletes(db, test_user, test_exercise, make_workout, count_queries):
+    small, large = _create_workouts(make_workout, test_user.username, 1, sets=1) + \
+        _create_workouts(make_workout, test_user.username, 1, sets=30)
+
+    for workout_id in (small, large):
+        with count_queries() as statements:
+            assert crud_workout.delete_workout(db, workout_id)
+        assert [len(_deletes(statements, table)) for table in ("logged_exercise_sets", "logged_exercises", "workouts")] == [1, 1, 1]
+    assert _counts(db) == (0, 0, 0)
+
+def test_delete_user_workouts_in_batches(db, test_user, test_exercise, make_workout, count_queries):
+    crud_user.create_user(db, UserCreate(email="other@example.com", username="other"))
+    _create_workouts(make_workout, test_user.username, 5)
+    _create_workouts(make_workout, "other", 2)
+    user_id = crud_user.resolve_user_id(db, test_user.username)
+
+    with count_queries() as statements:
+        assert delete_user_workouts(db, user_id, batch_size=2) == 5
+    assert len(_deletes(statements, "workouts")) == 3
+    assert _counts(db) == (2, 2, 6)
+
+def test_delete_user_removes_history(db, test_user, test_exercise, make_workout):
+    crud_user.create_user(db, UserCreate(email="other@example.com", username="other"))
+    _create_workouts(make_workout, test_user.username, 3)
+    _create_workouts(make_workout, "other", 1)
+    user_id = crud_user.resolve_user_id(db, test_user.username)
+
+    assert crud_user.delete_user(db, user_id)
+    assert _counts(db) == (1, 1, 3)
+    for model in (WorkoutRollup, PersonalRecord):
+        assert db.query(model).filter(model.user_id == user_id).count() == 0
+        assert db.query(model).count() > 0
+    assert crud_user.resolve_user_id(db, test_user.username) is None
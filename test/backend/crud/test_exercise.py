@@ -109,4 +109,61 @@ def test_delete_exercise(db):
 
 def test_delete_exercise_invalid_id(db):
     result = crud_exercise.delete_exercise(db, uuid4())
-    assert result is False
\ No newline at end of file
+    assert result is False
+
+def test_resolve_exercise_ids_single_query_for_unknown_names(db, count_queries):
+    created = crud_exercise.create_exercise(db, ExerciseCreate(
+        name="Deadlift",
+        primary_muscles=["back"],
+        category=ExerciseGroup.PULL
+    ))
+
+    with count_queries() as statements:
+        resolved, missing = crud_exercise.resolve_exercise_ids(db, ["deadlift", "Snatch", "Clean", "DEADLIFT"])
+
+    assert resolved == {"deadlift": created.id}
+    assert missing == ["Snatch", "Clean"]
+    assert len(statements) == 1
+
+def test_create_batch_exercise_skips_existing_and_duplicate_names(db, count_queries):
+    crud_exercise.create_exercise(db, ExerciseCreate(
+        name="Deadlift",
+        primary_muscles=["back"],
+        category=ExerciseGroup.PULL
+    ))
+    batch = [
+        ExerciseCreate(name=f"Exercise {i}", primary_muscles=["back"], category=ExerciseGroup.PULL)
+        for i in range(50)
+    ]
+    batch += [
+        ExerciseCreate(name="Deadlift", primary_muscles=["back"], category=ExerciseGroup.PULL),
+        ExerciseCreate(name="Exercise 0", primary_muscles=["legs"], category=ExerciseGroup.QUADS),
+    ]
+
+    with count_queries() as statements:
+        created = crud_exercise.create_batch_exercise(db, batch)
+
+    assert [e.name for e in created] == [f"Exercise {i}" for i in range(50)]
+    assert created[0].category == ExerciseGroup.PULL
+    assert len(statements) == 3
+    assert len(crud_exercise.get_all_exercises(db)) == 51
+
+def test_create_batch_exercise_ignores_rows_inserted_concurrently(db, monkeypatch):
+    from src.backend.models.exercise import Exercise
+    real_scalars = db.scalars
+
+    def racing_scalars(*args, **kwargs):
+        result = list(real_scalars(*args, **kwargs))
+        # Another importer commits "Squat" between our duplicate check and our insert.
+        db.add(Exercise(name="Squat", primary_muscles=["quads"], category=ExerciseGroup.QUADS))
+        db.flush()
+        return result
+
+    monkeypatch.setattr(db, "scalars", racing_scalars)
+    created = crud_exercise.create_batch_exercise(db, [
+        ExerciseCreate(name="Squat", primary_muscles=["legs"], category=ExerciseGroup.QUADS),
+        ExerciseCreate(name="Lunge", primary_muscles=["legs"], category=ExerciseGroup.QUADS),
+    ])
+
+    assert [e.name for e in created] == ["Lunge"]
+    assert crud_exercise.get_exercise_by_name(db, "Squat").primary_muscles == ("quads",)
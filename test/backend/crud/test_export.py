@@ -0,0 +1,26 @@
+import pytest
+from datetime import datetime
+from src.backend.crud import workout as crud_workout, user as crud_user
+from src.backend.crud.export import EXPORT_COLUMNS, iter_user_set_rows
+from src.backend.schemas.workout import WorkoutCreateSimple
+
+def test_iter_user_set_rows_yields_bounded_chunks_in_order(db, test_user, test_exercise, make_logged_exercise):
+    for day in (3, 1, 2):
+        crud_workout.create_workout(db, WorkoutCreateSimple(
+            username=test_user.username,
+            created_time=datetime(2024, 1, day),
+            logged_exercises=[make_logged_exercise("Deadlift", [(5, 100.0 + day), (3, 110.0 + day)])]
+        ))
+    user_id = crud_user.resolve_user_id(db, test_user.username)
+
+    chunks = list(iter_user_set_rows(db, user_id, chunk_size=4))
+
+    assert [len(chunk) for chunk in chunks] == [4, 2]
+    rows = [dict(zip(EXPORT_COLUMNS, row)) for chunk in chunks for row in chunk]
+    assert [(r["created_time"].day, r["set_number"]) for r in rows] == [(1, 1), (1, 2), (2, 1), (2, 2), (3, 1), (3, 2)]
+    assert rows[0]["exercise"] == "Deadlift"
+    assert rows[0]["weight"] == 101.0
+
+def test_iter_user_set_rows_empty(db, test_user):
+    user_id = crud_user.resolve_user_id(db, test_user.username)
+    assert list(iter_user_set_rows(db, user_id)) == []
@@ -1,5 +1,7 @@
 import pytest
 from src.backend.crud import logged_exercise as crud_log
+from src.backend.crud.loading import LOGGED_EXERCISE_GRAPH_QUERIES
+from src.backend.schemas.logged_exercise import LoggedExerciseOut
 from src.backend.schemas.logged_exercise import LoggedExerciseCreate
 from src.backend.schemas.logged_exercise_set import LoggedExerciseSetCreate
 from src.backend.crud import workout as crud_workout
@@ -43,4 +45,15 @@ def test_delete_logged_exercise(db, test_user, test_exercise, make_logged_exerci
     deleted = crud_log.delete_logged_exercise(db, workout.id, log.exercise_id)
 
     assert deleted is True
-    assert len(crud_log.get_logged_exercises_by_workout(db, workout.id)) == 0
\ No newline at end of file
+    assert len(crud_log.get_logged_exercises_by_workout(db, workout.id)) == 0
+
+
+def test_logged_exercises_load_in_fixed_statements(db, test_user, test_exercise, count_queries, make_workout):
+    workout = make_workout(test_user.username, entries=[("Deadlift", [(5, 100.0)] * 4)] * 3)
+    db.expunge_all()
+
+    with count_queries() as statements:
+        logs = [LoggedExerciseOut.model_validate(le) for le in crud_log.get_logged_exercises_by_workout(db, workout.id)]
+
+    assert [len(le.sets) for le in logs] == [4, 4, 4]
+    assert len(statements) == LOGGED_EXERCISE_GRAPH_QUERIES
@@ -0,0 +1,75 @@
+import pytest
+from datetime import datetime
+from sqlalchemy.orm import Session
+from src.backend.crud import workout as crud_workout
+from src.backend.crud.progression import estimated_one_rep_max, get_exercise_progression
+from src.backend.schemas.exercise import ExerciseCreate
+from src.backend.schemas.workout import WorkoutUpdate
+from src.backend.crud import exercise as crud_exercise
+
+def test_estimated_one_rep_max():
+    assert estimated_one_rep_max(1, 200.0) == 200.0
+    assert estimated_one_rep_max(10, 150.0) == 200.0
+    assert estimated_one_rep_max(0, 150.0) == 0.0
+
+def test_progression_reports_top_set_per_session(db, test_user, test_exercise, make_workout):
+    crud_exercise.create_exercise(db, ExerciseCreate(name="Squat", category="Quads", primary_muscles=["Quads"]))
+    make_workout(test_user.username, [(5, 200.0), (3, 220.0), (3, 220.0)], created_time=datetime(2024, 2, 1))
+    make_workout(test_user.username, entries=[("Deadlift", [(10, 150.0)]), ("Squat", [(5, 300.0)])], created_time=datetime(2024, 1, 1))
+
+    series = get_exercise_progression(test_user.username, test_exercise.id, db)
+
+    assert [point["created_time"] for point in series] == [datetime(2024, 1, 1), datetime(2024, 2, 1)]
+    assert series[0]["top_set"] == {"reps": 10, "weight": 150.0}
+    assert series[0]["estimated_1rm"] == pytest.approx(200.0)
+    assert series[0]["total_volume"] == 1500.0
+    assert series[1]["top_set"] == {"reps": 3, "weight": 220.0}
+    assert series[1]["estimated_1rm"] == pytest.approx(242.0)
+    assert series[1]["set_count"] == 3
+    assert series[1]["total_volume"] == 2320.0
+
+def test_progression_is_cached_until_next_write(db, test_user, test_exercise, make_workout, make_logged_exercise, count_queries):
+    workout = make_workout(test_user.username, [(5, 200.0)], created_time=datetime(2024, 1, 1))
+    get_exercise_progression(test_user.username, test_exercise.id, db)
+
+    with count_queries() as statements:
+        assert len(get_exercise_progression(test_user.username, test_exercise.id, db)) == 1
+    # A hit only reads the user's write_version.
+    assert len(statements) == 1 and "write_version" in statements[0]
+
+    crud_workout.update_workout(db, workout.id, WorkoutUpdate(
+        logged_exercises=[make_logged_exercise("Deadlift", [(5, 250.0)])]
+    ))
+    series = get_exercise_progression(test_user.username, test_exercise.id, db)
+    assert series[0]["top_set"]["weight"] == 250.0
+
+def test_progression_fill_racing_a_write_is_not_served(db, test_user, test_exercise, make_workout, monkeypatch):
+    make_workout(test_user.username, [(5, 200.0)], created_time=datetime(2024, 1, 1))
+    execute = db.execute
+
+    def read_then_concurrent_write(statement, *args, **kwargs):
+        rows = execute(statement, *args, **kwargs).all()
+        monkeypatch.setattr(db, "execute", execute)
+        # Another request's write commits after this read but before the series is cached.
+        make_workout(test_user.username, [(5, 210.0)], created_time=datetime(2024, 2, 1))
+        return rows
+
+    monkeypatch.setattr(db, "execute", read_then_concurrent_write)
+    assert len(get_exercise_progression(test_user.username, test_exercise.id, db)) == 1
+    assert len(get_exercise_progression(test_user.username, test_exercise.id, db)) == 2
+
+def test_progression_sees_writes_committed_by_other_sessions(db, test_user, test_exercise, make_workout):
+    make_workout(test_user.username, [(5, 200.0)], created_time=datetime(2024, 1, 1))
+    assert len(get_exercise_progression(test_user.username, test_exercise.id, db)) == 1
+
+    # Stands in for another worker: nothing in this session sees the write happen.
+    with Session(bind=db.get_bind()) as other:
+        make_workout(test_user.username, [(5, 210.0)], created_time=datetime(2024, 2, 1), session=other)
+    # End this session's read transaction, as the next request would start a fresh one.
+    db.commit()
+
+    assert len(get_exercise_progression(test_user.username, test_exercise.id, db)) == 2
+
+def test_progression_unknown_user_or_exercise(db, test_user, test_exercise):
+    assert get_exercise_progression("nobody", test_exercise.id, db) == []
+    assert get_exercise_progression(test_user.username, test_exercise.id, db) == []
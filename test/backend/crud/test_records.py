@@ -0,0 +1,106 @@
+import pytest
+from datetime import datetime
+from src.backend.crud import workout as crud_workout, logged_exercise as crud_logged_exercise, user as crud_user
+from src.backend.crud import records as crud_records
+from src.backend.crud.records import get_personal_records, rebuild_records
+from src.backend.models.personal_record import PersonalRecord
+from src.backend.schemas.logged_exercise import LoggedExerciseCreate
+from src.backend.schemas.workout import WorkoutCreateSimple, WorkoutUpdate
+
+MARCH_5 = datetime(2024, 3, 5)
+
+def _records(db, user):
+    return {r["reps"]: r["weight"] for r in get_personal_records(user.username, db)}
+
+def test_create_workout_flags_new_records(db, test_user, test_exercise, make_workout):
+    first = make_workout(test_user.username, [(5, 100.0), (5, 110.0), (3, 120.0), (0, 300.0)], created_time=MARCH_5)
+    assert sorted((r["reps"], r["weight"]) for r in first.new_records) == [(3, 120.0), (5, 110.0)]
+
+    second = make_workout(test_user.username, [(5, 110.0), (3, 125.0)], created_time=MARCH_5)
+    assert [(r["reps"], r["weight"]) for r in second.new_records] == [(3, 125.0)]
+    assert second.new_records[0]["estimated_1rm"] == pytest.approx(137.5)
+
+    assert _records(db, test_user) == {3: 125.0, 5: 110.0}
+
+def test_records_written_concurrently_keep_the_heavier_set(db, test_user, test_exercise, make_workout, monkeypatch):
+    # Both requests looked up the key before either wrote it, so both try to create the record.
+    stored_records = crud_records._stored_records
+    monkeypatch.setattr(
+        crud_records, "_stored_records",
+        lambda db, keys, for_update=False: stored_records(db, keys, for_update) if for_update else {}
+    )
+    first = make_workout(test_user.username, [(5, 120.0)], created_time=MARCH_5)
+    second = make_workout(test_user.username, [(5, 100.0)], created_time=MARCH_5)
+    tie = make_workout(test_user.username, [(5, 120.0)], created_time=MARCH_5)
+    assert _records(db, test_user) == {5: 120.0}
+    # Only the write whose set the table ended up holding reports a new record.
+    assert [r["weight"] for r in first.new_records] == [120.0]
+    assert second.new_records == [] and tie.new_records == []
+
+    make_workout(test_user.username, [(5, 130.0)], created_time=MARCH_5)
+    record = db.query(PersonalRecord).one()
+    assert (record.weight, record.estimated_1rm) == (130.0, pytest.approx(151.67, abs=0.01))
+
+def test_record_lookup_is_one_query_regardless_of_history(db, test_user, test_exercise, make_workout, count_queries):
+    for weight in range(10):
+        make_workout(test_user.username, [(5, float(weight))], created_time=MARCH_5)
+
+    with count_queries() as statements:
+        make_workout(test_user.username, [(reps, 50.0) for reps in range(1, 11)], created_time=MARCH_5)
+    record_reads = [s for s in statements if s.lstrip().upper().startswith("SELECT") and "personal_records" in s]
+    # One keyed lookup before the upsert and one read-back after it.
+    assert len(record_reads) == 2
+
+def test_delete_and_update_restore_previous_records(db, test_user, test_exercise, make_workout, make_logged_exercise):
+    make_workout(test_user.username, [(5, 100.0)], created_time=datetime(2024, 1, 1))
+    best = make_workout(test_user.username, [(5, 150.0), (2, 200.0)], created_time=MARCH_5)
+
+    crud_workout.update_workout(db, best.id, WorkoutUpdate(
+        logged_exercises=[make_logged_exercise("Deadlift", [(5, 120.0)])]
+    ))
+    assert _records(db, test_user) == {5: 120.0}
+
+    crud_workout.delete_workout(db, best.id)
+    records = get_personal_records(test_user.username, db)
+    assert [(r["reps"], r["weight"], r["achieved_at"]) for r in records] == [(5, 100.0, datetime(2024, 1, 1))]
+    assert records[0]["exercise_name"] == "Deadlift"
+
+def test_logged_exercise_writes_update_records(db, test_user, test_exercise, make_workout):
+    workout = make_workout(test_user.username, [(5, 100.0)], created_time=MARCH_5)
+    crud_logged_exercise.delete_logged_exercise(db, workout.id, test_exercise.id)
+    assert _records(db, test_user) == {}
+
+    crud_logged_exercise.log_exercise(db, LoggedExerciseCreate(
+        exercise_id=test_exercise.id,
+        sets=[{"set_number": 1, "reps": 1, "weight": 180.0}]
+    ), workout.id)
+    assert _records(db, test_user) == {1: 180.0}
+
+def test_bulk_create_updates_records(db, test_user, test_exercise, make_logged_exercise):
+    crud_workout.create_workouts_bulk(db, [
+        WorkoutCreateSimple(username=test_user.username, logged_exercises=[make_logged_exercise("Deadlift", [(5, w)])])
+        for w in (100.0, 140.0, 120.0)
+    ])
+    assert _records(db, test_user) == {5: 140.0}
+
+def test_rebuild_matches_incremental_records(db, test_user, test_exercise, make_workout, make_logged_exercise):
+    workout = make_workout(test_user.username, [(5, 100.0), (3, 110.0)], created_time=datetime(2024, 1, 1))
+    make_workout(test_user.username, [(5, 120.0), (8, 90.0)], created_time=MARCH_5)
+    crud_workout.update_workout(db, workout.id, WorkoutUpdate(
+        logged_exercises=[make_logged_exercise("Deadlift", [(3, 130.0)])]
+    ))
+    incremental = get_personal_records(test_user.username, db)
+
+    rebuild_records(db)
+    db.commit()
+    db.expire_all()
+
+    assert get_personal_records(test_user.username, db) == incremental
+
+def test_delete_user_removes_records(db, test_user, test_exercise, make_workout):
+    workout = make_workout(test_user.username, [(5, 100.0)], created_time=MARCH_5)
+    crud_workout.delete_workout(db, workout.id)
+    user_id = crud_user.resolve_user_id(db, test_user.username)
+
+    assert crud_user.delete_user(db, user_id) is True
+    assert db.query(PersonalRecord).count() == 0
@@ -0,0 +1,159 @@
+import pytest
+from datetime import datetime
+from src.backend.crud import workout as crud_workout, logged_exercise as crud_logged_exercise, user as crud_user
+from src.backend.crud.rollup import ALL_TYPES, get_rollup, rebuild_rollups
+from src.backend.models.enums import ExerciseGroup
+from src.backend.models.workout_rollup import WorkoutRollup
+from src.backend.schemas.logged_exercise import LoggedExerciseCreate
+from src.backend.schemas.user import UserCreate
+from src.backend.schemas.workout import WorkoutCreateSimple, WorkoutUpdate
+
+MARCH_5 = datetime(2024, 3, 5)
+
+def _totals(db, user_id, period="all", workout_type=ALL_TYPES):
+    rollup = get_rollup(db, user_id, period, workout_type)
+    if rollup is None:
+        return None
+    return (rollup.workout_count, rollup.set_count, rollup.total_reps, rollup.total_volume)
+
+def _snapshot(db):
+    db.expire_all()
+    return {
+        (r.user_id, r.period, r.workout_type): (r.workout_count, r.set_count, r.total_reps, r.total_volume)
+        for r in db.query(WorkoutRollup)
+    }
+
+@pytest.fixture
+def user_id(db, test_user):
+    return crud_user.resolve_user_id(db, test_user.username)
+
+def test_create_workout_updates_rollups(db, test_user, user_id, test_exercise, make_workout):
+    make_workout(test_user.username, [(5, 100.0), (3, 120.0)], workout_type=ExerciseGroup.PULL, created_time=MARCH_5)
+    make_workout(test_user.username, [(8, 50.0)], workout_type=None, created_time=datetime(2024, 4, 1))
+
+    assert _totals(db, user_id) == (2, 3, 16, 1260.0)
+    assert _totals(db, user_id, "all", "Pull") == (1, 2, 8, 860.0)
+    assert _totals(db, user_id, "2024-04", "Uncategorized") == (1, 1, 8, 400.0)
+    assert _totals(db, user_id, "2024-03") == (1, 2, 8, 860.0)
+
+def test_update_and_delete_workout_adjust_rollups(db, test_user, user_id, test_exercise, make_workout, make_logged_exercise):
+    workout = make_workout(test_user.username, [(5, 100.0)], workout_type=ExerciseGroup.PULL, created_time=MARCH_5)
+
+    crud_workout.update_workout(db, workout.id, WorkoutUpdate(
+        workout_type=ExerciseGroup.LOWER,
+        logged_exercises=[make_logged_exercise("Deadlift", [(2, 200.0), (2, 200.0)])]
+    ))
+    assert _totals(db, user_id, "all", "Pull") is None
+    assert _totals(db, user_id, "all", "Lower") == (1, 2, 4, 800.0)
+
+    crud_workout.update_workout(db, workout.id, WorkoutUpdate(notes="only notes"))
+    assert _totals(db, user_id) == (1, 2, 4, 800.0)
+
+    crud_workout.delete_workout(db, workout.id)
+    assert _totals(db, user_id) is None
+    assert db.query(WorkoutRollup).count() == 0
+
+def test_diffed_updates_match_rebuild(db, test_user, user_id, test_exercise, make_workout, make_logged_exercise):
+    workout = make_workout(test_user.username, [(5, 100.0), (5, 102.5), (5, 105.0)], workout_type=ExerciseGroup.PULL, created_time=MARCH_5)
+    make_workout(test_user.username, [(8, 60.0)], workout_type=ExerciseGroup.PULL, created_time=datetime(2024, 3, 20))
+
+    for updates in (
+        WorkoutUpdate(logged_exercises=[make_logged_exercise("Deadlift", [(5, 100.0), (6, 102.5), (5, 105.0)])]),
+        WorkoutUpdate(logged_exercises=[make_logged_exercise("Deadlift", [(5, 100.0), (6, 102.5)])]),
+        WorkoutUpdate(created_time=datetime(2024, 5, 1), workout_type=ExerciseGroup.LOWER),
+        WorkoutUpdate(logged_exercises=[make_logged_exercise("Deadlift", [(5, 100.0), (6, 102.5), (1, 140.0)])]),
+    ):
+        crud_workout.update_workout(db, workout.id, updates)
+        incremental = _snapshot(db)
+        rebuild_rollups(db, user_id)
+        db.commit()
+        assert _snapshot(db) == incremental
+
+def test_first_writes_to_a_row_upsert(db, test_user, user_id, test_exercise, make_workout, count_queries):
+    # Every rollup row is written by one upsert statement, never by an UPDATE that may miss and
+    # then race another request's INSERT of the same new row.
+    with count_queries() as statements:
+        make_workout(test_user.username, [(5, 100.0)], workout_type=ExerciseGroup.PULL, created_time=MARCH_5)
+    writes = [s for s in statements if "workout_rollups" in s]
+    assert len(writes) == 1
+    assert writes[0].startswith("INSERT INTO workout_rollups") and "ON CONFLICT" in writes[0]
+    make_workout(test_user.username, [(5, 100.0)], workout_type=ExerciseGroup.PULL, created_time=MARCH_5)
+    assert _totals(db, user_id) == (2, 2, 10, 1000.0)
+
+def test_logged_exercise_writes_adjust_set_totals(db, test_user, user_id, test_exercise, make_workout):
+    workout = make_workout(test_user.username, [(5, 100.0)], workout_type=ExerciseGroup.PULL, created_time=MARCH_5)
+    other = make_workout(test_user.username, [], workout_type=ExerciseGroup.PULL, created_time=MARCH_5)
+
+    crud_logged_exercise.log_exercise(db, LoggedExerciseCreate(
+        exercise_id=test_exercise.id,
+        sets=[{"set_number": 1, "reps": 10, "weight": 10.0}]
+    ), other.id)
+    assert _totals(db, user_id) == (2, 2, 15, 600.0)
+    assert _totals(db, user_id, "all", "Pull") == (2, 2, 15, 600.0)
+
+    crud_logged_exercise.delete_logged_exercise(db, workout.id, test_exercise.id)
+    assert _totals(db, user_id) == (2, 1, 10, 100.0)
+
+def test_bulk_create_updates_rollups(db, test_user, user_id, test_exercise, make_logged_exercise):
+    payloads = [
+        WorkoutCreateSimple(username=test_user.username, workout_type=ExerciseGroup.PULL,
+                            logged_exercises=[make_logged_exercise("Deadlift", [(5, 100.0)])])
+        for _ in range(3)
+    ]
+    crud_workout.create_workouts_bulk(db, payloads + [WorkoutCreateSimple(username="nobody", logged_exercises=[make_logged_exercise("Deadlift", [(1, 1.0)])])])
+
+    assert _totals(db, user_id, "all", "Pull") == (3, 3, 15, 1500.0)
+
+def test_rebuild_matches_incremental_rollups(db, test_user, user_id, test_exercise, make_workout, make_logged_exercise):
+    workout = make_workout(test_user.username, [(5, 100.0), (3, 120.0)], workout_type=ExerciseGroup.PULL, created_time=MARCH_5)
+    make_workout(test_user.username, [(8, 50.0)], workout_type=None, created_time=datetime(2023, 12, 31))
+    make_workout(test_user.username, [], workout_type=ExerciseGroup.PUSH, created_time=MARCH_5)
+    crud_workout.update_workout(db, workout.id, WorkoutUpdate(
+        logged_exercises=[make_logged_exercise("Deadlift", [(1, 225.0)])]
+    ))
+    incremental = _snapshot(db)
+
+    rebuild_rollups(db)
+    db.commit()
+
+    assert _snapshot(db) == incremental
+
+def test_rebuild_single_user_leaves_others(db, test_exercise, make_workout):
+    alice = crud_user.create_user(db, UserCreate(username="alice", email="a@example.com"))
+    bob = crud_user.create_user(db, UserCreate(username="bob", email="b@example.com"))
+    alice_id, bob_id = alice.id, bob.id
+    make_workout(alice.username, [(5, 100.0)], workout_type=ExerciseGroup.PULL, created_time=MARCH_5)
+    make_workout(bob.username, [(5, 100.0)], workout_type=ExerciseGroup.PULL, created_time=MARCH_5)
+    db.query(WorkoutRollup).delete()
+    db.commit()
+
+    rebuild_rollups(db, alice_id)
+    db.commit()
+
+    assert _totals(db, alice_id) == (1, 1, 5, 500.0)
+    assert _totals(db, bob_id) is None
+
+def test_frequency_by_type_is_single_lookup(db, test_user, user_id, test_exercise, make_workout, count_queries):
+    for _ in range(5):
+        make_workout(test_user.username, [(5, 100.0)], workout_type=ExerciseGroup.PULL, created_time=MARCH_5)
+
+    with count_queries() as statements:
+        assert crud_workout.calculate_num_workouts_by_type(test_user.username, "Pull", db) == 5
+    assert len(statements) == 1
+    assert "workout_rollups" in statements[0]
+
+def test_get_workout_volume(db, test_user, user_id, test_exercise, make_workout):
+    make_workout(test_user.username, [(5, 100.0)], workout_type=ExerciseGroup.PULL, created_time=MARCH_5)
+
+    volume = crud_workout.get_workout_volume(test_user.username, db, "2024-03", "Pull")
+    assert volume["workout_count"] == 1
+    assert volume["total_volume"] == 500.0
+    assert crud_workout.get_workout_volume(test_user.username, db, "2024-04")["workout_count"] == 0
+    assert crud_workout.get_workout_volume("nobody", db)["total_reps"] == 0
+
+def test_delete_user_removes_rollups(db, test_user, user_id, test_exercise, make_workout):
+    workout = make_workout(test_user.username, [(5, 100.0)], workout_type=ExerciseGroup.PULL, created_time=MARCH_5)
+    crud_workout.delete_workout(db, workout.id)
+
+    assert crud_user.delete_user(db, user_id) is True
+    assert db.query(WorkoutRollup).count() == 0
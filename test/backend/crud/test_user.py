@@ -46,4 +46,34 @@ def test_delete_user(db, create_user):
 
 def test_delete_user_invalid_id(db):
     result = crud_user.delete_user(db, uuid4())
-    assert result is False
\ No newline at end of file
+    assert result is False
+
+def test_resolve_user_id_is_cached(db, create_user, count_queries):
+    user = create_user(username="cached", email="cached@example.com")
+
+    assert crud_user.resolve_user_id(db, "cached") == user.id
+    with count_queries() as statements:
+        assert crud_user.resolve_user_id(db, "cached") == user.id
+    assert statements == []
+    assert crud_user.user_id_cache.stats()["hits"] == 1
+
+def test_resolve_user_id_unknown_user_not_cached(db):
+    assert crud_user.resolve_user_id(db, "ghost") is None
+    assert crud_user.user_id_cache.stats()["size"] == 0
+
+def test_update_user_invalidates_cached_username(db, create_user):
+    user = create_user(username="renamed", email="renamed@example.com")
+    crud_user.resolve_user_id(db, "renamed")
+
+    crud_user.update_user(db, user.id, UserUpdate(username="renamed2", email="renamed@example.com"))
+
+    assert crud_user.resolve_user_id(db, "renamed") is None
+    assert crud_user.resolve_user_id(db, "renamed2") == user.id
+
+def test_delete_user_invalidates_cached_username(db, create_user):
+    user = create_user(username="gone", email="gone@example.com")
+    crud_user.resolve_user_id(db, "gone")
+
+    crud_user.delete_user(db, user.id)
+
+    assert crud_user.resolve_user_id(db, "gone") is None
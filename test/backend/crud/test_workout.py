@@ -1,4 +1,5 @@
 import pytest
+from fastapi import HTTPException
 from datetime import datetime, timezone
 from dateutil.relativedelta import relativedelta
 from src.backend.crud import workout as crud_workout
@@ -7,6 +8,8 @@ from src.backend.schemas.workout import WorkoutCreateSimple, WorkoutUpdate
 from src.backend.schemas.user import UserCreate
 from src.backend.schemas.exercise import ExerciseCreate
 from src.backend.crud import user as crud_user, exercise as crud_exercise
+from src.backend.crud.loading import WORKOUT_GRAPH_QUERIES
+from src.backend.schemas.workout import WorkoutOut
 
 def test_create_and_get_workout(db, test_user, test_exercise, make_logged_exercise):
     workout = crud_workout.create_workout(db, WorkoutCreateSimple(
@@ -42,6 +45,76 @@ def test_update_workout_logged_exercises(db, test_user, test_exercise, make_logg
     assert updated.logged_exercises[0].sets[0].reps == 2
     assert updated.logged_exercises[0].sets[0].weight == 180  
 
+def _create_row_exercise(db):
+    crud_exercise.create_exercise(db, ExerciseCreate(name="Row", primary_muscles=["back"], category=ExerciseGroup.PULL))
+
+def _written_tables(statements):
+    tables = ("workouts", "logged_exercises", "logged_exercise_sets")
+    writes = []
+    for statement in statements:
+        words = statement.split()
+        verb = words[0]
+        if verb in ("INSERT", "UPDATE", "DELETE"):
+            table = words[2] if verb != "UPDATE" else words[1]
+            if table in tables:
+                writes.append((verb, table))
+    return writes
+
+def test_update_workout_single_set_edit_writes_one_row(db, test_user, test_exercise, count_queries, make_logged_exercise):
+    _create_row_exercise(db)
+    entries = [
+        make_logged_exercise("Deadlift", [(5, 100.0)] * 20),
+        make_logged_exercise("Row", [(8, 60.0)] * 20),
+    ]
+    workout = crud_workout.create_workout(db, WorkoutCreateSimple(username=test_user.username, logged_exercises=entries))
+
+    entries[1]["sets"][7]["reps"] = 9
+    with count_queries() as statements:
+        updated = crud_workout.update_workout(db, workout.id, WorkoutUpdate(logged_exercises=entries))
+
+    assert _written_tables(statements) == [("UPDATE", "logged_exercise_sets")]
+    row = next(le for le in updated.logged_exercises if le.exercise.name == "Row")
+    assert sorted(s.reps for s in row.sets) == [8] * 19 + [9]
+
+    with count_queries() as statements:
+        crud_workout.update_workout(db, workout.id, WorkoutUpdate(notes="Felt good", logged_exercises=entries))
+    assert _written_tables(statements) == [("UPDATE", "workouts")]
+
+def test_update_workout_diff_inserts_and_deletes(db, test_user, test_exercise, count_queries, make_logged_exercise):
+    _create_row_exercise(db)
+    workout = crud_workout.create_workout(db, WorkoutCreateSimple(
+        username=test_user.username,
+        logged_exercises=[
+            make_logged_exercise("Deadlift", [(5, 100.0), (5, 110.0), (5, 120.0)]),
+            make_logged_exercise("Row", [(8, 60.0)]),
+        ]
+    ))
+    deadlift_id = next(le.id for le in workout.logged_exercises if le.exercise.name == "Deadlift")
+
+    with count_queries() as statements:
+        updated = crud_workout.update_workout(db, workout.id, WorkoutUpdate(logged_exercises=[
+            make_logged_exercise("Deadlift", [(5, 100.0), (5, 110.0)]),
+            make_logged_exercise("Deadlift", [(3, 140.0)]),
+        ]))
+
+    assert sorted(_written_tables(statements)) == [
+        ("DELETE", "logged_exercise_sets"),
+        ("DELETE", "logged_exercises"),
+        ("INSERT", "logged_exercise_sets"),
+        ("INSERT", "logged_exercises"),
+    ]
+    sets = {le.id: sorted((s.reps, s.weight) for s in le.sets) for le in updated.logged_exercises}
+    assert sets.pop(deadlift_id) == [(5, 100.0), (5, 110.0)]
+    assert list(sets.values()) == [[(3, 140.0)]]
+
+def test_update_workout_unknown_exercise(db, test_user, test_exercise, make_logged_exercise):
+    workout = crud_workout.create_workout(db, WorkoutCreateSimple(
+        username=test_user.username,
+        logged_exercises=[make_logged_exercise("Deadlift", [(5, 100.0)])]
+    ))
+    with pytest.raises(ValueError, match="Exercise 'Nope' not found"):
+        crud_workout.update_workout(db, workout.id, WorkoutUpdate(logged_exercises=[make_logged_exercise("Nope", [(1, 1.0)])]))
+
 def test_delete_workout(db, test_user, test_exercise, make_logged_exercise):
     workout = crud_workout.create_workout(db, WorkoutCreateSimple(
         username=test_user.username,
@@ -228,4 +301,205 @@ def test_calculate_num_workouts_by_month(db, test_user, test_exercise, make_logg
     ))
 
     result = crud_workout.calculate_num_workouts_by_month(test_user.username, db)
-    assert result == 2.0
\ No newline at end of file
+    assert result == 2.0
+
+def test_get_all_workouts_by_name_loads_graph_in_fixed_queries(db, test_user, test_exercise, count_queries, make_logged_exercise):
+    crud_exercise.create_exercise(db, ExerciseCreate(
+        name="Row",
+        primary_muscles=["back"],
+        category=ExerciseGroup.PULL
+    ))
+    for i in range(5):
+        crud_workout.create_workout(db, WorkoutCreateSimple(
+            username=test_user.username,
+            notes=f"Workout {i}",
+            logged_exercises=[
+                make_logged_exercise("Deadlift", [(5, 100.0), (5, 110.0)]),
+                make_logged_exercise("Row", [(8, 60.0), (8, 60.0), (8, 65.0)])
+            ]
+        ))
+    db.expunge_all()
+
+    with count_queries() as statements:
+        workouts = crud_workout.get_all_workouts_by_name(test_user.username, db)
+        serialized = [WorkoutOut.model_validate(w) for w in workouts]
+
+    assert len(serialized) == 5
+    assert all(len(w.logged_exercises) == 2 for w in serialized)
+    assert sum(len(le.sets) for w in serialized for le in w.logged_exercises) == 25
+    assert len(statements) == WORKOUT_GRAPH_QUERIES
+
+def test_get_workouts_page_by_name_walks_history_with_ties(db, test_user, test_exercise, make_logged_exercise):
+    same_time = datetime(2024, 1, 1, 10, 0)
+    for i in range(5):
+        crud_workout.create_workout(db, WorkoutCreateSimple(
+            username=test_user.username,
+            notes=f"Workout {i}",
+            created_time=same_time if i < 3 else same_time + relativedelta(days=i),
+            logged_exercises=[make_logged_exercise("Deadlift", [(5, 100.0)])]
+        ))
+
+    seen = []
+    cursor = None
+    while True:
+        page, cursor = crud_workout.get_workouts_page_by_name(test_user.username, db, 2, cursor)
+        seen.extend(page)
+        if cursor is None:
+            break
+
+    assert len(seen) == 5
+    assert len({w.id for w in seen}) == 5
+    assert [w.notes for w in seen[:2]] == ["Workout 4", "Workout 3"]
+    assert seen == sorted(seen, key=lambda w: (w.created_time, w.id), reverse=True)
+
+def test_get_workouts_page_by_name_invalid_cursor(db, test_user):
+    with pytest.raises(ValueError):
+        crud_workout.get_workouts_page_by_name(test_user.username, db, 2, "not-a-cursor")
+
+def test_create_workout_unknown_user(db, test_exercise, make_logged_exercise):
+    with pytest.raises(HTTPException) as exc_info:
+        crud_workout.create_workout(db, WorkoutCreateSimple(
+            username="nobody",
+            logged_exercises=[make_logged_exercise("Deadlift", [(5, 100.0)])]
+        ))
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.detail == "User not found"
+
+def test_iter_all_workouts_loads_graph_per_chunk(db, test_user, test_exercise, count_queries, make_logged_exercise):
+    for i in range(5):
+        crud_workout.create_workout(db, WorkoutCreateSimple(
+            username=test_user.username,
+            notes=f"Workout {i}",
+            logged_exercises=[make_logged_exercise("Deadlift", [(5, 100.0), (5, 110.0)])]
+        ))
+    db.expunge_all()
+
+    with count_queries() as statements:
+        serialized = [WorkoutOut.model_validate(w) for w in crud_workout.iter_all_workouts(db, chunk_size=2)]
+
+    assert [w.notes for w in serialized] == [f"Workout {i}" for i in reversed(range(5))]
+    assert all(len(w.logged_exercises[0].sets) == 2 for w in serialized)
+    # One keyset page per chunk, each loading its own graph.
+    assert len(statements) == WORKOUT_GRAPH_QUERIES * 3
+
+def test_create_workout_statement_count_independent_of_size(db, test_user, test_exercise, count_queries, make_logged_exercise):
+    for name in ("Row", "Curl", "Shrug"):
+        crud_exercise.create_exercise(db, ExerciseCreate(name=name, primary_muscles=["back"], category=ExerciseGroup.PULL))
+    crud_workout.create_workout(db, WorkoutCreateSimple(
+        username=test_user.username,
+        logged_exercises=[make_logged_exercise("Deadlift", [(5, 100.0)])]
+    ))
+
+    with count_queries() as small:
+        # Both writes set personal records, so each issues one records write.
+        crud_workout.create_workout(db, WorkoutCreateSimple(
+            username=test_user.username,
+            logged_exercises=[make_logged_exercise("Deadlift", [(5, 110.0)])]
+        ))
+    with count_queries() as large:
+        workout = crud_workout.create_workout(db, WorkoutCreateSimple(
+            username=test_user.username,
+            logged_exercises=[
+                make_logged_exercise(name, [(8, 50.0)] * 10)
+                for name in ("Deadlift", "row", "Curl", "Shrug")
+            ]
+        ))
+
+    assert len(small) == len(large)
+    assert len(workout.logged_exercises) == 4
+    assert sum(len(le.sets) for le in workout.logged_exercises) == 40
+
+def test_create_workout_reports_all_missing_exercises(db, test_user, test_exercise, make_logged_exercise):
+    with pytest.raises(HTTPException) as exc_info:
+        crud_workout.create_workout(db, WorkoutCreateSimple(
+            username=test_user.username,
+            logged_exercises=[
+                make_logged_exercise("Deadlift", [(5, 100.0)]),
+                make_logged_exercise("Snatch", [(1, 60.0)]),
+                make_logged_exercise("Clean", [(1, 80.0)])
+            ]
+        ))
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.detail == "Exercises not found: 'Snatch', 'Clean'"
+    assert crud_workout.get_all_workouts(db) == []
+
+def test_create_workout_matches_exercise_names_case_insensitively(db, test_user, test_exercise, make_logged_exercise):
+    workout = crud_workout.create_workout(db, WorkoutCreateSimple(
+        username=test_user.username,
+        logged_exercises=[
+            make_logged_exercise("deadlift", [(5, 100.0)]),
+            make_logged_exercise("DEADLIFT", [(3, 120.0)])
+        ]
+    ))
+    assert [le.exercise_id for le in workout.logged_exercises] == [test_exercise.id, test_exercise.id]
+
+def test_calculate_num_workouts_by_month_single_aggregate_query(db, test_user, test_exercise, count_queries, make_logged_exercise):
+    for months_ago in (0, 1, 2, 3):
+        crud_workout.create_workout(db, WorkoutCreateSimple(
+            username=test_user.username,
+            created_time=datetime(2024, 6, 1, 12, 0) - relativedelta(months=months_ago),
+            logged_exercises=[make_logged_exercise("Deadlift", [(5, 100.0)])]
+        ))
+
+    with count_queries() as statements:
+        result = crud_workout.calculate_num_workouts_by_month(test_user.username, db)
+
+    assert result == 4 / 3
+    assert len(statements) == 1
+
+def test_calculate_num_workouts_by_month_unknown_user(db):
+    assert crud_workout.calculate_num_workouts_by_month("nobody", db) == 0
+
+def test_get_workout_month_histogram_fills_empty_months(db, test_user, test_exercise, make_logged_exercise):
+    for created_time in (datetime(2023, 11, 3), datetime(2023, 11, 20), datetime(2024, 2, 14)):
+        crud_workout.create_workout(db, WorkoutCreateSimple(
+            username=test_user.username,
+            created_time=created_time,
+            logged_exercises=[make_logged_exercise("Deadlift", [(5, 100.0)])]
+        ))
+
+    assert crud_workout.get_workout_month_histogram(test_user.username, db) == [
+        {"month": "2023-11", "count": 2},
+        {"month": "2023-12", "count": 0},
+        {"month": "2024-01", "count": 0},
+        {"month": "2024-02", "count": 1},
+    ]
+    assert crud_workout.get_workout_month_histogram("nobody", db) == []
+
+def test_get_workout_stats_single_grouped_query(db, test_user, test_exercise, count_queries, make_logged_exercise):
+    sessions = [
+        (datetime(2024, 1, 1, 9, 0), ExerciseGroup.PUSH),   # Monday
+        (datetime(2024, 1, 3, 9, 0), ExerciseGroup.PULL),   # Wednesday
+        (datetime(2024, 1, 8, 9, 0), ExerciseGroup.PUSH),   # Monday
+        (datetime(2024, 2, 4, 9, 0), None),                 # Sunday
+    ]
+    for created_time, workout_type in sessions:
+        crud_workout.create_workout(db, WorkoutCreateSimple(
+            username=test_user.username,
+            created_time=created_time,
+            workout_type=workout_type,
+            logged_exercises=[make_logged_exercise("Deadlift", [(5, 100.0)])]
+        ))
+
+    with count_queries() as statements:
+        stats = crud_workout.get_workout_stats(test_user.username, db)
+
+    assert len(statements) == 1
+    assert stats["total_workouts"] == 4
+    assert stats["first_workout"] == datetime(2024, 1, 1, 9, 0)
+    assert stats["last_workout"] == datetime(2024, 2, 4, 9, 0)
+    assert stats["by_type"]["Push"] == 2
+    assert stats["by_type"]["Pull"] == 1
+    assert stats["by_type"]["Quads"] == 0
+    assert stats["by_type"]["Uncategorized"] == 1
+    assert stats["by_month"] == {"2024-01": 3, "2024-02": 1}
+    assert stats["by_weekday"]["Monday"] == 2
+    assert stats["by_weekday"]["Wednesday"] == 1
+    assert stats["by_weekday"]["Sunday"] == 1
+    assert stats["by_weekday"]["Friday"] == 0
+
+def test_get_workout_stats_unknown_user(db):
+    stats = crud_workout.get_workout_stats("nobody", db)
+    assert stats["total_workouts"] == 0
+    assert stats["first_workout"] is None
+    assert set(stats["by_type"]) == {group.value for group in ExerciseGroup}
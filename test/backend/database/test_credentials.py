@@ -0,0 +1,72 @@
+import json
+import pytest
+from src.backend.database.credentials import ACCESS_DENIED, CachedCredentials, connect_with_credentials, credentials_from_env
+
+class AuthError(Exception):
+    pass
+
+class FakeDialect:
+    def __init__(self, valid_password):
+        self.valid_password = valid_password
+        self.attempts = []
+
+    def connect(self, *cargs, **cparams):
+        self.attempts.append(cparams["password"])
+        if cparams["password"] != self.valid_password:
+            raise AuthError(ACCESS_DENIED, "Access denied")
+        return "connection"
+
+def _rotating_secret(passwords):
+    calls = []
+    def fetch():
+        calls.append(1)
+        return {"username": "app", "password": passwords[min(len(calls), len(passwords)) - 1]}
+    return fetch, calls
+
+def test_cached_credentials_refetch_after_ttl(clock):
+    fetch, calls = _rotating_secret(["one", "two"])
+    credentials = CachedCredentials(fetch, ttl=60, clock=clock)
+
+    assert credentials.get()["password"] == "one"
+    clock.now = 59
+    assert credentials.get()["password"] == "one"
+    clock.now = 60
+    assert credentials.get()["password"] == "two"
+    assert len(calls) == 2
+
+def test_connect_refreshes_credentials_once_on_auth_failure():
+    fetch, calls = _rotating_secret(["stale", "rotated"])
+    credentials = CachedCredentials(fetch)
+    dialect = FakeDialect(valid_password="rotated")
+
+    assert connect_with_credentials(credentials, dialect, (), {}) == "connection"
+    assert dialect.attempts == ["stale", "rotated"]
+    assert connect_with_credentials(credentials, dialect, (), {}) == "connection"
+    assert len(calls) == 2
+
+def test_connect_gives_up_after_one_refresh():
+    credentials = CachedCredentials(lambda: {"username": "app", "password": "wrong"})
+    dialect = FakeDialect(valid_password="right")
+    with pytest.raises(AuthError):
+        connect_with_credentials(credentials, dialect, (), {})
+    assert len(dialect.attempts) == 2
+
+def test_credentials_from_file_and_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("TESTING", "0")
+    path = tmp_path / "db.json"
+    path.write_text(json.dumps({"username": "file_user", "password": "file_pass"}))
+    monkeypatch.setenv("DB_CREDENTIALS_FILE", str(path))
+    assert credentials_from_env().get() == {"username": "file_user", "password": "file_pass"}
+
+    monkeypatch.delenv("DB_CREDENTIALS_FILE")
+    monkeypatch.setenv("DB_USERNAME", "env_user")
+    monkeypatch.setenv("DB_PASSWORD", "env_pass")
+    assert credentials_from_env().get() == {"username": "env_user", "password": "env_pass"}
+
+def test_secrets_manager_is_not_touched_until_first_use(monkeypatch):
+    monkeypatch.setenv("TESTING", "0")
+    for name in ("DB_CREDENTIALS_FILE", "DB_USERNAME", "DB_SECRET_NAME"):
+        monkeypatch.delenv(name, raising=False)
+    credentials = credentials_from_env()
+    with pytest.raises(ValueError, match="DB_SECRET_NAME"):
+        credentials.get()
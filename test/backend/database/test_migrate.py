@@ -0,0 +1,126 @@
+import pytest
+from sqlalchemy import text
+from src.backend.database.configure import Base
+from src.backend.crud.records import get_personal_records
+from src.backend.crud.workout import calculate_num_workouts_by_type, create_workout
+from src.backend.database.migrate import discover_migrations, get_applied_versions, migrate
+from src.backend.schemas.workout import WorkoutCreateSimple
+
+INDEXES = {
+    "workouts": {"ix_workouts_user_created", "ix_workouts_user_type_created"},
+    "logged_exercises": {"ix_logged_exercises_workout_id", "ix_logged_exercises_exercise_workout"},
+    "logged_exercise_sets": {"ix_logged_exercise_sets_logged_exercise_id"},
+    "exercises": {"ix_exercises_name_lower"},
+}
+
+def _index_names(engine, table_name):
+    with engine.connect() as connection:
+        return set(connection.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :table"),
+            {"table": table_name}
+        ).scalars())
+
+def test_migrate_adds_indexes_to_legacy_schema(db):
+    engine = db.get_bind()
+    with engine.begin() as connection:
+        for names in INDEXES.values():
+            for name in names:
+                connection.execute(text(f"DROP INDEX {name}"))
+
+    applied = migrate(engine)
+
+    assert applied == [version for version, _ in discover_migrations()]
+    for table_name, names in INDEXES.items():
+        assert names <= _index_names(engine, table_name)
+
+def test_migrate_is_idempotent(db):
+    engine = db.get_bind()
+    migrate(engine)
+
+    assert migrate(engine) == []
+    assert get_applied_versions(engine) == {version for version, _ in discover_migrations()}
+
+def test_migrate_backfills_workout_rollups(db, test_user, test_exercise, make_logged_exercise):
+    for _ in range(2):
+        create_workout(db, WorkoutCreateSimple(
+            username=test_user.username,
+            workout_type="Pull",
+            logged_exercises=[make_logged_exercise("Deadlift", [(5, 100.0)])]
+        ))
+    db.close()
+    engine = db.get_bind()
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE workout_rollups"))
+
+    migrate(engine)
+
+    assert calculate_num_workouts_by_type(test_user.username, "Pull", db) == 2
+
+def test_migrate_backfills_personal_records(db, test_user, test_exercise, make_workout):
+    make_workout(test_user.username, [(5, 100.0), (5, 110.0), (1, 140.0)])
+    make_workout(test_user.username, [(5, 105.0), (0, 200.0)])
+    db.close()
+    engine = db.get_bind()
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE personal_records"))
+
+    migrate(engine)
+
+    records = get_personal_records(test_user.username, db)
+    assert [(r["reps"], r["weight"], r["estimated_1rm"]) for r in records] == [
+        (1, 140.0, 140.0), (5, 110.0, pytest.approx(110.0 * (1 + 5 / 30))),
+    ]
+
+def test_migrate_adds_user_write_version(db, test_user):
+    engine = db.get_bind()
+    db.close()
+    with engine.begin() as connection:
+        connection.execute(text("ALTER TABLE users DROP COLUMN write_version"))
+
+    migrate(engine)
+
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT write_version FROM users")).scalars().all() == [0]
+
+def test_latest_workout_lookup_uses_composite_index(db):
+    engine = db.get_bind()
+    with engine.connect() as connection:
+        plan = connection.execute(text(
+            "EXPLAIN QUERY PLAN SELECT * FROM workouts WHERE user_id = :user_id "
+            "ORDER BY created_time DESC LIMIT 1"
+        ), {"user_id": "0" * 32}).all()
+
+    details = " ".join(row[-1] for row in plan)
+    assert "ix_workouts_user_created" in details
+    assert "TEMP B-TREE" not in details
+
+def test_latest_workout_by_type_lookup_uses_composite_index(db):
+    engine = db.get_bind()
+    with engine.connect() as connection:
+        plan = connection.execute(text(
+            "EXPLAIN QUERY PLAN SELECT * FROM workouts WHERE user_id = :user_id AND workout_type = 'PUSH' "
+            "ORDER BY created_time DESC LIMIT 1"
+        ), {"user_id": "0" * 32}).all()
+
+    details = " ".join(row[-1] for row in plan)
+    assert "ix_workouts_user_type_created" in details
+    assert "TEMP B-TREE" not in details
+
+def test_case_insensitive_exercise_lookup_uses_name_index(db):
+    engine = db.get_bind()
+    with engine.connect() as connection:
+        plan = connection.execute(text(
+            "EXPLAIN QUERY PLAN SELECT id FROM exercises WHERE lower(name) = :name"
+        ), {"name": "squat"}).all()
+
+    assert "ix_exercises_name_lower" in " ".join(row[-1] for row in plan)
+
+def test_exercise_history_lookup_uses_exercise_index(db):
+    engine = db.get_bind()
+    with engine.connect() as connection:
+        plan = connection.execute(text(
+            "EXPLAIN QUERY PLAN SELECT workout_id FROM logged_exercises WHERE exercise_id = :exercise_id"
+        ), {"exercise_id": "0" * 32}).all()
+
+    details = " ".join(row[-1] for row in plan)
+    assert "ix_logged_exercises_exercise_workout" in details
@@ -0,0 +1,48 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from src.backend.database import pool as db_pool
+from src.backend.database.configure import THREAD_POOL_SIZE
+from src.backend.database.pool import TimedQueuePool, pool_stats, register_pool
+
+@pytest.fixture
+def small_engine(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_pool, "_registry", {})
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}", poolclass=TimedQueuePool,
+        pool_size=1, max_overflow=1, pool_timeout=0.05
+    )
+    register_pool("test", engine)
+    yield engine
+    engine.dispose()
+
+def test_pool_stats_track_checkouts_overflow_and_timeouts(small_engine):
+    first = small_engine.connect()
+    second = small_engine.connect()
+    stats = pool_stats()["test"]
+    assert (stats["checked_out"], stats["overflow"], stats["checkouts"]) == (2, 1, 2)
+
+    with pytest.raises(PoolTimeoutError):
+        small_engine.connect()
+    stats = pool_stats()["test"]
+    assert stats["timeouts"] == 1
+    assert stats["waiting"] == 0
+    assert stats["wait_seconds_max"] >= 0.05
+
+    first.close()
+    second.close()
+    assert pool_stats()["test"]["checked_out"] == 0
+
+def test_pool_counters_survive_dispose(small_engine):
+    small_engine.connect().close()
+    small_engine.dispose()
+    small_engine.connect().close()
+    assert pool_stats()["test"]["checkouts"] == 2
+
+def test_pool_metrics_endpoint(client):
+    res = client.get("/api/metrics/pool")
+    assert res.status_code == 200
+    body = res.json()
+    assert {"size", "checked_out", "overflow", "wait_seconds_avg"} <= set(body["pools"]["primary"])
+    # AnyIO's default limiter is left alone unless THREAD_POOL_SIZE is set.
+    assert body["threads"]["total"] == (THREAD_POOL_SIZE or 40)
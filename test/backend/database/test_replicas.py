@@ -0,0 +1,129 @@
+import shutil
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src.backend.cache.exercise_catalog import exercise_catalog
+from src.backend.database import replicas
+from src.backend.database.configure import Base, get_db
+from src.backend.database.replicas import READ_PRIMARY_COOKIE, ReadYourWritesMiddleware, ReplicaRouter
+from src.backend.main import include_routers
+from src.backend.models.exercise import Exercise
+
+@pytest.fixture
+def sqlite_engine(tmp_path):
+    engines = []
+    def _create(name):
+        engine = create_engine(f"sqlite:///{tmp_path / name}", connect_args={"check_same_thread": False})
+        engines.append(engine)
+        return engine
+    yield _create
+    for engine in engines:
+        engine.dispose()
+
+def test_round_robin_over_healthy_replicas(sqlite_engine, clock):
+    primary, first, second = sqlite_engine("primary.db"), sqlite_engine("a.db"), sqlite_engine("b.db")
+    router = ReplicaRouter(primary, [first, second], clock=clock)
+    router.check_all()
+    assert [router.engine_for() for _ in range(4)] == [first, second, first, second]
+    assert ReplicaRouter(primary).engine_for() is primary
+    # Nothing is routed to a replica before its first health check passes.
+    assert ReplicaRouter(primary, [first], clock=clock).engine_for() is primary
+
+def test_unhealthy_replicas_are_skipped_until_they_pass_a_check(sqlite_engine, tmp_path, clock):
+    primary, healthy = sqlite_engine("primary.db"), sqlite_engine("replica.db")
+    broken = sqlite_engine("missing/replica.db")
+    router = ReplicaRouter(primary, [broken, healthy], clock=clock)
+    router.check_all()
+    assert {router.engine_for() for _ in range(4)} == {healthy}
+    assert router.stats() == {"replicas": 2, "healthy": 1}
+
+    (tmp_path / "missing").mkdir()
+    # Routing only reads the last result; the replica comes back with the next check.
+    assert {router.engine_for() for _ in range(4)} == {healthy}
+    router.check_all()
+    assert {router.engine_for() for _ in range(4)} == {broken, healthy}
+
+def test_background_checker_marks_replicas_healthy(sqlite_engine, clock):
+    primary, replica = sqlite_engine("primary.db"), sqlite_engine("replica.db")
+    router = ReplicaRouter(primary, [replica], health_interval=0.01, clock=clock)
+    router.start_health_checks()
+    try:
+        router._checker.join(timeout=0.2)
+        assert router.engine_for() is replica
+    finally:
+        router.stop_health_checks()
+    assert router._checker is None
+
+def test_pinned_clients_read_from_the_primary(sqlite_engine, clock):
+    primary, replica = sqlite_engine("primary.db"), sqlite_engine("replica.db")
+    router = ReplicaRouter(primary, [replica], read_your_writes=5, clock=clock)
+    router.check_all()
+    until = router.pin_until()
+    assert router.engine_for(until) is primary
+    assert router.engine_for() is replica
+    clock.now = 5
+    assert router.engine_for(until) is replica
+    # A value beyond one window was not issued by the router and does not pin.
+    assert router.engine_for(clock.now + 60) is replica
+
+def test_catalog_loads_from_the_primary(sqlite_engine, clock, monkeypatch):
+    primary, replica = sqlite_engine("primary.db"), sqlite_engine("replica.db")
+    for engine in (primary, replica):
+        Base.metadata.create_all(bind=engine)
+    router = ReplicaRouter(primary, [replica], clock=clock)
+    router.check_all()
+    monkeypatch.setattr(replicas, "read_router", router)
+    with sessionmaker(bind=primary)() as db:
+        db.add(Exercise(name="Squat", primary_muscles=["quads"], category="Quads"))
+        db.commit()
+
+    with replicas.read_session() as db:
+        assert db.get_bind() is replica
+        exercise_catalog.refresh(db)
+        squat = exercise_catalog.get_by_name(db, "squat")
+        assert squat is not None
+        assert exercise_catalog.get_by_id(db, squat.id) is squat
+
+def test_writers_read_their_writes_by_id(sqlite_engine, tmp_path, clock, monkeypatch):
+    primary, replica = sqlite_engine("primary.db"), sqlite_engine("replica.db")
+    for engine in (primary, replica):
+        Base.metadata.create_all(bind=engine)
+    router = ReplicaRouter(primary, [replica], read_your_writes=5, clock=clock)
+    router.check_all()
+    monkeypatch.setattr(replicas, "read_router", router)
+    PrimarySession = sessionmaker(autocommit=False, autoflush=False, bind=primary)
+
+    def override_get_db():
+        db = PrimarySession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    include_routers(app, async_db=False)
+    app.add_middleware(ReadYourWritesMiddleware)
+    app.dependency_overrides[get_db] = override_get_db
+    client = TestClient(app)
+
+    client.post("/api/users/", json={"email": "rep@example.com", "username": "rep"})
+    client.post("/api/exercises/", json={"name": "Squat", "primary_muscles": ["quads"], "category": "Quads"})
+    created = client.post("/api/workouts/", json={
+        "username": "rep",
+        "logged_exercises": [{"name": "Squat", "sets": [{"set_number": 1, "reps": 5, "weight": 100.0}]}]
+    })
+    assert created.status_code == 201
+    assert READ_PRIMARY_COOKIE in client.cookies
+    workout_url = f"/api/workouts/{created.json()['id']}"
+
+    # The writer reads its own workout from the primary; the replica has not caught up.
+    assert client.get(workout_url).status_code == 200
+    assert TestClient(app).get(workout_url).status_code == 404
+    clock.now = 5
+    assert client.get(workout_url).status_code == 404
+
+    replica.dispose()
+    shutil.copyfile(tmp_path / "primary.db", tmp_path / "replica.db")
+    assert client.get(workout_url).json()["id"] == created.json()["id"]
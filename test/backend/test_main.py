@@ -1,4 +1,5 @@
 import pytest
+from src.backend.scripts.profile_imports import profile_import
 
 # --- Smoke Tests ---
 
@@ -41,4 +42,16 @@ def test_get_items_authenticated(client, auth_headers):
     headers = auth_headers()
     response = client.get("/users/me/items/", headers=headers)
     assert response.status_code == 200
-    assert response.json()[0]["owner"] == "kaush"
\ No newline at end of file
+    assert response.json()[0]["owner"] == "kaush"
+
+# --- Startup Tests ---
+
+def test_startup_does_not_import_lazy_dependencies():
+    # Checks which modules a cold import loads rather than timing it, so it cannot flake on a busy
+    # runner; scripts/profile_imports.py reports the timings.
+    profile = profile_import("src.backend.main")
+    assert profile.eager == [], f"imported at startup instead of on first use: {profile.eager}"
+
+def test_cors_exposes_the_read_your_writes_header(client):
+    response = client.get("/api", headers={"Origin": "https://triance.app"})
+    assert "x-read-primary-until" in response.headers["access-control-expose-headers"]
@@ -0,0 +1,47 @@
+import subprocess
+import boto3
+import pytest
+import requests
+from sqlalchemy import create_engine, event
+from streamlit.testing.v1 import AppTest
+from src.backend.database import replicas
+from src.backend.database.configure import Base
+from src.backend.database.replicas import ReplicaRouter
+
+class FakeCloudWatch:
+    def get_metric_statistics(self, Statistics, **kwargs):
+        return {"Datapoints": [{Statistics[0]: 1024.0 ** 3}]}
+
+def _unreachable(*args, **kwargs):
+    raise requests.ConnectionError("no network in tests")
+
+@pytest.fixture
+def replica_router(tmp_path, monkeypatch):
+    primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}", connect_args={"check_same_thread": False})
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}", connect_args={"check_same_thread": False})
+    for engine in (primary, replica):
+        Base.metadata.create_all(bind=engine)
+    router = ReplicaRouter(primary, [replica])
+    monkeypatch.setattr(replicas, "read_router", router)
+    yield router
+    router.stop_health_checks()
+    primary.dispose()
+    replica.dispose()
+
+def test_dashboard_reads_from_a_replica_on_its_first_run(replica_router, monkeypatch):
+    monkeypatch.setattr(boto3, "client", lambda *args, **kwargs: FakeCloudWatch())
+    monkeypatch.setattr(requests, "get", _unreachable)
+    monkeypatch.setattr(subprocess, "getoutput", lambda command: "")
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    primary, replica = replica_router.primary, replica_router.replicas[0]
+    queried = []
+    for engine in (primary, replica):
+        event.listen(engine, "before_cursor_execute", lambda conn, *args, engine=engine: queried.append(engine))
+
+    at = AppTest.from_file("../../src/dashboard/app.py", default_timeout=30).run()
+
+    assert not at.exception
+    assert replica_router._checker is not None
+    # Table metrics came from the replica; the primary was never queried.
+    assert replica in queried
+    assert primary not in queried